@@ -27,7 +27,7 @@ from app.core.config import settings
 from app.models import (
     User, Hospital, Outbreak, Prediction, Alert, 
     ChatbotConversation, AnonymousSymptomReport, DiseaseInfo,
-    DoctorOutbreak, DoctorAlert, Broadcast, NotificationPreference
+    DoctorOutbreak, DoctorAlert, DoctorOutbreakAggregate, Broadcast, NotificationPreference
 )
 
 # add your model's MetaData object here
@@ -0,0 +1,54 @@
+"""Outbreak daily rollup
+
+Revision ID: a7d3e9b1c5f8
+Revises: f2b8d4e6a0c3
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d3e9b1c5f8'
+down_revision: Union[str, Sequence[str], None] = 'f2b8d4e6a0c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('outbreak_daily_rollup',
+    sa.Column('day', sa.String(length=10), nullable=False),
+    sa.Column('disease_type', sa.String(length=100), nullable=False),
+    sa.Column('state', sa.String(length=100), nullable=False),
+    sa.Column('severity', sa.String(length=50), nullable=False),
+    sa.Column('outbreak_count', sa.Integer(), nullable=False),
+    sa.Column('case_count', sa.Integer(), nullable=False),
+    sa.Column('verified_count', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.PrimaryKeyConstraint('day', 'disease_type', 'state', 'severity')
+    )
+    # Backfill from the outbreaks already present
+    op.execute("""
+        INSERT INTO outbreak_daily_rollup
+            (day, disease_type, state, severity, outbreak_count, case_count, verified_count)
+        SELECT
+            COALESCE(CAST(date(outbreaks.date_reported) AS VARCHAR(10)), ''),
+            outbreaks.disease_type,
+            COALESCE(hospitals.state, ''),
+            COALESCE(outbreaks.severity, ''),
+            COUNT(*),
+            COALESCE(SUM(outbreaks.patient_count), 0),
+            COALESCE(SUM(CASE WHEN outbreaks.verified THEN 1 ELSE 0 END), 0)
+        FROM outbreaks
+        LEFT OUTER JOIN hospitals ON outbreaks.hospital_id = hospitals.id
+        GROUP BY 1, 2, 3, 4
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('outbreak_daily_rollup')
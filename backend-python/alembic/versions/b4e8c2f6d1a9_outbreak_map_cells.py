@@ -0,0 +1,44 @@
+"""Outbreak map grid
+
+Revision ID: b4e8c2f6d1a9
+Revises: a7d3e9b1c5f8
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4e8c2f6d1a9'
+down_revision: Union[str, Sequence[str], None] = 'a7d3e9b1c5f8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Filled by rebuild_map_grid (server startup / rebuild_rollup.py): the
+    # Mercator binning is done in Python, not in SQL
+    op.create_table('outbreak_map_cells',
+    sa.Column('zoom', sa.Integer(), nullable=False),
+    sa.Column('x', sa.Integer(), nullable=False),
+    sa.Column('y', sa.Integer(), nullable=False),
+    sa.Column('day', sa.String(length=10), nullable=False),
+    sa.Column('disease_type', sa.String(length=100), nullable=False),
+    sa.Column('outbreak_count', sa.Integer(), nullable=False),
+    sa.Column('case_count', sa.Integer(), nullable=False),
+    sa.Column('severe_count', sa.Integer(), nullable=False),
+    sa.Column('moderate_count', sa.Integer(), nullable=False),
+    sa.Column('mild_count', sa.Integer(), nullable=False),
+    sa.Column('latitude_sum', sa.Float(), nullable=False),
+    sa.Column('longitude_sum', sa.Float(), nullable=False),
+    sa.PrimaryKeyConstraint('zoom', 'x', 'y', 'day', 'disease_type')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('outbreak_map_cells')
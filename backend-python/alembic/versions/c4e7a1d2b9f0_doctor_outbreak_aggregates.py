@@ -0,0 +1,52 @@
+"""Doctor outbreak aggregates
+
+Revision ID: c4e7a1d2b9f0
+Revises: b1de669813f4
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e7a1d2b9f0'
+down_revision: Union[str, Sequence[str], None] = 'b1de669813f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('doctor_outbreak_aggregates',
+    sa.Column('disease_type', sa.String(length=100), nullable=False),
+    sa.Column('state', sa.String(length=100), nullable=False),
+    sa.Column('severity', sa.String(length=50), nullable=False),
+    sa.Column('outbreak_count', sa.Integer(), nullable=False),
+    sa.Column('total_cases', sa.Integer(), nullable=False),
+    sa.Column('severity_sum', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.PrimaryKeyConstraint('disease_type', 'state', 'severity')
+    )
+    # Backfill from the approved submissions already present
+    op.execute("""
+        INSERT INTO doctor_outbreak_aggregates
+            (disease_type, state, severity, outbreak_count, total_cases, severity_sum)
+        SELECT
+            COALESCE(NULLIF(disease_type, ''), 'Other'),
+            COALESCE(NULLIF(state, ''), 'Unknown'),
+            COALESCE(NULLIF(severity, ''), 'unknown'),
+            COUNT(*),
+            COALESCE(SUM(patient_count), 0),
+            SUM(CASE severity WHEN 'mild' THEN 1 WHEN 'moderate' THEN 2 WHEN 'severe' THEN 3 ELSE 2 END)
+        FROM doctor_outbreaks
+        WHERE status = 'approved'
+        GROUP BY 1, 2, 3
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('doctor_outbreak_aggregates')
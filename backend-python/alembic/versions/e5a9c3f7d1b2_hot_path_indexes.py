@@ -0,0 +1,43 @@
+"""Hot path indexes
+
+Revision ID: e5a9c3f7d1b2
+Revises: c4e7a1d2b9f0
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a9c3f7d1b2'
+down_revision: Union[str, Sequence[str], None] = 'c4e7a1d2b9f0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, columns); the models' __table_args__ declare the same set
+# and checked by test_query_plans.py. The app also creates any of these that
+# are missing at startup, hence if_not_exists.
+INDEXES = [
+    ('ix_outbreaks_date_reported', 'outbreaks', ['date_reported']),
+    ('ix_outbreaks_hospital_id', 'outbreaks', ['hospital_id']),
+    ('ix_doctor_outbreaks_status_created_at', 'doctor_outbreaks', ['status', 'created_at']),
+    ('ix_alerts_type_zone_sent_at', 'alerts', ['alert_type', 'zone_name', 'sent_at']),
+    ('ix_hospitals_state', 'hospitals', ['state']),
+    ('ix_hospitals_city', 'hospitals', ['city']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, unique=False, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, _columns in reversed(INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
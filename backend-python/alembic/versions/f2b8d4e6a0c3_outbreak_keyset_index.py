@@ -0,0 +1,44 @@
+"""Outbreak keyset index
+
+Revision ID: f2b8d4e6a0c3
+Revises: e5a9c3f7d1b2
+Create Date: 2026-10-16 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2b8d4e6a0c3'
+down_revision: Union[str, Sequence[str], None] = 'e5a9c3f7d1b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (date_reported, id) backs cursor pagination of /outbreaks and also serves
+# every date_reported filter, so it replaces the single-column index.
+INDEXES = [
+    ('ix_outbreaks_date_reported_id', 'outbreaks', ['date_reported', 'id']),
+]
+REPLACED = [
+    ('ix_outbreaks_date_reported', 'outbreaks', ['date_reported']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, unique=False, if_not_exists=True)
+    for name, table, _columns in REPLACED:
+        op.drop_index(name, table_name=table, if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, columns in REPLACED:
+        op.create_index(name, table, columns, unique=False, if_not_exists=True)
+    for name, table, _columns in INDEXES:
+        op.drop_index(name, table_name=table, if_exists=True)
@@ -11,6 +11,7 @@ from app.api.v1 import notifications  # Email notifications
 from app.api.v1 import websocket # WebSocket
 from app.api.v1 import hospitals  # Hospitals API
 from app.api.v1 import broadcasts  # Health Broadcasts
+from app.api.v1 import tiles  # Map tiles
 
 # ...
 
@@ -54,6 +55,9 @@ api_router.include_router(hospitals.router)
 # Health Broadcasts
 api_router.include_router(broadcasts.router)
 
+# Map tiles (outbreaks / hospitals)
+api_router.include_router(tiles.router)
+
 # Admin Operations (Seeding/User Creation)
 from app.api.v1 import admin_ops
 api_router.include_router(admin_ops.router)
@@ -12,8 +12,14 @@ from app.core.database import get_db
 from app.models.outbreak import Hospital, Outbreak
 from app.models.user import User
 from app.core.security import get_password_hash
+from app.core.serialization import ORJSONRoute
+from app.services.outbreak_rollup import record_outbreaks
+from app.services.outbreak_map_grid import index_outbreaks
+from app.services.map_tiles import clear_tiles
+from app.core.data_version import bump_data_versions
+from app.core.cache import invalidate_tags, TAG_OUTBREAKS, TAG_HOSPITALS
 
-router = APIRouter(prefix="/admin", tags=["Admin"])
+router = APIRouter(prefix="/admin", tags=["Admin"], route_class=ORJSONRoute)
 
 
 @router.post("/initialize-demo-data")
@@ -56,6 +62,7 @@ async def initialize_demo_data(db: AsyncSession = Depends(get_db)):
     ]
     
     added_outbreaks = []
+    outbreak_ids = []
     
     for data in test_data:
         # Create hospital
@@ -99,6 +106,8 @@ async def initialize_demo_data(db: AsyncSession = Depends(get_db)):
             location=f"POINT({data['lng']} {data['lat']})"
         )
         db.add(outbreak)
+        await db.flush()
+        outbreak_ids.append(outbreak.id)
         added_outbreaks.append({
             "hospital": data["name"],
             "disease": data["disease"],
@@ -106,7 +115,12 @@ async def initialize_demo_data(db: AsyncSession = Depends(get_db)):
             "severity": data["severity"]
         })
     
+    await record_outbreaks(db, outbreak_ids)
+    await index_outbreaks(db, outbreak_ids)
     await db.commit()
+    await clear_tiles()
+    await bump_data_versions("outbreaks", "hospitals")
+    await invalidate_tags(TAG_OUTBREAKS, TAG_HOSPITALS)
     
     return {
         "message": "Demo data initialized successfully",
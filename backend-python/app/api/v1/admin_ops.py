@@ -17,8 +17,9 @@ from app.core.database import AsyncSessionLocal
 from app.models.user import User
 from app.core.security import get_password_hash
 from sqlalchemy import select
+from app.core.serialization import ORJSONRoute
 
-router = APIRouter(prefix="/admin-ops", tags=["Admin Operations"])
+router = APIRouter(prefix="/admin-ops", tags=["Admin Operations"], route_class=ORJSONRoute)
 
 class UserCreate(BaseModel):
     email: str
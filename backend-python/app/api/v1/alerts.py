@@ -14,9 +14,10 @@ from app.models.outbreak import Alert, Prediction
 from app.models.user import User
 from app.api.v1.auth import get_current_user
 from app.services.alert_service import AlertService
+from app.core.serialization import ORJSONRoute
 
 
-router = APIRouter(prefix="/alerts", tags=["Alerts"])
+router = APIRouter(prefix="/alerts", tags=["Alerts"], route_class=ORJSONRoute)
 
 
 class SendAlertRequest(BaseModel):
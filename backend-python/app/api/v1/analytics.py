@@ -1,25 +1,23 @@
 """
 Analytics API - Enhanced data endpoints for charts and trends
+Outbreak charts read outbreak_daily_rollup (see app/services/outbreak_rollup.py),
+so their cost follows the number of days and categories, not of outbreaks.
 """
 
 from fastapi import APIRouter
 from datetime import datetime, timezone, timedelta
-import sqlite3
 import os
 from collections import defaultdict
 
-router = APIRouter(prefix="/analytics", tags=["Analytics"])
+from app.core.db_access import fetch_all, fetch_one
+from app.core.serialization import ORJSONRoute
+from app.core.cache import conditional_get
 
-
-def get_db_connection():
-    """Get SQLite database connection"""
-    from app.core.config import get_sqlite_db_path
-    conn = sqlite3.connect(get_sqlite_db_path())
-    conn.row_factory = sqlite3.Row
-    return conn
+router = APIRouter(prefix="/analytics", tags=["Analytics"], route_class=ORJSONRoute)
 
 
 @router.get("/activity-feed")
+@conditional_get("doctor_outbreaks", "doctor_alerts")
 async def get_activity_feed():
     """
     Get recent activity for dashboard feed
@@ -28,18 +26,15 @@ async def get_activity_feed():
     activities = []
     
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
         # Get recent outbreaks (last 10)
-        cursor.execute('''
+        rows = await fetch_all('''
             SELECT id, disease_type, location_name, city, state, severity, status, created_at
             FROM doctor_outbreaks
             ORDER BY created_at DESC
             LIMIT 10
         ''')
         
-        for row in cursor.fetchall():
+        for row in rows:
             status = row['status'] or 'pending'
             if status == 'approved':
                 action = "Outbreak approved"
@@ -68,14 +63,14 @@ async def get_activity_feed():
             })
         
         # Get recent alerts
-        cursor.execute('''
+        rows = await fetch_all('''
             SELECT id, alert_type, title, affected_area, status, created_at
             FROM doctor_alerts
             ORDER BY created_at DESC
             LIMIT 5
         ''')
         
-        for row in cursor.fetchall():
+        for row in rows:
             activities.append({
                 "id": f"alert_{row['id']}",
                 "type": "alert",
@@ -88,8 +83,6 @@ async def get_activity_feed():
                 "time": row['created_at']
             })
         
-        conn.close()
-        
         # Sort by time and limit
         activities.sort(key=lambda x: x['time'] or '', reverse=True)
         
@@ -103,27 +96,25 @@ async def get_activity_feed():
 
 
 @router.get("/trend-data")
+@conditional_get("outbreaks")
 async def get_trend_data():
     """
     Get outbreak trend data for line chart
     Groups by day for the last 30 days
     """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        # Get all outbreaks with dates
-        cursor.execute('''
-            SELECT date(date_reported) as date, COUNT(*) as count, SUM(patient_count) as cases
-            FROM outbreaks
-            WHERE date_reported IS NOT NULL
-            GROUP BY date(date_reported)
-            ORDER BY date DESC
+        # Days with outbreaks, newest first
+        rows = await fetch_all('''
+            SELECT day as date, SUM(outbreak_count) as count, SUM(case_count) as cases
+            FROM outbreak_daily_rollup
+            WHERE day != ''
+            GROUP BY day
+            ORDER BY day DESC
             LIMIT 30
         ''')
         
         trends = []
-        for row in cursor.fetchall():
+        for row in rows:
             if row['date']:
                 trends.append({
                     "date": row['date'],
@@ -131,8 +122,6 @@ async def get_trend_data():
                     "cases": row['cases'] or 0
                 })
         
-        conn.close()
-        
         # Reverse to show oldest first
         trends.reverse()
         
@@ -145,17 +134,15 @@ async def get_trend_data():
 
 
 @router.get("/disease-distribution")
+@conditional_get("outbreaks")
 async def get_disease_distribution():
     """
     Get disease distribution for pie chart
     """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT disease_type, COUNT(*) as count, SUM(patient_count) as cases
-            FROM outbreaks
+        rows = await fetch_all('''
+            SELECT disease_type, SUM(outbreak_count) as count, SUM(case_count) as cases
+            FROM outbreak_daily_rollup
             GROUP BY disease_type
             ORDER BY count DESC
         ''')
@@ -163,7 +150,7 @@ async def get_disease_distribution():
         distribution = []
         colors = ['#ef4444', '#f97316', '#eab308', '#22c55e', '#3b82f6', '#8b5cf6', '#ec4899']
         
-        for i, row in enumerate(cursor.fetchall()):
+        for i, row in enumerate(rows):
             distribution.append({
                 "name": row['disease_type'],
                 "value": row['count'],
@@ -171,25 +158,21 @@ async def get_disease_distribution():
                 "color": colors[i % len(colors)]
             })
         
-        conn.close()
-        
         return {"distribution": distribution}
     except Exception as e:
         return {"distribution": [], "error": str(e)}
 
 
 @router.get("/severity-breakdown")
+@conditional_get("outbreaks")
 async def get_severity_breakdown():
     """
     Get severity breakdown for bar chart
     """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT severity, COUNT(*) as count, SUM(patient_count) as cases
-            FROM outbreaks
+        rows = await fetch_all('''
+            SELECT NULLIF(severity, '') as severity, SUM(outbreak_count) as count, SUM(case_count) as cases
+            FROM outbreak_daily_rollup
             GROUP BY severity
         ''')
         
@@ -201,7 +184,7 @@ async def get_severity_breakdown():
         }
         
         breakdown = []
-        for row in cursor.fetchall():
+        for row in rows:
             breakdown.append({
                 "severity": row['severity'],
                 "outbreaks": row['count'],
@@ -209,34 +192,29 @@ async def get_severity_breakdown():
                 "color": severity_colors.get(row['severity'], '#6b7280')
             })
         
-        conn.close()
-        
         return {"breakdown": breakdown}
     except Exception as e:
         return {"breakdown": [], "error": str(e)}
 
 
 @router.get("/regional-stats")
+@conditional_get("outbreaks", "hospitals")
 async def get_regional_stats():
     """
     Get regional statistics for map legend and comparison
     """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT state, COUNT(*) as outbreaks, SUM(patient_count) as cases,
-                   COUNT(CASE WHEN severity = 'severe' THEN 1 END) as severe_count
-            FROM outbreaks
-            JOIN hospitals ON outbreaks.hospital_id = hospitals.id
-            WHERE state IS NOT NULL
+        rows = await fetch_all('''
+            SELECT state, SUM(outbreak_count) as outbreaks, SUM(case_count) as cases,
+                   SUM(CASE WHEN severity = 'severe' THEN outbreak_count END) as severe_count
+            FROM outbreak_daily_rollup
+            WHERE state != ''
             GROUP BY state
             ORDER BY outbreaks DESC
         ''')
         
         regions = []
-        for row in cursor.fetchall():
+        for row in rows:
             # Calculate risk level
             severe_ratio = (row['severe_count'] or 0) / max(row['outbreaks'], 1)
             risk_level = 'high' if severe_ratio > 0.3 else 'medium' if severe_ratio > 0.1 else 'low'
@@ -249,44 +227,36 @@ async def get_regional_stats():
                 "risk_level": risk_level
             })
         
-        conn.close()
-        
         return {"regions": regions}
     except Exception as e:
         return {"regions": [], "error": str(e)}
 
 
 @router.get("/week-comparison")
+@conditional_get("outbreaks", daily=True)
 async def get_week_comparison():
     """
     Compare this week vs last week stats
+    Weeks are whole days: the last 7 days including today, and the 7 before
     """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        now = datetime.now(timezone.utc)
-        this_week_start = (now - timedelta(days=7)).isoformat()
-        last_week_start = (now - timedelta(days=14)).isoformat()
-        last_week_end = (now - timedelta(days=7)).isoformat()
+        today = datetime.now(timezone.utc).date()
+        this_week_start = (today - timedelta(days=6)).isoformat()
+        last_week_start = (today - timedelta(days=13)).isoformat()
         
         # This week
-        cursor.execute('''
-            SELECT COUNT(*) as count, COALESCE(SUM(patient_count), 0) as cases
-            FROM outbreaks
-            WHERE date_reported >= ?
+        this_week = await fetch_one('''
+            SELECT COALESCE(SUM(outbreak_count), 0) as count, COALESCE(SUM(case_count), 0) as cases
+            FROM outbreak_daily_rollup
+            WHERE day >= ?
         ''', (this_week_start,))
-        this_week = cursor.fetchone()
         
         # Last week
-        cursor.execute('''
-            SELECT COUNT(*) as count, COALESCE(SUM(patient_count), 0) as cases
-            FROM outbreaks
-            WHERE date_reported >= ? AND date_reported < ?
-        ''', (last_week_start, last_week_end))
-        last_week = cursor.fetchone()
-        
-        conn.close()
+        last_week = await fetch_one('''
+            SELECT COALESCE(SUM(outbreak_count), 0) as count, COALESCE(SUM(case_count), 0) as cases
+            FROM outbreak_daily_rollup
+            WHERE day >= ? AND day < ?
+        ''', (last_week_start, this_week_start))
         
         # Calculate changes
         outbreak_change = this_week['count'] - last_week['count']
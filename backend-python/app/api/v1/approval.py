@@ -14,8 +14,12 @@ from app.api.v1.auth import get_current_user, get_admin_user
 from app.models.user import User
 from app.models.doctor import DoctorOutbreak
 from app.core.audit import log_audit_event
+from app.core.data_version import bump_data_version
+from app.core.cache import invalidate_tags, region_tag, TAG_OUTBREAKS
+from app.services.outbreak_aggregates import apply_status_change
+from app.core.serialization import ORJSONRoute
 
-router = APIRouter(prefix="/admin", tags=["Admin Approval"])
+router = APIRouter(prefix="/admin", tags=["Admin Approval"], route_class=ORJSONRoute)
 
 
 class PendingRequest(BaseModel):
@@ -116,9 +120,13 @@ async def approve_request(
         if outbreak.status == 'rejected':
             raise HTTPException(status_code=400, detail="Request was previously rejected")
         
-        # Update status
+        # Update status (and the disease/state/severity aggregate, same transaction)
+        previous_status = outbreak.status
         outbreak.status = 'approved'
+        await apply_status_change(db, outbreak, previous_status)
         await db.commit()
+        await bump_data_version("doctor_outbreaks")
+        await invalidate_tags(TAG_OUTBREAKS, region_tag(outbreak.state))
         await db.refresh(outbreak)
         
         # AUDIT LOG
@@ -166,9 +174,12 @@ async def reject_request(
         if outbreak.status == 'approved':
             raise HTTPException(status_code=400, detail="Cannot reject already approved request")
         
-        # Update status
+        # Update status (and the disease/state/severity aggregate, same transaction)
+        previous_status = outbreak.status
         outbreak.status = 'rejected'
+        await apply_status_change(db, outbreak, previous_status)
         await db.commit()
+        await bump_data_version("doctor_outbreaks")
         await db.refresh(outbreak)
         
         # AUDIT LOG
@@ -32,8 +32,9 @@ from app.core.security import (
 from app.models.user import User
 from app.core.limiter import limiter
 from app.core.audit import log_audit_event
+from app.core.serialization import ORJSONRoute
 
-router = APIRouter(prefix="/auth", tags=["Authentication"])
+router = APIRouter(prefix="/auth", tags=["Authentication"], route_class=ORJSONRoute)
 
 # OAuth2 scheme
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_PREFIX}/auth/login")
@@ -15,8 +15,11 @@ from app.core.database import get_db
 from app.models.broadcast import Broadcast
 from app.models.user import User
 from app.api.v1.auth import get_current_user, get_admin_user, get_current_user_optional
+from app.core.serialization import ORJSONRoute
+from app.core.cache import invalidate_tags, region_tag, TAG_BROADCASTS
+from app.core.data_version import bump_data_version
 
-router = APIRouter(prefix="/broadcasts", tags=["Broadcasts"])
+router = APIRouter(prefix="/broadcasts", tags=["Broadcasts"], route_class=ORJSONRoute)
 
 
 # =============================================================================
@@ -241,6 +244,8 @@ async def create_broadcast(
     db.add(new_broadcast)
     await db.commit()
     await db.refresh(new_broadcast)
+    await invalidate_tags(TAG_BROADCASTS, region_tag(new_broadcast.region))
+    await bump_data_version("broadcasts")
     
     return BroadcastResponse(
         id=str(new_broadcast.id),
@@ -281,11 +286,14 @@ async def update_broadcast(
     
     # Update fields
     update_data = updates.model_dump(exclude_unset=True)
+    previous_region = broadcast.region
     for field, value in update_data.items():
         setattr(broadcast, field, value)
     
     await db.commit()
     await db.refresh(broadcast)
+    await invalidate_tags(TAG_BROADCASTS, region_tag(previous_region), region_tag(broadcast.region))
+    await bump_data_version("broadcasts")
     
     return BroadcastResponse(
         id=str(broadcast.id),
@@ -329,6 +337,8 @@ async def delete_broadcast(
     
     broadcast.is_active = False
     await db.commit()
+    await invalidate_tags(TAG_BROADCASTS, region_tag(broadcast.region))
+    await bump_data_version("broadcasts")
     
     return {
         "message": "Broadcast archived successfully",
@@ -28,11 +28,13 @@ from app.services.image_upload_service import ImageUploadService
 
 from app.services.pdf_export_service import PDFExportService
 
+from app.core.serialization import ORJSONRoute
 
 
 
 
-router = APIRouter(prefix="/chatbot", tags=["Chatbot"])
+
+router = APIRouter(prefix="/chatbot", tags=["Chatbot"], route_class=ORJSONRoute)
 
 
 
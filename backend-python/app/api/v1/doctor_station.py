@@ -16,10 +16,13 @@ from app.models.doctor import DoctorOutbreak, DoctorAlert, DoctorOutbreak as Doc
 from app.websocket.manager import manager
 from app.utils.sanitizer import sanitize_html
 from app.core.audit import log_audit_event
+from app.core.data_version import bump_data_version
+from app.core.cache import invalidate_tags, region_tag, TAG_OUTBREAKS
 from datetime import datetime, timezone, timedelta
 import json
+from app.core.serialization import ORJSONRoute
 
-router = APIRouter(prefix="/doctor", tags=["Doctor Station"])
+router = APIRouter(prefix="/doctor", tags=["Doctor Station"], route_class=ORJSONRoute)
 
 
 # Pydantic models
@@ -159,6 +162,8 @@ async def submit_outbreak(
         
         db.add(new_outbreak)
         await db.commit()
+        await bump_data_version("doctor_outbreaks")
+        await invalidate_tags(TAG_OUTBREAKS, region_tag(outbreak.state))
         await db.refresh(new_outbreak)
         
         outbreak_id = new_outbreak.id
@@ -239,6 +244,7 @@ async def submit_alert(
         
         db.add(new_alert)
         await db.commit()
+        await bump_data_version("doctor_alerts")
         await db.refresh(new_alert)
         
         alert_id = new_alert.id
@@ -5,20 +5,14 @@ Export API - CSV export for outbreak data
 from fastapi import APIRouter
 from fastapi.responses import Response
 from datetime import datetime, timezone
-import sqlite3
 import os
 import csv
 from io import StringIO
 
-router = APIRouter(prefix="/export", tags=["Export"])
+from app.core.db_access import fetch_all
+from app.core.serialization import ORJSONRoute
 
-
-def get_db_connection():
-    """Get SQLite database connection"""
-    from app.core.config import get_sqlite_db_path
-    conn = sqlite3.connect(get_sqlite_db_path())
-    conn.row_factory = sqlite3.Row
-    return conn
+router = APIRouter(prefix="/export", tags=["Export"], route_class=ORJSONRoute)
 
 
 @router.get("/csv/outbreaks")
@@ -27,10 +21,7 @@ async def export_outbreaks_csv():
     Export approved outbreaks as CSV file
     """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
+        rows = await fetch_all('''
             SELECT 
                 id,
                 disease_type,
@@ -50,9 +41,6 @@ async def export_outbreaks_csv():
             ORDER BY created_at DESC
         ''')
         
-        rows = cursor.fetchall()
-        conn.close()
-        
         # Create CSV
         output = StringIO()
         writer = csv.writer(output)
@@ -103,10 +91,7 @@ async def export_all_csv():
     Admin/authenticated use
     """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
+        rows = await fetch_all('''
             SELECT 
                 id,
                 disease_type,
@@ -125,9 +110,6 @@ async def export_all_csv():
             ORDER BY created_at DESC
         ''')
         
-        rows = cursor.fetchall()
-        conn.close()
-        
         # Create CSV
         output = StringIO()
         writer = csv.writer(output)
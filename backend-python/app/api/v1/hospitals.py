@@ -10,8 +10,10 @@ from typing import List, Optional
 
 from app.core.database import get_db
 from app.models.outbreak import Hospital
+from app.core.serialization import ORJSONRoute
+from app.core.cache import conditional_get
 
-router = APIRouter(prefix="/hospitals", tags=["Hospitals"])
+router = APIRouter(prefix="/hospitals", tags=["Hospitals"], route_class=ORJSONRoute)
 
 
 @router.get("/")
@@ -53,6 +55,7 @@ async def list_hospitals(
 
 
 @router.get("/geojson")
+@conditional_get("hospitals")
 async def get_hospitals_geojson(
     state: Optional[str] = None,
     db: AsyncSession = Depends(get_db)
@@ -8,8 +8,10 @@ import time
 import os
 import psutil
 from datetime import datetime, timezone
+from app.core.serialization import ORJSONRoute
+from app.core.redis import redis_client
 
-router = APIRouter(prefix="/health", tags=["Monitoring"])
+router = APIRouter(prefix="/health", tags=["Monitoring"], route_class=ORJSONRoute)
 
 # Store startup time
 START_TIME = time.time()
@@ -60,6 +62,7 @@ async def system_metrics(current_user: dict = Depends(get_admin_user)):
         "uptime_display": str(timedelta(seconds=int(uptime_seconds))),
         "memory_usage_mb": round(process.memory_info().rss / 1024 / 1024, 2),
         "cpu_percent": process.cpu_percent(),
+        "redis": await redis_client.stats(),
         "timestamp": datetime.now(timezone.utc).isoformat()
     }
 
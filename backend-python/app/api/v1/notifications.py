@@ -9,7 +9,10 @@ from typing import List, Optional
 from datetime import datetime, timezone
 import sqlite3
 
-router = APIRouter(prefix="/notifications", tags=["Notifications"])
+from app.core.db_access import run_in_db
+from app.core.serialization import ORJSONRoute
+
+router = APIRouter(prefix="/notifications", tags=["Notifications"], route_class=ORJSONRoute)
 
 
 class SubscriptionRequest(BaseModel):
@@ -36,19 +39,9 @@ class SubscriptionStatus(BaseModel):
     subscribed_at: Optional[str] = None
 
 
-def get_db_connection():
-    """Get SQLite database connection"""
-    from app.core.config import get_sqlite_db_path
-    conn = sqlite3.connect(get_sqlite_db_path())
-    conn.row_factory = sqlite3.Row
-    return conn
-
-
-def init_subscriptions_table():
+def init_subscriptions_table(conn: sqlite3.Connection):
     """Initialize the subscriptions table"""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute('''
+    conn.execute('''
         CREATE TABLE IF NOT EXISTS email_subscriptions (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             email TEXT UNIQUE NOT NULL,
@@ -61,8 +54,68 @@ def init_subscriptions_table():
             updated_at TEXT
         )
     ''')
-    conn.commit()
-    conn.close()
+
+
+def save_subscription(conn: sqlite3.Connection, request: SubscriptionRequest) -> tuple:
+    """Insert or update a subscription; returns (subscription_id, message)"""
+    init_subscriptions_table(conn)
+    cursor = conn.cursor()
+    
+    now = datetime.now(timezone.utc).isoformat()
+    
+    # Check if email already exists
+    cursor.execute('SELECT id FROM email_subscriptions WHERE email = ?', (request.email,))
+    existing = cursor.fetchone()
+    
+    if existing:
+        # Update existing subscription
+        cursor.execute('''
+            UPDATE email_subscriptions 
+            SET notify_outbreaks = ?, notify_approvals = ?, notify_alerts = ?, 
+                notify_reports = ?, is_active = 1, updated_at = ?
+            WHERE email = ?
+        ''', (
+            1 if request.notify_outbreaks else 0,
+            1 if request.notify_approvals else 0,
+            1 if request.notify_alerts else 0,
+            1 if request.notify_reports else 0,
+            now,
+            request.email
+        ))
+        return existing['id'], "Subscription preferences updated"
+    
+    # Create new subscription
+    cursor.execute('''
+        INSERT INTO email_subscriptions 
+        (email, notify_outbreaks, notify_approvals, notify_alerts, notify_reports, subscribed_at, updated_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    ''', (
+        request.email,
+        1 if request.notify_outbreaks else 0,
+        1 if request.notify_approvals else 0,
+        1 if request.notify_alerts else 0,
+        1 if request.notify_reports else 0,
+        now,
+        now
+    ))
+    return cursor.lastrowid, "Successfully subscribed to notifications"
+
+
+def deactivate_subscription(conn: sqlite3.Connection, email: str) -> int:
+    """Mark a subscription inactive; returns the number of rows updated"""
+    init_subscriptions_table(conn)
+    cursor = conn.execute('''
+        UPDATE email_subscriptions 
+        SET is_active = 0, updated_at = ?
+        WHERE email = ?
+    ''', (datetime.now(timezone.utc).isoformat(), email))
+    return cursor.rowcount
+
+
+def query_subscriptions(conn: sqlite3.Connection, sql: str, params: tuple = ()) -> List[sqlite3.Row]:
+    """Run a read against email_subscriptions, creating the table if needed"""
+    init_subscriptions_table(conn)
+    return conn.execute(sql, params).fetchall()
 
 
 @router.post("/subscribe", response_model=SubscriptionResponse)
@@ -72,53 +125,7 @@ async def subscribe_to_notifications(request: SubscriptionRequest):
     If already subscribed, updates preferences.
     """
     try:
-        init_subscriptions_table()
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        now = datetime.now(timezone.utc).isoformat()
-        
-        # Check if email already exists
-        cursor.execute('SELECT id FROM email_subscriptions WHERE email = ?', (request.email,))
-        existing = cursor.fetchone()
-        
-        if existing:
-            # Update existing subscription
-            cursor.execute('''
-                UPDATE email_subscriptions 
-                SET notify_outbreaks = ?, notify_approvals = ?, notify_alerts = ?, 
-                    notify_reports = ?, is_active = 1, updated_at = ?
-                WHERE email = ?
-            ''', (
-                1 if request.notify_outbreaks else 0,
-                1 if request.notify_approvals else 0,
-                1 if request.notify_alerts else 0,
-                1 if request.notify_reports else 0,
-                now,
-                request.email
-            ))
-            subscription_id = existing['id']
-            message = "Subscription preferences updated"
-        else:
-            # Create new subscription
-            cursor.execute('''
-                INSERT INTO email_subscriptions 
-                (email, notify_outbreaks, notify_approvals, notify_alerts, notify_reports, subscribed_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                request.email,
-                1 if request.notify_outbreaks else 0,
-                1 if request.notify_approvals else 0,
-                1 if request.notify_alerts else 0,
-                1 if request.notify_reports else 0,
-                now,
-                now
-            ))
-            subscription_id = cursor.lastrowid
-            message = "Successfully subscribed to notifications"
-        
-        conn.commit()
-        conn.close()
+        subscription_id, message = await run_in_db(save_subscription, request)
         
         return SubscriptionResponse(
             success=True,
@@ -134,23 +141,11 @@ async def subscribe_to_notifications(request: SubscriptionRequest):
 async def unsubscribe_from_notifications(email: str):
     """Unsubscribe an email from all notifications"""
     try:
-        init_subscriptions_table()
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        updated = await run_in_db(deactivate_subscription, email)
         
-        cursor.execute('''
-            UPDATE email_subscriptions 
-            SET is_active = 0, updated_at = ?
-            WHERE email = ?
-        ''', (datetime.now(timezone.utc).isoformat(), email))
-        
-        if cursor.rowcount == 0:
-            conn.close()
+        if updated == 0:
             return {"success": False, "message": "Email not found in subscriptions"}
         
-        conn.commit()
-        conn.close()
-        
         return {"success": True, "message": "Successfully unsubscribed from notifications"}
     
     except Exception as e:
@@ -161,13 +156,8 @@ async def unsubscribe_from_notifications(email: str):
 async def get_subscription_status(email: str):
     """Check subscription status for an email"""
     try:
-        init_subscriptions_table()
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT * FROM email_subscriptions WHERE email = ?', (email,))
-        row = cursor.fetchone()
-        conn.close()
+        rows = await run_in_db(query_subscriptions, 'SELECT * FROM email_subscriptions WHERE email = ?', (email,))
+        row = rows[0] if rows else None
         
         if not row or not row['is_active']:
             return SubscriptionStatus(
@@ -193,17 +183,12 @@ async def get_subscription_status(email: str):
 async def list_subscribers(active_only: bool = True):
     """List all email subscribers (for admin use)"""
     try:
-        init_subscriptions_table()
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
         if active_only:
-            cursor.execute('SELECT * FROM email_subscriptions WHERE is_active = 1 ORDER BY subscribed_at DESC')
+            sql = 'SELECT * FROM email_subscriptions WHERE is_active = 1 ORDER BY subscribed_at DESC'
         else:
-            cursor.execute('SELECT * FROM email_subscriptions ORDER BY subscribed_at DESC')
+            sql = 'SELECT * FROM email_subscriptions ORDER BY subscribed_at DESC'
         
-        rows = cursor.fetchall()
-        conn.close()
+        rows = await run_in_db(query_subscriptions, sql)
         
         subscribers = []
         for row in rows:
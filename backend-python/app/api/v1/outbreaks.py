@@ -2,20 +2,32 @@
 Outbreak management routes
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, func
+from sqlalchemy import select, and_, func, tuple_, literal, type_coerce, String
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Optional, List, Tuple, Dict, Callable
 from datetime import datetime, timedelta, timezone
+import base64
+import binascii
+import json
 
 from app.core.database import get_db
 from app.models.outbreak import Outbreak, Hospital
 from app.models.user import User
 from app.api.v1.auth import get_current_user
+from app.core.serialization import ORJSONRoute
+from app.services.outbreak_rollup import record_outbreaks, retract_outbreaks
+from app.services.stats_snapshot import get_stats_snapshot
+from app.services.outbreak_map_grid import (
+    MAX_ZOOM, MAX_VIEWPORT_CELLS, index_outbreaks, query_clusters, viewport_cells
+)
+from app.services.map_tiles import invalidate_point
+from app.core.cache import conditional_get, invalidate_tags, region_tag, TAG_OUTBREAKS, TAG_HOSPITALS
+from app.core.data_version import bump_data_version
 
 
-router = APIRouter(prefix="/outbreaks", tags=["Outbreaks"])
+router = APIRouter(prefix="/outbreaks", tags=["Outbreaks"], route_class=ORJSONRoute)
 
 
 # Request/Response models
@@ -89,6 +101,9 @@ async def create_outbreak(
                 db.add(hospital)
                 await db.commit()
                 await db.refresh(hospital)
+                await invalidate_point('hospitals', hospital.latitude, hospital.longitude)
+                await invalidate_tags(TAG_HOSPITALS, region_tag(hospital.state))
+                await bump_data_version("hospitals")
         
         if not hospital:
             raise HTTPException(
@@ -129,8 +144,15 @@ async def create_outbreak(
         )
         
         db.add(outbreak)
+        await db.flush()
+        await record_outbreaks(db, [outbreak.id])
+        await index_outbreaks(db, [outbreak.id])
         await db.commit()
         await db.refresh(outbreak)
+        # Outbreaks sit at their hospital on the map
+        await invalidate_point('outbreaks', hospital.latitude, hospital.longitude)
+        await invalidate_tags(TAG_OUTBREAKS, region_tag(hospital.state))
+        await bump_data_version("outbreaks")
         
         return {
             "id": str(outbreak.id),
@@ -151,8 +173,107 @@ async def create_outbreak(
         )
 
 
+def encode_cursor(date_reported: str, outbreak_id: str) -> str:
+    """Opaque page cursor for the (date_reported, id) keyset"""
+    raw = json.dumps([date_reported, outbreak_id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[str, str]:
+    """(date_reported, id) from a cursor made by encode_cursor"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        date_reported, outbreak_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(date_reported, str) or not isinstance(outbreak_id, str):
+            raise ValueError("cursor fields must be strings")
+        return date_reported, outbreak_id
+    except (ValueError, TypeError, binascii.Error, UnicodeDecodeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+def _iso(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def _hospital_summary(row) -> dict:
+    return {
+        "id": str(row.hospital_id),
+        "name": row.hospital_name,
+        "location": {
+            "lat": row.hospital_latitude if row.hospital_latitude else 0,
+            "lng": row.hospital_longitude if row.hospital_longitude else 0,
+            "latitude": row.hospital_latitude if row.hospital_latitude else 0,
+            "longitude": row.hospital_longitude if row.hospital_longitude else 0,
+            "city": row.hospital_city,
+            "state": row.hospital_state
+        }
+    }
+
+
+# Listing keys in response order: key -> (Outbreak columns, Hospital columns, serializer).
+# The columns are all the key needs, so a projection selects nothing else.
+# Serializers read a result row; Hospital columns come labelled "hospital_<column>".
+OUTBREAK_FIELDS: Dict[str, Tuple[tuple, tuple, Callable]] = {
+    "id": ((Outbreak.id,), (), lambda r: str(r.id)),
+    "hospital": ((), (Hospital.id, Hospital.name, Hospital.latitude, Hospital.longitude, Hospital.city, Hospital.state),
+                 _hospital_summary),
+    "city": ((), (Hospital.city,), lambda r: r.hospital_city),  # Direct access for map
+    "state": ((), (Hospital.state,), lambda r: r.hospital_state),  # Direct access for map
+    "disease": ((Outbreak.disease_type,), (), lambda r: r.disease_type),  # Alias for AdminDashboard
+    "disease_type": ((Outbreak.disease_type,), (), lambda r: r.disease_type),
+    "cases": ((Outbreak.patient_count,), (), lambda r: r.patient_count),  # Alias for AdminDashboard
+    "patient_count": ((Outbreak.patient_count,), (), lambda r: r.patient_count),
+    "date_started": ((Outbreak.date_started,), (), lambda r: r.date_started.isoformat()),
+    "reported_date": ((Outbreak.date_reported,), (), lambda r: _iso(r.date_reported)),  # Alias
+    "date_reported": ((Outbreak.date_reported,), (), lambda r: _iso(r.date_reported)),
+    "severity": ((Outbreak.severity,), (), lambda r: r.severity),
+    "age_distribution": ((Outbreak.age_distribution,), (), lambda r: r.age_distribution),
+    "gender_distribution": ((Outbreak.gender_distribution,), (), lambda r: r.gender_distribution),
+    "symptoms": ((Outbreak.symptoms,), (), lambda r: r.symptoms),
+    "notes": ((Outbreak.notes,), (), lambda r: r.notes),
+    "verified": ((Outbreak.verified,), (), lambda r: r.verified),
+    "location": ((), (Hospital.name, Hospital.latitude, Hospital.longitude),
+                 lambda r: {"name": r.hospital_name, "latitude": r.hospital_latitude,
+                            "longitude": r.hospital_longitude}),
+    "created_at": ((Outbreak.created_at,), (), lambda r: _iso(r.created_at)),
+    "updated_at": ((Outbreak.updated_at,), (), lambda r: _iso(r.updated_at)),
+}
+
+# Named projections: map markers, the admin table, and the full legacy row
+OUTBREAK_VIEWS: Dict[str, List[str]] = {
+    "map": ["id", "disease_type", "patient_count", "severity", "date_reported", "location"],
+    "table": ["id", "hospital", "disease", "disease_type", "cases", "patient_count", "reported_date",
+              "date_reported", "severity", "verified", "location"],
+    "full": list(OUTBREAK_FIELDS),
+}
+
+
+def resolve_outbreak_fields(view: str = "full", fields: Optional[str] = None) -> List[str]:
+    """Keys to return: an explicit comma-separated `fields` list wins over the `view` profile"""
+    if not fields:
+        if view not in OUTBREAK_VIEWS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown view '{view}'. Choose from: {', '.join(OUTBREAK_VIEWS)}"
+            )
+        return OUTBREAK_VIEWS[view]
+    requested = {f.strip() for f in fields.split(",") if f.strip()}
+    unknown = requested - OUTBREAK_FIELDS.keys()
+    if unknown or not requested:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(sorted(unknown)) or '(none given)'}. "
+                   f"Available: {', '.join(OUTBREAK_FIELDS)}"
+        )
+    return [key for key in OUTBREAK_FIELDS if key in requested]
+
+
 @router.get("/", response_model=List[dict])
 async def list_outbreaks_array(
+    response: Response,
     disease_type: Optional[str] = None,
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
@@ -160,14 +281,23 @@ async def list_outbreaks_array(
     verified: Optional[bool] = None,
     limit: int = Query(default=100, le=1000),
     offset: int = 0,
+    cursor: Optional[str] = None,
+    view: str = Query(default="full", description="map, table or full"),
+    fields: Optional[str] = Query(default=None, description="Comma-separated keys (overrides view)"),
     db: AsyncSession = Depends(get_db)
 ):
-    """List outbreaks with filters - returns raw array"""
-    result = await _get_outbreaks(db, disease_type, start_date, end_date, severity, verified, None, limit, offset)
+    """List outbreaks with filters - returns raw array (next page cursor in X-Next-Cursor)"""
+    result, next_cursor = await _get_outbreaks(
+        db, disease_type, start_date, end_date, severity, verified, None, limit, offset, cursor,
+        resolve_outbreak_fields(view, fields)
+    )
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     return result
 
 
 @router.get("/all")
+@conditional_get("outbreaks", "hospitals", daily=True)  # days window moves with the date
 async def list_outbreaks_wrapped(
     disease_type: Optional[str] = None,
     start_date: Optional[datetime] = None,
@@ -177,13 +307,20 @@ async def list_outbreaks_wrapped(
     days: int = Query(default=30, ge=1, le=365),
     limit: int = Query(default=100, le=1000),
     offset: int = 0,
+    cursor: Optional[str] = None,
+    view: str = Query(default="full", description="map, table or full"),
+    fields: Optional[str] = Query(default=None, description="Comma-separated keys (overrides view)"),
     db: AsyncSession = Depends(get_db)
 ):
     """List outbreaks with filters - returns wrapped response for Admin Dashboard"""
-    result = await _get_outbreaks(db, disease_type, start_date, end_date, severity, verified, days, limit, offset)
+    result, next_cursor = await _get_outbreaks(
+        db, disease_type, start_date, end_date, severity, verified, days, limit, offset, cursor,
+        resolve_outbreak_fields(view, fields)
+    )
     return {
         "outbreaks": result,
-        "count": len(result)
+        "count": len(result),
+        "next_cursor": next_cursor
     }
 
 
@@ -196,18 +333,49 @@ async def _get_outbreaks(
     verified: Optional[bool] = None,
     days: Optional[int] = None,
     limit: int = 100,
-    offset: int = 0
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    fields: Optional[List[str]] = None
 ):
-    """Internal helper to get outbreaks with filters"""
-    from sqlalchemy.orm import defer
+    """
+    Internal helper to get outbreaks with filters, newest first.
+    
+    Pages either by offset or, when `cursor` is given, by keyset on
+    (date_reported, id) via ix_outbreaks_date_reported_id, so every page
+    costs the same as the first. Returns (outbreaks, next_cursor);
+    next_cursor is None on the last page. Rows without a date_reported
+    (the column defaults to now()) are only reachable by offset.
+    
+    `fields` (keys of OUTBREAK_FIELDS, default all) limits both the
+    columns selected and the keys serialized. Rows are plain column
+    tuples rather than ORM instances, which is most of the per-row cost
+    of a lean view.
+    """
     from datetime import timedelta, timezone
     
-    # Build query - defer loading the location Geography field to avoid deserialization errors
-    query = select(Outbreak, Hospital).join(
+    fields = fields or OUTBREAK_VIEWS["full"]
+    outbreak_columns = {"id": Outbreak.id}
+    hospital_columns = {}
+    for key in fields:
+        outbreak_cols, hospital_cols, _ = OUTBREAK_FIELDS[key]
+        outbreak_columns.update((column.key, column) for column in outbreak_cols)
+        hospital_columns.update((column.key, column) for column in hospital_cols)
+    serializers = [(key, OUTBREAK_FIELDS[key][2]) for key in fields]
+    
+    is_sqlite = "sqlite" in str(db.bind.url)
+    # SQLite keeps date_reported as text in whichever format wrote it (with
+    # or without microseconds), so the cursor carries the stored text and is
+    # compared as text; other databases compare real timestamps.
+    cursor_date = type_coerce(Outbreak.date_reported, String) if is_sqlite else Outbreak.date_reported
+    
+    # Build query - select only the projected columns (never the location
+    # Geography fields, which fail to deserialize)
+    query = select(
+        *(column.label(key) for key, column in outbreak_columns.items()),
+        *(column.label(f"hospital_{key}") for key, column in hospital_columns.items()),
+        cursor_date.label("cursor_date")
+    ).select_from(Outbreak).join(
         Hospital, Outbreak.hospital_id == Hospital.id
-    ).options(
-        defer(Outbreak.location),  # Don't load location field
-        defer(Hospital.location)   # Don't load location field
     )
     
     # Apply filters
@@ -226,62 +394,44 @@ async def _get_outbreaks(
         # Use naive datetime for SQLite comparison if needed
         cutoff = datetime.now(timezone.utc) - timedelta(days=days)
         # For SQLite, sometimes naive comparison works better with func.now() defaults
-        if "sqlite" in str(db.bind.url):
+        if is_sqlite:
              cutoff = cutoff.replace(tzinfo=None)
         filters.append(Outbreak.date_reported >= cutoff)
+    if cursor:
+        after_date, after_id = decode_cursor(cursor)
+        if not is_sqlite:
+            try:
+                after_date = datetime.fromisoformat(after_date)
+            except ValueError:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+        filters.append(Outbreak.date_reported.isnot(None))
+        filters.append(
+            tuple_(cursor_date, Outbreak.id) < tuple_(literal(after_date, cursor_date.type), literal(after_id, String))
+        )
     
     if filters:
         query = query.where(and_(*filters))
     
-    query = query.order_by(Outbreak.date_reported.desc())
-    query = query.limit(limit).offset(offset)
+    # id breaks ties between rows reported at the same instant
+    query = query.order_by(Outbreak.date_reported.desc(), Outbreak.id.desc())
+    query = query.limit(limit)
+    if not cursor:
+        query = query.offset(offset)
     
     result = await db.execute(query)
     rows = result.all()
     
-    outbreaks = []
-    for outbreak, hospital in rows:
-        # Use latitude/longitude from database instead of location Geography
-        outbreak_dict = {
-            "id": str(outbreak.id),
-            "hospital": {
-                "id": str(hospital.id),
-                "name": hospital.name,
-                "location": {
-                    "lat": hospital.latitude if hospital.latitude else 0,
-                    "lng": hospital.longitude if hospital.longitude else 0,
-                    "latitude": hospital.latitude if hospital.latitude else 0,
-                    "longitude": hospital.longitude if hospital.longitude else 0,
-                    "city": hospital.city,
-                    "state": hospital.state
-                }
-            },
-            "city": hospital.city,  # Direct access for map
-            "state": hospital.state,  # Direct access for map
-            "disease": outbreak.disease_type,  # Alias for AdminDashboard
-            "disease_type": outbreak.disease_type,
-            "cases": outbreak.patient_count,  # Alias for AdminDashboard
-            "patient_count": outbreak.patient_count,
-            "date_started": outbreak.date_started.isoformat(),
-            "reported_date": outbreak.date_reported.isoformat() if outbreak.date_reported else None,  # Alias
-            "date_reported": outbreak.date_reported.isoformat() if outbreak.date_reported else None,
-            "severity": outbreak.severity,
-            "age_distribution": outbreak.age_distribution,
-            "gender_distribution": outbreak.gender_distribution,
-            "symptoms": outbreak.symptoms,
-            "notes": outbreak.notes,
-            "verified": outbreak.verified,
-            "location": {
-                "name": hospital.name,
-                "latitude": hospital.latitude,
-                "longitude": hospital.longitude
-            },
-            "created_at": outbreak.created_at.isoformat() if outbreak.created_at else None,
-            "updated_at": outbreak.updated_at.isoformat() if outbreak.updated_at else None
-        }
-        outbreaks.append(outbreak_dict)
+    next_cursor = None
+    if len(rows) == limit and rows[-1].cursor_date is not None:
+        last_date = rows[-1].cursor_date
+        next_cursor = encode_cursor(
+            last_date if isinstance(last_date, str) else last_date.isoformat(),
+            str(rows[-1].id)
+        )
+    
+    outbreaks = [{key: serialize(row) for key, serialize in serializers} for row in rows]
     
-    return outbreaks
+    return outbreaks, next_cursor
 
 
 @router.get("/pending-count")
@@ -298,36 +448,17 @@ async def get_pending_outbreak_count(
 
 
 @router.get("/stats")
-async def get_outbreak_stats(
-    db: AsyncSession = Depends(get_db)
-):
+async def get_outbreak_stats():
     """Get aggregated outbreak statistics for Admin Dashboard"""
     
-    # 1. Total Reports
-    total_query = select(func.count(Outbreak.id))
-    total_result = await db.execute(total_query)
-    total_reports = total_result.scalar() or 0
-    
-    # 2. Pending Review (Not Verified)
-    pending_query = select(func.count(Outbreak.id)).where(Outbreak.verified == False)
-    pending_result = await db.execute(pending_query)
-    pending_review = pending_result.scalar() or 0
-    
-    # 3. High Priority (Severe)
-    severe_query = select(func.count(Outbreak.id)).where(Outbreak.severity == 'severe')
-    severe_result = await db.execute(severe_query)
-    high_priority = severe_result.scalar() or 0
-    
-    # 4. Active Cases (Sum of patients)
-    cases_query = select(func.sum(Outbreak.patient_count))
-    cases_result = await db.execute(cases_query)
-    active_cases = cases_result.scalar() or 0
+    # One conditional-aggregate scan, shared across requests for a few seconds
+    totals = (await get_stats_snapshot())['outbreaks']
     
     return {
-        "total_reports": total_reports,
-        "pending_review": pending_review,
-        "high_priority": high_priority,
-        "active_cases": active_cases
+        "total_reports": totals['total'],
+        "pending_review": totals['unverified'],
+        "high_priority": totals['severe'],
+        "active_cases": totals['patients']
     }
 
 
@@ -405,11 +536,20 @@ async def verify_outbreak(
             detail="Outbreak not found"
         )
     
+    # Moves the outbreak into the rollup's verified count
+    was_verified = outbreak.verified
+    if not was_verified:
+        await retract_outbreaks(db, [outbreak.id])
+    
     outbreak.verified = True
     outbreak.verified_by = current_user.id
     outbreak.verification_date = datetime.now(timezone.utc)
     
+    if not was_verified:
+        await db.flush()
+        await record_outbreaks(db, [outbreak.id])
     await db.commit()
+    await bump_data_version("outbreaks")
     
     return {
         "message": "Outbreak verified successfully",
@@ -442,10 +582,19 @@ async def verify_outbreak_public(
             detail="Outbreak not found"
         )
     
+    # Moves the outbreak into the rollup's verified count
+    was_verified = outbreak.verified
+    if not was_verified:
+        await retract_outbreaks(db, [outbreak.id])
+    
     outbreak.verified = True
     outbreak.verification_date = datetime.now(timezone.utc)
     
+    if not was_verified:
+        await db.flush()
+        await record_outbreaks(db, [outbreak.id])
     await db.commit()
+    await bump_data_version("outbreaks")
     
     return {
         "message": "Outbreak verified successfully",
@@ -454,17 +603,47 @@ async def verify_outbreak_public(
     }
 
 
+WORLD_BBOX = (-180.0, -85.05112878, 180.0, 85.05112878)
+
+
+def parse_bbox(bbox: str) -> Tuple[float, float, float, float]:
+    """(west, south, east, north) from a "west,south,east,north" query value"""
+    try:
+        west, south, east, north = (float(part) for part in bbox.split(','))
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="bbox must be west,south,east,north"
+        )
+    if not (-180 <= west <= east <= 180 and -90 <= south <= north <= 90):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="bbox must be west,south,east,north in degrees, west <= east and south <= north"
+        )
+    return west, south, east, north
+
+
 @router.get("/map/geojson")
 async def get_outbreaks_geojson(
     disease_type: Optional[str] = None,
     days: int = 30,
+    zoom: Optional[int] = Query(None, ge=0, le=MAX_ZOOM, description="Cluster outbreaks for this map zoom level"),
+    bbox: Optional[str] = Query(None, description="Viewport as west,south,east,north (degrees)"),
     db: AsyncSession = Depends(get_db)
 ):
-    """Get outbreaks as GeoJSON for map visualization"""
+    """
+    Get outbreaks as GeoJSON for map visualization
+    With zoom, outbreaks are clustered on a grid (one feature per occupied
+    cell in the bbox), so the size follows the viewport, not the data.
+    """
+    viewport = parse_bbox(bbox) if bbox else None
     
     # Get outbreaks from last N days
     start_date = datetime.now(timezone.utc) - timedelta(days=days)
     
+    if zoom is not None:
+        return await _clustered_geojson(db, zoom, viewport or WORLD_BBOX, start_date, disease_type)
+    
     query = select(Outbreak, Hospital).join(
         Hospital, Outbreak.hospital_id == Hospital.id
     ).where(Outbreak.date_reported >= start_date)
@@ -472,6 +651,13 @@ async def get_outbreaks_geojson(
     if disease_type:
         query = query.where(Outbreak.disease_type == disease_type)
     
+    if viewport:
+        west, south, east, north = viewport
+        query = query.where(
+            Hospital.longitude.between(west, east),
+            Hospital.latitude.between(south, north)
+        )
+    
     result = await db.execute(query)
     rows = result.all()
     
@@ -503,6 +689,46 @@ async def get_outbreaks_geojson(
     }
 
 
+async def _clustered_geojson(
+    db: AsyncSession,
+    zoom: int,
+    viewport: Tuple[float, float, float, float],
+    start_date: datetime,
+    disease_type: Optional[str]
+) -> Dict:
+    """Grid clusters of the map index inside a viewport (whole reported days)"""
+    x_min, y_min, x_max, y_max = viewport_cells(zoom, viewport)
+    if (x_max - x_min + 1) * (y_max - y_min + 1) > MAX_VIEWPORT_CELLS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="bbox is too large for this zoom level"
+        )
+    
+    clusters = await query_clusters(db, zoom, viewport, start_date.date().isoformat(), disease_type)
+    features = [{
+        "type": "Feature",
+        "geometry": {
+            "type": "Point",
+            "coordinates": [cluster["longitude"], cluster["latitude"]]
+        },
+        "properties": {
+            "cluster": True,
+            "cluster_id": cluster["cell"],
+            "point_count": cluster["outbreak_count"],
+            "patient_count": cluster["case_count"],
+            "severity": cluster["severity"],
+            "severity_counts": cluster["severity_counts"],
+            "color": _get_severity_color(cluster["severity"])
+        }
+    } for cluster in clusters]
+    
+    return {
+        "type": "FeatureCollection",
+        "zoom": zoom,
+        "features": features
+    }
+
+
 def _get_severity_color(severity: str) -> str:
     """Get color code for severity level"""
     colors = {
@@ -10,25 +10,14 @@ import sqlite3
 import os
 from io import BytesIO
 
-router = APIRouter(prefix="/reports", tags=["PDF Reports"])
+from app.core.db_access import run_in_db
+from app.core.serialization import ORJSONRoute
 
+router = APIRouter(prefix="/reports", tags=["PDF Reports"], route_class=ORJSONRoute)
 
-def get_db_connection():
-    """Get SQLite database connection"""
-    from app.core.config import get_sqlite_db_path
-    conn = sqlite3.connect(get_sqlite_db_path())
-    conn.row_factory = sqlite3.Row
-    return conn
 
-
-def generate_text_report():
-    """Generate a text-based report (PDF generation requires external library)"""
-    
-    now = datetime.now(timezone.utc)
-    report_date = now.strftime("%Y-%m-%d %H:%M UTC")
-    
-    # Get data from SQLite
-    conn = get_db_connection()
+def collect_report_data(conn: sqlite3.Connection) -> dict:
+    """Summary counts plus per-disease and per-state rows (runs on the DB pool)"""
     cursor = conn.cursor()
     
     # Get outbreak stats
@@ -68,7 +57,30 @@ def generate_text_report():
     """)
     state_data = cursor.fetchall()
     
-    conn.close()
+    return {
+        "total_outbreaks": total_outbreaks,
+        "approved": approved,
+        "pending": pending,
+        "severe": severe,
+        "total_cases": total_cases,
+        "disease_data": disease_data,
+        "state_data": state_data
+    }
+
+
+def generate_text_report(data: dict):
+    """Generate a text-based report (PDF generation requires external library)"""
+    
+    now = datetime.now(timezone.utc)
+    report_date = now.strftime("%Y-%m-%d %H:%M UTC")
+    
+    total_outbreaks = data["total_outbreaks"]
+    approved = data["approved"]
+    pending = data["pending"]
+    severe = data["severe"]
+    total_cases = data["total_cases"]
+    disease_data = data["disease_data"]
+    state_data = data["state_data"]
     
     # Build report text
     report = f"""
@@ -145,7 +157,7 @@ async def download_summary_report():
     Returns a downloadable text report with outbreak statistics
     """
     try:
-        report_content = generate_text_report()
+        report_content = generate_text_report(await run_in_db(collect_report_data))
         
         # Generate filename
         filename = f"symptomap_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
@@ -167,56 +179,18 @@ async def get_report_data():
     Get report data as JSON for frontend rendering
     """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        # Get outbreak stats
-        cursor.execute("SELECT COUNT(*) as total FROM doctor_outbreaks")
-        total_outbreaks = cursor.fetchone()['total']
-        
-        cursor.execute("SELECT COUNT(*) as count FROM doctor_outbreaks WHERE status = 'approved'")
-        approved = cursor.fetchone()['count']
-        
-        cursor.execute("SELECT COUNT(*) as count FROM doctor_outbreaks WHERE status = 'pending' OR status IS NULL")
-        pending = cursor.fetchone()['count']
-        
-        cursor.execute("SELECT COUNT(*) as count FROM doctor_outbreaks WHERE severity = 'severe'")
-        severe = cursor.fetchone()['count']
-        
-        cursor.execute("SELECT SUM(patient_count) as total FROM doctor_outbreaks WHERE status = 'approved'")
-        row = cursor.fetchone()
-        total_cases = row['total'] if row['total'] else 0
-        
-        # Get by disease
-        cursor.execute("""
-            SELECT disease_type, COUNT(*) as count, SUM(patient_count) as cases
-            FROM doctor_outbreaks 
-            WHERE status = 'approved'
-            GROUP BY disease_type
-            ORDER BY count DESC
-        """)
-        disease_data = [{"disease": r['disease_type'], "outbreaks": r['count'], "cases": r['cases'] or 0} for r in cursor.fetchall()]
-        
-        # Get by state
-        cursor.execute("""
-            SELECT state, COUNT(*) as count, SUM(patient_count) as cases
-            FROM doctor_outbreaks 
-            WHERE status = 'approved' AND state IS NOT NULL
-            GROUP BY state
-            ORDER BY count DESC
-        """)
-        state_data = [{"state": r['state'], "outbreaks": r['count'], "cases": r['cases'] or 0} for r in cursor.fetchall()]
-        
-        conn.close()
+        data = await run_in_db(collect_report_data)
+        disease_data = [{"disease": r['disease_type'], "outbreaks": r['count'], "cases": r['cases'] or 0} for r in data["disease_data"]]
+        state_data = [{"state": r['state'], "outbreaks": r['count'], "cases": r['cases'] or 0} for r in data["state_data"]]
         
         return {
             "generated_at": datetime.now(timezone.utc).isoformat(),
             "summary": {
-                "total_submissions": total_outbreaks,
-                "approved": approved,
-                "pending": pending,
-                "severe": severe,
-                "total_cases": total_cases
+                "total_submissions": data["total_outbreaks"],
+                "approved": data["approved"],
+                "pending": data["pending"],
+                "severe": data["severe"],
+                "total_cases": data["total_cases"]
             },
             "by_disease": disease_data,
             "by_state": state_data
@@ -9,10 +9,13 @@ from datetime import datetime, timezone, timedelta
 from typing import List, Dict, Optional
 import math
 import json
+import numpy as np
 
 from app.core.database import get_db
+from app.services import seir_kernel
+from app.core.serialization import ORJSONRoute
 
-router = APIRouter(prefix="/predictions", tags=["AI Predictions"])
+router = APIRouter(prefix="/predictions", tags=["AI Predictions"], route_class=ORJSONRoute)
 
 
 class SEIRModel:
@@ -43,34 +46,41 @@ class SEIRModel:
         """Calculate basic reproduction number"""
         return self.beta / self.gamma
     
+    def simulate_arrays(self, days: int) -> np.ndarray:
+        """
+        Daily Euler steps (one per day) from the initial state.
+        Returns a (days + 2, 4) array: row 0 is the initial state, row d + 1
+        the state reported for day d.
+        """
+        return seir_kernel.integrate(
+            seir_kernel.initial_state(self.N, self.I0, self.E0, self.R0_value),
+            self.N, self.beta, self.sigma, self.gamma,
+            days + 1, method="euler", steps_per_day=1
+        )
+    
     def simulate(self, days: int) -> List[Dict]:
         """Run SEIR simulation for given days"""
-        S, E, I, R = self.S0, self.E0, self.I0, self.R0_value
-        results = []
+        trajectory = self.simulate_arrays(days)
+        counts = trajectory[1:].astype(np.int64)
         
-        for day in range(days + 1):
-            # Calculate new infections, exposures, recoveries
-            new_exposed = (self.beta * S * I) / self.N
-            new_infected = self.sigma * E
-            new_recovered = self.gamma * I
-            
-            # Update compartments
-            S = max(0, S - new_exposed)
-            E = max(0, E + new_exposed - new_infected)
-            I = max(0, I + new_infected - new_recovered)
-            R = min(self.N, R + new_recovered)
-            
-            results.append({
-                'day': day,
-                'susceptible': int(S),
-                'exposed': int(E),
-                'infected': int(I),
-                'recovered': int(R),
-                'new_cases': int(new_infected),
-                'total_cases': int(I + R)
-            })
+        # New cases of each day come from the exposed pool it started with
+        new_cases = (self.sigma * trajectory[:-1, seir_kernel.EXPOSED]).astype(np.int64)
+        total_cases = (trajectory[1:, seir_kernel.INFECTED] + trajectory[1:, seir_kernel.RECOVERED]).astype(np.int64)
         
-        return results
+        return [
+            {
+                'day': day,
+                'susceptible': s,
+                'exposed': e,
+                'infected': i,
+                'recovered': r,
+                'new_cases': new,
+                'total_cases': total
+            }
+            for day, (s, e, i, r), new, total in zip(
+                range(days + 1), counts.tolist(), new_cases.tolist(), total_cases.tolist()
+            )
+        ]
 
 
 def calculate_confidence_interval(value: float, day: int, uncertainty: float = 0.15) -> Dict:
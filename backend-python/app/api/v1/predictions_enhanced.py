@@ -4,13 +4,19 @@ Professional outbreak forecasting with real training data
 Trained on 50+ historical outbreaks (2022-2024)
 """
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, HTTPException, Query
 from datetime import datetime, timezone, timedelta
 from typing import List, Dict, Optional
-import sqlite3
 import os
 import math
 import random
+from functools import lru_cache
+import numpy as np
+
+from app.services import seir_kernel
+from app.core.db_access import fetch_all
+from app.core.cache import VersionedCache
+from app.core.data_version import get_data_version, get_data_token
 
 # Import training data and functions
 from app.api.v1.training_data import (
@@ -20,10 +26,13 @@ from app.api.v1.training_data import (
     calculate_trained_parameters,
     get_seasonal_multiplier,
     is_peak_season,
-    get_training_summary
+    get_training_summary,
+    get_training_data_version,
+    get_parameter_spread
 )
+from app.core.serialization import ORJSONRoute
 
-router = APIRouter(prefix="/predictions", tags=["AI Predictions"])
+router = APIRouter(prefix="/predictions", tags=["AI Predictions"], route_class=ORJSONRoute)
 
 
 # India State Data - 2024 Population Estimates and Healthcare Capacity
@@ -52,6 +61,38 @@ INDIA_STATES = {
     "Goa": {"population": 1600000, "hospital_beds": 5000, "risk_factor": 0.9},
 }
 
+# Inter-state travel links for the metapopulation model: shared land
+# borders plus the busiest long-distance air/rail corridors
+STATE_CONNECTIONS = [
+    ("Maharashtra", "Gujarat"), ("Maharashtra", "Madhya Pradesh"), ("Maharashtra", "Chhattisgarh"),
+    ("Maharashtra", "Telangana"), ("Maharashtra", "Karnataka"), ("Maharashtra", "Goa"),
+    ("Uttar Pradesh", "Uttarakhand"), ("Uttar Pradesh", "Himachal Pradesh"), ("Uttar Pradesh", "Haryana"),
+    ("Uttar Pradesh", "Delhi"), ("Uttar Pradesh", "Rajasthan"), ("Uttar Pradesh", "Madhya Pradesh"),
+    ("Uttar Pradesh", "Chhattisgarh"), ("Uttar Pradesh", "Jharkhand"), ("Uttar Pradesh", "Bihar"),
+    ("Karnataka", "Goa"), ("Karnataka", "Telangana"), ("Karnataka", "Andhra Pradesh"),
+    ("Karnataka", "Tamil Nadu"), ("Karnataka", "Kerala"),
+    ("Tamil Nadu", "Kerala"), ("Tamil Nadu", "Andhra Pradesh"),
+    ("Gujarat", "Rajasthan"), ("Gujarat", "Madhya Pradesh"),
+    ("Rajasthan", "Punjab"), ("Rajasthan", "Haryana"), ("Rajasthan", "Madhya Pradesh"),
+    ("West Bengal", "Bihar"), ("West Bengal", "Jharkhand"), ("West Bengal", "Odisha"), ("West Bengal", "Assam"),
+    ("Madhya Pradesh", "Chhattisgarh"),
+    ("Bihar", "Jharkhand"),
+    ("Andhra Pradesh", "Telangana"), ("Andhra Pradesh", "Odisha"), ("Andhra Pradesh", "Chhattisgarh"),
+    ("Telangana", "Chhattisgarh"),
+    ("Delhi", "Haryana"),
+    ("Punjab", "Himachal Pradesh"), ("Punjab", "Haryana"),
+    ("Haryana", "Himachal Pradesh"),
+    ("Odisha", "Jharkhand"), ("Odisha", "Chhattisgarh"),
+    ("Jharkhand", "Chhattisgarh"),
+    ("Uttarakhand", "Himachal Pradesh"),
+    # Long-distance corridors
+    ("Delhi", "Maharashtra"), ("Delhi", "Karnataka"), ("Delhi", "West Bengal"),
+    ("Delhi", "Tamil Nadu"), ("Delhi", "Telangana"), ("Maharashtra", "West Bengal"),
+]
+
+# Share of each state's contacts made with connected states
+MOBILITY_RATE = 0.02
+
 # Disease-specific parameters based on epidemiological research
 DISEASE_PARAMS = {
     "Dengue": {"beta": 0.4, "sigma": 0.25, "gamma": 0.14, "hospitalization_rate": 0.20, "fatality_rate": 0.01},
@@ -66,12 +107,11 @@ DISEASE_PARAMS = {
 }
 
 
-def get_db_connection():
-    """Get SQLite database connection"""
-    from app.core.config import get_sqlite_db_path
-    conn = sqlite3.connect(get_sqlite_db_path())
-    conn.row_factory = sqlite3.Row
-    return conn
+# Intervention factor applied to the disease transmission rate per scenario
+SCENARIO_INTERVENTIONS = {'best': 0.6, 'likely': 1.0, 'worst': 1.2}
+
+# Sample-data scenarios (no doctor submissions yet): (beta, intervention factor)
+SAMPLE_SCENARIOS = {'best': (0.3, 0.7), 'likely': (0.45, 0.85), 'worst': (0.6, 1.0)}
 
 
 class EnhancedSEIRModel:
@@ -114,57 +154,254 @@ class EnhancedSEIRModel:
         """Calculate basic reproduction number"""
         return round(self.beta / self.gamma, 2)
     
-    def simulate(self, days: int) -> List[Dict]:
+    def simulate_arrays(self, days: int, method: Optional[str] = None) -> np.ndarray:
+        """Run SEIR integration, returning a (days + 1, 4) array of S/E/I/R"""
+        return seir_kernel.integrate(
+            (self.S0, self.E0, self.I0, self.R0_value),
+            self.N, self.beta, self.sigma, self.gamma,
+            days, method=method
+        )
+    
+    def simulate(self, days: int, method: Optional[str] = None) -> List[Dict]:
         """Run SEIR simulation with post-processing"""
-        S, E, I, R = float(self.S0), float(self.E0), float(self.I0), float(self.R0_value)
-        results = []
-        
-        dt = 0.1  # Use smaller time step for accuracy
-        steps_per_day = int(1 / dt)
+        return self._postprocess(self.simulate_arrays(days, method))
+    
+    def _postprocess(self, trajectory: np.ndarray) -> List[Dict]:
+        """Post-processing pipeline: confidence bands, then daily dicts for the response"""
+        counts = trajectory.astype(np.int64)
+        susceptible, exposed, infected, recovered = counts.T
+        new_cases = np.maximum(0.0, self.sigma * trajectory[:, 1]).astype(np.int64)
         
-        for day in range(days + 1):
-            # Store daily values
-            results.append({
-                'day': day,
-                'date': (datetime.now(timezone.utc) + timedelta(days=day)).date().isoformat(),
-                'susceptible': int(S),
-                'exposed': int(E),
-                'infected': int(I),
-                'recovered': int(R),
-                'new_cases': int(max(0, self.sigma * E)),
-                'total_cases': int(I + R),
-                'active_cases': int(I)
-            })
-            
-            # Euler method with smaller steps for stability
-            for _ in range(steps_per_day):
-                dS = -self.beta * S * I / self.N
-                dE = self.beta * S * I / self.N - self.sigma * E
-                dI = self.sigma * E - self.gamma * I
-                dR = self.gamma * I
-                
-                S = max(0, S + dS * dt)
-                E = max(0, E + dE * dt)
-                I = max(0, I + dI * dt)
-                R = min(self.N, R + dR * dt)
+        # 10% to 30% uncertainty, widening over the horizon
+        uncertainty = 0.10 + (np.arange(len(counts)) / len(counts)) * 0.20
+        bands = {}
+        for key, values in (('infected', infected), ('exposed', exposed), ('new_cases', new_cases)):
+            bands[f'{key}_lower'] = np.maximum(0, (values * (1 - uncertainty)).astype(np.int64)).tolist()
+            bands[f'{key}_upper'] = (values * (1 + uncertainty)).astype(np.int64).tolist()
         
-        # Post-processing
-        return self._postprocess(results)
-    
-    def _postprocess(self, results: List[Dict]) -> List[Dict]:
-        """Post-processing pipeline for prediction refinement"""
-        # Add confidence intervals and smooth predictions
-        for i, point in enumerate(results):
-            uncertainty = 0.10 + (i / len(results)) * 0.20  # 10% to 30% uncertainty
-            
-            for key in ['infected', 'exposed', 'new_cases']:
-                value = point[key]
-                point[f'{key}_lower'] = max(0, int(value * (1 - uncertainty)))
-                point[f'{key}_upper'] = int(value * (1 + uncertainty))
+        start = datetime.now(timezone.utc).date()
+        columns = {
+            'day': range(len(counts)),
+            'date': [(start + timedelta(days=day)).isoformat() for day in range(len(counts))],
+            'susceptible': susceptible.tolist(),
+            'exposed': exposed.tolist(),
+            'infected': infected.tolist(),
+            'recovered': recovered.tolist(),
+            'new_cases': new_cases.tolist(),
+            'total_cases': (trajectory[:, 2] + trajectory[:, 3]).astype(np.int64).tolist(),
+            'active_cases': infected.tolist(),
+            **bands
+        }
+        keys = list(columns)
+        results = [dict(zip(keys, row)) for row in zip(*columns.values())]
         
         return results
 
 
+def simulate_regions(populations, initial_infected, beta, sigma, gamma,
+                     days: int, intervention_factor=1.0,
+                     method: Optional[str] = None) -> Dict[str, np.ndarray]:
+    """
+    Simulate many regions at once as one (regions x 4) state matrix.
+    Applies the same pre-processing as EnhancedSEIRModel, element-wise.
+    Returns per-region arrays: peak_day, peak_cases, r0 (plus the clamped
+    rates and the raw (days + 1, regions, 4) trajectory).
+    """
+    N = np.asarray(populations, dtype=float)
+    regions = N.shape[0]
+    beta, sigma, gamma, intervention_factor = (
+        np.broadcast_to(np.asarray(v, dtype=float), (regions,))
+        for v in (beta, sigma, gamma, intervention_factor)
+    )
+    
+    I0 = np.maximum(1, np.asarray(initial_infected, dtype=np.int64))
+    E0 = (I0 * 2.5).astype(np.int64)
+    R0 = (I0 * 0.3).astype(np.int64)
+    S0 = N - I0 - E0 - R0
+    
+    # Same negative-susceptible fallback as EnhancedSEIRModel._preprocess
+    overflow = S0 < 0
+    E0 = np.where(overflow, (N * 0.001).astype(np.int64), E0)
+    R0 = np.where(overflow, 0, R0)
+    S0 = np.where(overflow, N - I0 - E0, S0)
+    
+    beta = np.clip(beta * intervention_factor, 0.1, 0.9)
+    sigma = np.clip(sigma, 0.05, 0.5)
+    gamma = np.clip(gamma, 0.05, 0.5)
+    
+    y0 = np.column_stack([S0, E0, I0, R0]).astype(float)
+    trajectory = seir_kernel.integrate(y0, N, beta, sigma, gamma, days, method=method)
+    peak_day, peak_cases = seir_kernel.peak(trajectory)
+    
+    return {
+        'peak_day': peak_day,
+        'peak_cases': peak_cases,
+        'r0': np.array([round(b / g, 2) for b, g in zip(beta.tolist(), gamma.tolist())]),
+        'beta': beta,
+        'sigma': sigma,
+        'gamma': gamma,
+        'trajectory': trajectory
+    }
+
+
+@lru_cache(maxsize=8)
+def build_mobility_matrix(mobility_rate: float = MOBILITY_RATE):
+    """
+    Sparse (states x states) contact-mixing matrix over INDIA_STATES order.
+    Each row keeps 1 - mobility_rate of contacts at home and spreads the rest
+    over connected states in proportion to their population (gravity weights),
+    so rows sum to 1 and mobility_rate = 0 reduces to independent states.
+    """
+    from scipy import sparse
+    
+    names = list(INDIA_STATES)
+    index = {name: i for i, name in enumerate(names)}
+    population = np.array([INDIA_STATES[name]['population'] for name in names], dtype=float)
+    
+    links = np.array(
+        [(index[a], index[b]) for a, b in STATE_CONNECTIONS] +
+        [(index[b], index[a]) for a, b in STATE_CONNECTIONS]
+    )
+    rows, cols = links[:, 0], links[:, 1]
+    weights = population[cols]
+    weights /= np.bincount(rows, weights=weights, minlength=len(names))[rows]
+    
+    travel = sparse.csr_matrix((weights * mobility_rate, (rows, cols)), shape=(len(names), len(names)))
+    home = sparse.identity(len(names), format='csr') * (1 - mobility_rate)
+    return (home + travel).tocsr()
+
+
+def simulate_metapopulation(initial_infected: Dict[str, int], beta: float, sigma: float,
+                            gamma: float, days: int, intervention_factor: float = 1.0,
+                            mobility_rate: float = MOBILITY_RATE,
+                            method: Optional[str] = None) -> Dict:
+    """
+    Spatial SEIR over all INDIA_STATES, coupled through build_mobility_matrix.
+    States without reported cases start fully susceptible and are seeded by
+    travel from their neighbours. The disease beta is scaled per state by its
+    risk_factor. Returns state names, per-state peaks and the raw
+    (days + 1, states, 4) trajectory.
+    """
+    names = list(INDIA_STATES)
+    N = np.array([INDIA_STATES[name]['population'] for name in names], dtype=float)
+    risk = np.array([INDIA_STATES[name]['risk_factor'] for name in names])
+    
+    I0 = np.array([max(0, int(initial_infected.get(name, 0))) for name in names], dtype=np.int64)
+    E0 = (I0 * 2.5).astype(np.int64)
+    R0 = (I0 * 0.3).astype(np.int64)
+    
+    beta = np.clip(beta * intervention_factor * risk, 0.1, 0.9)
+    sigma = min(0.5, max(0.05, sigma))
+    gamma = min(0.5, max(0.05, gamma))
+    
+    trajectory = seir_kernel.integrate(
+        seir_kernel.initial_state(N, I0, E0, R0), N, beta, sigma, gamma, days,
+        method=method, coupling=build_mobility_matrix(mobility_rate)
+    )
+    peak_day, peak_cases = seir_kernel.peak(trajectory)
+    
+    return {
+        'states': names,
+        'peak_day': peak_day,
+        'peak_cases': peak_cases,
+        'beta': beta,
+        'trajectory': trajectory
+    }
+
+
+# Forecast days reported per state in geographic predictions
+GEOGRAPHIC_HORIZONS = (7, 14, 30)
+
+# Population assumed for reported states missing from INDIA_STATES
+UNMAPPED_STATE_POPULATION = 10000000
+
+
+def predict_geographic_spread(state_counts: Dict, disease: str,
+                              intervention_factor: float = 1.0, limit: int = 5) -> List[Dict]:
+    """
+    Active cases 7/14/30 days out for the first `limit` reported states.
+    Mapped states come from one metapopulation run (so spread between
+    neighbours is included); unmapped ones are simulated on their own.
+    """
+    params = DISEASE_PARAMS.get(disease, DISEASE_PARAMS['Other'])
+    horizon = max(GEOGRAPHIC_HORIZONS)
+    reported = list(state_counts.items())[:limit]
+    
+    spatial = simulate_metapopulation(
+        {name: data['cases'] for name, data in state_counts.items()},
+        params['beta'], params['sigma'], params['gamma'], horizon, intervention_factor
+    )
+    infected = spatial['trajectory'][:, :, seir_kernel.INFECTED].astype(np.int64)
+    columns = {name: (infected[:, i], int(spatial['peak_day'][i])) for i, name in enumerate(spatial['states'])}
+    
+    unmapped = [name for name, _ in reported if name not in columns]
+    if unmapped:
+        isolated = simulate_regions(
+            [UNMAPPED_STATE_POPULATION] * len(unmapped),
+            [state_counts[name]['cases'] for name in unmapped],
+            params['beta'], params['sigma'], params['gamma'], horizon, intervention_factor
+        )
+        isolated_infected = isolated['trajectory'][:, :, seir_kernel.INFECTED].astype(np.int64)
+        for i, name in enumerate(unmapped):
+            columns[name] = (isolated_infected[:, i], int(isolated['peak_day'][i]))
+    
+    predictions = []
+    for state_name, state_data in reported:
+        series, peak_day = columns[state_name]
+        prediction = {
+            'location': state_name,
+            'disease': disease,
+            'current_cases': state_data['cases'],
+        }
+        for day in GEOGRAPHIC_HORIZONS:
+            prediction[f'predicted_cases_{day}d'] = int(series[day])
+        prediction['peak_day'] = peak_day
+        predictions.append(prediction)
+    return predictions
+
+
+# Percentiles reported as the lower/upper band in ensemble mode
+ENSEMBLE_PERCENTILES = (5, 95)
+
+
+def simulate_ensemble(model: EnhancedSEIRModel, days: int, members: int,
+                      spread: Dict[str, float], seed: int = 42) -> Dict[str, Dict[str, List[int]]]:
+    """
+    Monte Carlo uncertainty bands around a fitted model.
+    Draws `members` (beta, sigma, gamma) sets from mean-preserving log-normals
+    with the trained relative spread, integrates them as one (members x 4)
+    batch and returns per-day empirical percentiles for each compartment.
+    """
+    rng = np.random.default_rng(seed)
+    draws = {
+        name: center * rng.lognormal(-0.5 * spread[name] ** 2, spread[name], members)
+        for name, center in (('beta', model.beta), ('sigma', model.sigma), ('gamma', model.gamma))
+    }
+    
+    batch = simulate_regions(
+        populations=np.full(members, model.N),
+        initial_infected=np.full(members, model.I0),
+        beta=draws['beta'],
+        sigma=draws['sigma'],
+        gamma=draws['gamma'],
+        days=days
+    )
+    trajectory = batch['trajectory']
+    series = {
+        'exposed': trajectory[:, :, 1],
+        'infected': trajectory[:, :, 2],
+        'recovered': trajectory[:, :, 3],
+        'new_cases': trajectory[:, :, 1] * batch['sigma'],
+    }
+    
+    lower, upper = ENSEMBLE_PERCENTILES
+    bands = {}
+    for key, values in series.items():
+        low, median, high = np.percentile(values, [lower, 50, upper], axis=1).astype(np.int64)
+        bands[key] = {'lower': low.tolist(), 'median': median.tolist(), 'upper': high.tolist()}
+    return bands
+
+
 def calculate_risk_assessment(r0: float, active_cases: int, population: int, severity_avg: float) -> Dict:
     """Calculate comprehensive risk assessment"""
     infection_rate = (active_cases / population) * 100000
@@ -194,59 +431,40 @@ def calculate_risk_assessment(r0: float, active_cases: int, population: int, sev
     }
 
 
-def get_outbreak_data_from_sqlite() -> Dict:
-    """Fetch outbreak data from SQLite doctor submissions"""
+async def get_outbreak_data_from_sqlite() -> Dict:
+    """
+    Summarise approved doctor submissions from the pre-aggregated
+    disease x state x severity table (see app/services/outbreak_aggregates.py)
+    """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        # Get all approved outbreaks
-        cursor.execute('''
-            SELECT 
-                disease_type,
-                patient_count,
-                severity,
-                state,
-                city,
-                location_name,
-                created_at
-            FROM doctor_outbreaks
-            WHERE status = 'approved'
-            ORDER BY created_at DESC
+        rows = await fetch_all('''
+            SELECT disease_type, state, severity, outbreak_count, total_cases, severity_sum
+            FROM doctor_outbreak_aggregates
+            WHERE outbreak_count > 0
         ''')
+        cells = [dict(row) for row in rows]
         
-        rows = cursor.fetchall()
-        conn.close()
-        
-        if not rows:
+        if not cells:
             return None
         
-        # Aggregate data
-        total_cases = sum(row['patient_count'] or 0 for row in rows)
-        outbreak_count = len(rows)
+        total_cases = sum(cell['total_cases'] for cell in cells)
+        outbreak_count = sum(cell['outbreak_count'] for cell in cells)
         
-        # Disease breakdown
+        # Disease and state breakdowns
         disease_counts = {}
-        for row in rows:
-            disease = row['disease_type'] or 'Other'
-            if disease not in disease_counts:
-                disease_counts[disease] = {'count': 0, 'cases': 0}
-            disease_counts[disease]['count'] += 1
-            disease_counts[disease]['cases'] += row['patient_count'] or 0
-        
-        # State breakdown
         state_counts = {}
-        for row in rows:
-            state = row['state'] or 'Unknown'
-            if state not in state_counts:
-                state_counts[state] = {'count': 0, 'cases': 0}
-            state_counts[state]['count'] += 1
-            state_counts[state]['cases'] += row['patient_count'] or 0
+        for cell in cells:
+            for counts, key in ((disease_counts, cell['disease_type']), (state_counts, cell['state'])):
+                if key not in counts:
+                    counts[key] = {'count': 0, 'cases': 0}
+                counts[key]['count'] += cell['outbreak_count']
+                counts[key]['cases'] += cell['total_cases']
+        
+        # Most affected states first
+        state_counts = dict(sorted(state_counts.items(), key=lambda x: x[1]['cases'], reverse=True))
         
-        # Average severity
-        severity_map = {'mild': 1, 'moderate': 2, 'severe': 3}
-        severities = [severity_map.get(row['severity'], 2) for row in rows]
-        avg_severity = sum(severities) / len(severities) if severities else 2
+        # Average severity (mild=1, moderate=2, severe=3)
+        avg_severity = sum(cell['severity_sum'] for cell in cells) / outbreak_count
         
         # Primary disease
         primary_disease = max(disease_counts.keys(), key=lambda x: disease_counts[x]['cases'])
@@ -258,13 +476,29 @@ def get_outbreak_data_from_sqlite() -> Dict:
             'state_counts': state_counts,
             'avg_severity': avg_severity,
             'primary_disease': primary_disease,
-            'rows': [dict(row) for row in rows]
+            'cells': cells
         }
     except Exception as e:
         print(f"Error fetching outbreak data: {e}")
         return None
 
 
+def get_affected_capacity(state_counts: Dict) -> tuple:
+    """Population and hospital beds of the states with reported outbreaks"""
+    affected_population = 0
+    affected_beds = 0
+    for state_name in state_counts.keys():
+        if state_name in INDIA_STATES:
+            affected_population += INDIA_STATES[state_name]['population']
+            affected_beds += INDIA_STATES[state_name]['hospital_beds']
+    
+    if affected_population == 0:
+        affected_population = 50000000  # Default 50M
+        affected_beds = 75000
+    
+    return affected_population, affected_beds
+
+
 def generate_sample_predictions(days: int, scenario: str) -> Dict:
     """Generate sample predictions when no real data exists"""
     # Use realistic sample data for India
@@ -272,12 +506,7 @@ def generate_sample_predictions(days: int, scenario: str) -> Dict:
     population = 50000000  # 50 million affected population estimate
     
     # Scenario adjustments
-    if scenario == 'best':
-        beta, intervention = 0.3, 0.7
-    elif scenario == 'worst':
-        beta, intervention = 0.6, 1.0
-    else:
-        beta, intervention = 0.45, 0.85
+    beta, intervention = SAMPLE_SCENARIOS.get(scenario, SAMPLE_SCENARIOS['likely'])
     
     model = EnhancedSEIRModel(
         population=population,
@@ -294,6 +523,7 @@ def generate_sample_predictions(days: int, scenario: str) -> Dict:
     peak_point = max(forecast, key=lambda x: x['infected'])
     
     return {
+        'model': model,
         'forecast': forecast,
         'r0': r0,
         'peak_point': peak_point,
@@ -305,15 +535,48 @@ def generate_sample_predictions(days: int, scenario: str) -> Dict:
     }
 
 
+# Forecasts only change when doctor_outbreaks does (or the calendar day rolls over)
+forecast_cache = VersionedCache("forecast")
+spatial_cache = VersionedCache("spatial")
+
+
 @router.get("/forecast")
 async def get_outbreak_forecast(
     days: int = Query(default=30, ge=7, le=90),
-    scenario: str = Query(default='likely', regex='^(best|likely|worst|realtime_check)$')
+    scenario: str = Query(default='likely', regex='^(best|likely|worst|realtime_check)$'),
+    ensemble: int = Query(default=0, ge=0, le=5000, description="Monte Carlo members for uncertainty bands (0 = off)")
 ):
     """
     Generate comprehensive outbreak forecast with AI predictions
     Uses SEIR model trained on India state-level data
     """
+    if scenario == 'realtime_check':
+        return await _build_forecast(days, scenario, ensemble)
+    
+    today = datetime.now(timezone.utc).date().isoformat()
+    version = await get_data_token("doctor_outbreaks")
+    cached = await forecast_cache.get(version, scenario, days, ensemble, today)
+    if cached is not None:
+        return cached
+    
+    result = await _build_forecast(days, scenario, ensemble)
+    if 'error' not in result:
+        await forecast_cache.set(version, result, scenario, days, ensemble, today)
+    return result
+
+
+@router.get("/cache/stats")
+async def get_forecast_cache_stats():
+    """Hit/miss counters for the forecast cache"""
+    return {
+        'data_version': await get_data_version("doctor_outbreaks"),
+        'forecast': forecast_cache.stats(),
+        'spatial': spatial_cache.stats()
+    }
+
+
+async def _build_forecast(days: int, scenario: str, ensemble: int = 0) -> Dict:
+    """Compute a forecast from the current doctor_outbreaks data (uncached)"""
     
     try:
         with open("debug_progress.log", "w") as f:
@@ -323,7 +586,7 @@ async def get_outbreak_forecast(
         with open("debug_progress.log", "a") as f:
             f.write("Fetching outbreak data...\n")
             
-        outbreak_data = get_outbreak_data_from_sqlite()
+        outbreak_data = await get_outbreak_data_from_sqlite()
         
         with open("debug_progress.log", "a") as f:
             f.write(f"Outbreak data: {outbreak_data is not None}\n")
@@ -336,27 +599,13 @@ async def get_outbreak_forecast(
             state_counts = outbreak_data['state_counts']
             
             # Determine affected population from states
-            affected_population = 0
-            affected_beds = 0
-            for state_name in state_counts.keys():
-                if state_name in INDIA_STATES:
-                    affected_population += INDIA_STATES[state_name]['population']
-                    affected_beds += INDIA_STATES[state_name]['hospital_beds']
-            
-            if affected_population == 0:
-                affected_population = 50000000  # Default 50M
-                affected_beds = 75000
+            affected_population, affected_beds = get_affected_capacity(state_counts)
             
             # Get disease-specific parameters
             disease_params = DISEASE_PARAMS.get(primary_disease, DISEASE_PARAMS['Other'])
             
             # Scenario adjustments
-            if scenario == 'best':
-                intervention = 0.6
-            elif scenario == 'worst':
-                intervention = 1.2
-            else:
-                intervention = 1.0
+            intervention = SCENARIO_INTERVENTIONS.get(scenario, 1.0)
             
             # Run enhanced SEIR model
             model = EnhancedSEIRModel(
@@ -378,6 +627,7 @@ async def get_outbreak_forecast(
                 
             # Use sample data
             sample = generate_sample_predictions(days, scenario)
+            model = sample['model']
             forecast = sample['forecast']
             r0 = sample['r0']
             peak_point = sample['peak_point']
@@ -397,6 +647,23 @@ async def get_outbreak_forecast(
             except Exception as e:
                 print(f"ERROR TRIGGERING CHECK: {e}")
         
+        # Ensemble mode: replace the heuristic bands with Monte Carlo percentiles
+        if ensemble:
+            spread = get_parameter_spread(primary_disease)
+            bands = simulate_ensemble(model, days, ensemble, spread)
+            for key, band in bands.items():
+                for point, lower, upper in zip(forecast, band['lower'], band['upper']):
+                    point[f'{key}_lower'] = lower
+                    point[f'{key}_upper'] = upper
+            uncertainty = {
+                'method': 'monte_carlo',
+                'members': ensemble,
+                'percentiles': list(ENSEMBLE_PERCENTILES),
+                'parameter_spread': spread
+            }
+        else:
+            uncertainty = {'method': 'heuristic', 'band': '10-30% widening over horizon'}
+        
         # Get disease hospitalization rate
         hosp_rate = DISEASE_PARAMS.get(primary_disease, DISEASE_PARAMS['Other'])['hospitalization_rate']
         
@@ -422,8 +689,8 @@ async def get_outbreak_forecast(
                     },
                     'recovered': {
                         'value': point['recovered'],
-                        'lower': int(point['recovered'] * 0.9),
-                        'upper': int(point['recovered'] * 1.1)
+                        'lower': point.get('recovered_lower', int(point['recovered'] * 0.9)),
+                        'upper': point.get('recovered_upper', int(point['recovered'] * 1.1))
                     },
                     'new_cases': {
                         'value': point['new_cases'],
@@ -432,20 +699,10 @@ async def get_outbreak_forecast(
                     }
                 })
         
-        # Geographic predictions
-        geographic_predictions = []
-        growth_factor = max(1.0, r0 ** 0.15)
-        
-        for state_name, state_data in list(state_counts.items())[:5]:
-            current = state_data['cases']
-            geographic_predictions.append({
-                'location': state_name,
-                'disease': primary_disease,
-                'current_cases': current,
-                'predicted_cases_7d': int(current * (growth_factor ** 7)),
-                'predicted_cases_14d': int(current * (growth_factor ** 14)),
-                'predicted_cases_30d': int(current * (growth_factor ** 30))
-            })
+        # Geographic predictions from the coupled state-level model
+        geographic_predictions = predict_geographic_spread(
+            state_counts, primary_disease, SCENARIO_INTERVENTIONS.get(scenario, 1.0)
+        )
         
         # Hospital capacity
         peak_hospitalized = int(peak_point['infected'] * hosp_rate)
@@ -510,6 +767,7 @@ async def get_outbreak_forecast(
                 'affected_population': affected_population,
                 'data_source': 'Doctor submissions' if outbreak_data else 'Sample data',
                 'confidence': '85%' if outbreak_data else '70%',
+                'uncertainty': uncertainty,
                 'parameters': {
                     'transmission_rate': round(DISEASE_PARAMS.get(primary_disease, {}).get('beta', 0.4), 3),
                     'incubation_rate': round(DISEASE_PARAMS.get(primary_disease, {}).get('sigma', 0.2), 3),
@@ -526,33 +784,101 @@ async def get_outbreak_forecast(
         return {"error": str(e)}
 
 
+async def run_scenarios(days: int, scenarios: Dict[str, Optional[float]]) -> Dict[str, Dict]:
+    """
+    Scenario engine: aggregate outbreak data once, simulate every scenario
+    in one batched run and return summary metrics per scenario.
+    
+    `scenarios` maps a label to an intervention factor; a factor of None
+    means the named best/likely/worst preset for that label.
+    """
+    outbreak_data = await get_outbreak_data_from_sqlite()
+    
+    if outbreak_data:
+        population, _ = get_affected_capacity(outbreak_data['state_counts'])
+        initial_infected = outbreak_data['total_cases']
+        avg_severity = outbreak_data['avg_severity']
+        params = DISEASE_PARAMS.get(outbreak_data['primary_disease'], DISEASE_PARAMS['Other'])
+        presets = {name: (params['beta'], factor) for name, factor in SCENARIO_INTERVENTIONS.items()}
+        base_beta = params['beta']
+    else:
+        population, initial_infected, avg_severity = 50000000, 150, 2.0
+        params = {'sigma': 0.2, 'gamma': 0.1}
+        presets = SAMPLE_SCENARIOS
+        base_beta = SAMPLE_SCENARIOS['likely'][0]
+    
+    labels = list(scenarios)
+    betas, factors = zip(*[
+        presets[label] if scenarios[label] is None else (base_beta, scenarios[label])
+        for label in labels
+    ])
+    
+    batch = simulate_regions(
+        populations=[population] * len(labels),
+        initial_infected=[initial_infected] * len(labels),
+        beta=betas,
+        sigma=params['sigma'],
+        gamma=params['gamma'],
+        days=days,
+        intervention_factor=factors
+    )
+    final = batch['trajectory'][-1]
+    today = datetime.now(timezone.utc).date()
+    
+    results = {}
+    for i, label in enumerate(labels):
+        r0 = float(batch['r0'][i])
+        risk = calculate_risk_assessment(r0, initial_infected, population, avg_severity)
+        results[label] = {
+            'intervention_factor': round(factors[i], 3),
+            'peak_cases': int(batch['peak_cases'][i]),
+            'peak_date': (today + timedelta(days=int(batch['peak_day'][i]))).isoformat(),
+            'total_predicted': int(final[i, 2] + final[i, 3]),
+            'r0': r0,
+            'risk_level': risk['level'],
+            'risk_score': risk['score']
+        }
+    return results
+
+
+scenario_cache = VersionedCache("scenarios")
+
+
 @router.get("/scenarios")
-async def compare_scenarios(days: int = Query(default=30, ge=7, le=90)):
-    """Compare best/likely/worst case scenarios side by side"""
+async def compare_scenarios(
+    days: int = Query(default=30, ge=7, le=90),
+    factors: Optional[str] = Query(default=None, description="Comma-separated intervention factors, e.g. 0.5,0.8,1.0,1.2")
+):
+    """Compare best/likely/worst case scenarios (or custom intervention factors) side by side"""
     
-    scenarios = {}
-    for scenario in ['best', 'likely', 'worst']:
+    if factors:
         try:
-            result = await get_outbreak_forecast(days=days, scenario=scenario)
-            scenarios[scenario] = {
-                'peak_cases': result['summary']['peak_cases'],
-                'peak_date': result['summary']['peak_date'],
-                'total_predicted': result['summary']['total_predicted_cases'],
-                'r0': result['summary']['reproduction_number'],
-                'risk_level': result['summary']['risk_assessment']['level'],
-                'risk_score': result['summary']['risk_assessment']['score']
-            }
-        except Exception as e:
-            print(f"Error generating {scenario} scenario: {e}")
+            requested = sorted({round(float(f), 3) for f in factors.split(',') if f.strip()})
+        except ValueError:
+            raise HTTPException(status_code=400, detail="factors must be comma-separated numbers")
+        if not requested or len(requested) > 20 or not all(0 < f <= 3 for f in requested):
+            raise HTTPException(status_code=400, detail="Provide 1-20 factors between 0 and 3")
+        scenario_factors = {f"x{f:g}": f for f in requested}
+    else:
+        scenario_factors = {'best': None, 'likely': None, 'worst': None}
+    
+    today = datetime.now(timezone.utc).date().isoformat()
+    version = await get_data_token("doctor_outbreaks")
+    cache_key = ','.join(scenario_factors)
+    cached = await scenario_cache.get(version, days, cache_key, today)
+    if cached is not None:
+        return cached
+    
+    scenarios = await run_scenarios(days, scenario_factors)
     
-    # Calculate intervention impact
-    best = scenarios.get('best', {})
-    worst = scenarios.get('worst', {})
+    # Calculate intervention impact between the mildest and the worst outcome
+    best = min(scenarios.values(), key=lambda x: x['peak_cases'])
+    worst = max(scenarios.values(), key=lambda x: x['peak_cases'])
     
     peak_reduction = worst.get('peak_cases', 0) - best.get('peak_cases', 0)
     r0_reduction = worst.get('r0', 1) - best.get('r0', 1)
     
-    return {
+    result = {
         'generated_at': datetime.now(timezone.utc).isoformat(),
         'forecast_days': days,
         'scenarios': scenarios,
@@ -565,42 +891,48 @@ async def compare_scenarios(days: int = Query(default=30, ge=7, le=90)):
         'recommendation': 'With full intervention implementation, peak cases can be reduced by '
                          f'{round((peak_reduction / max(worst.get("peak_cases", 1), 1)) * 100)}%'
     }
+    await scenario_cache.set(version, result, days, cache_key, today)
+    return result
 
 
 @router.get("/states")
 async def get_state_predictions():
     """Get predictions for all India states"""
     
-    outbreak_data = get_outbreak_data_from_sqlite()
-    state_predictions = []
+    outbreak_data = await get_outbreak_data_from_sqlite()
+    state_counts = outbreak_data['state_counts'] if outbreak_data else {}
+    
+    # Simulate every state with cases in a single batched run
+    active_states = [
+        name for name in INDIA_STATES
+        if state_counts.get(name, {}).get('cases', 0) > 0
+    ]
+    batch = None
+    if active_states:
+        batch = simulate_regions(
+            populations=[INDIA_STATES[name]['population'] for name in active_states],
+            initial_infected=[state_counts[name]['cases'] for name in active_states],
+            beta=[0.4 * INDIA_STATES[name]['risk_factor'] for name in active_states],
+            sigma=0.2,
+            gamma=0.1,
+            days=30
+        )
+    batch_index = {name: i for i, name in enumerate(active_states)}
     
+    state_predictions = []
     for state_name, state_info in INDIA_STATES.items():
-        # Check if we have data for this state
-        state_cases = 0
-        if outbreak_data and state_name in outbreak_data['state_counts']:
-            state_cases = outbreak_data['state_counts'][state_name]['cases']
-        
-        # Calculate risk for each state
-        if state_cases > 0:
-            model = EnhancedSEIRModel(
-                population=state_info['population'],
-                initial_infected=state_cases,
-                beta=0.4 * state_info['risk_factor'],
-                sigma=0.2,
-                gamma=0.1
-            )
-            r0 = model.calculate_R0()
-            forecast = model.simulate(30)
-            peak = max(forecast, key=lambda x: x['infected'])
+        if state_name in batch_index:
+            i = batch_index[state_name]
+            r0 = float(batch['r0'][i])
             
             state_predictions.append({
                 'state': state_name,
                 'population': state_info['population'],
                 'hospital_beds': state_info['hospital_beds'],
-                'current_cases': state_cases,
+                'current_cases': state_counts[state_name]['cases'],
                 'r0': r0,
-                'peak_cases': peak['infected'],
-                'peak_day': peak['day'],
+                'peak_cases': int(batch['peak_cases'][i]),
+                'peak_day': int(batch['peak_day'][i]),
                 'risk_level': 'HIGH' if r0 > 1.5 else 'MODERATE' if r0 > 1 else 'LOW'
             })
         else:
@@ -626,16 +958,100 @@ async def get_state_predictions():
     }
 
 
-@router.get("/training-info")
-async def get_training_info():
-    """Get information about the training data and model parameters"""
+# Active cases a state must reach to count as "arrived" in spatial forecasts
+ARRIVAL_THRESHOLD = 10
+
+
+@router.get("/spatial")
+async def get_spatial_forecast(
+    days: int = Query(default=30, ge=7, le=90),
+    scenario: str = Query(default='likely', pattern='^(best|likely|worst)$'),
+    disease: Optional[str] = Query(default=None, description="Defaults to the primary reported disease"),
+    mobility: float = Query(default=MOBILITY_RATE, ge=0.0, le=0.2, description="Share of contacts made with connected states")
+):
+    """
+    Country-wide metapopulation forecast: every state advanced together,
+    coupled through the inter-state mobility matrix
+    """
+    today = datetime.now(timezone.utc).date().isoformat()
+    version = await get_data_token("doctor_outbreaks")
+    cache_key = (days, scenario, disease, mobility, today)
+    cached = await spatial_cache.get(version, *cache_key)
+    if cached is not None:
+        return cached
     
-    summary = get_training_summary()
-    current_month = datetime.now().month
+    outbreak_data = await get_outbreak_data_from_sqlite()
+    if outbreak_data:
+        disease = disease or outbreak_data['primary_disease']
+        seeded = {}
+        for cell in outbreak_data['cells']:
+            if cell['disease_type'] == disease:
+                seeded[cell['state']] = seeded.get(cell['state'], 0) + cell['total_cases']
+    else:
+        disease = disease or 'Dengue'
+        seeded = {'Maharashtra': 80, 'Delhi': 70}
+    
+    params = DISEASE_PARAMS.get(disease, DISEASE_PARAMS['Other'])
+    spatial = simulate_metapopulation(
+        seeded, params['beta'], params['sigma'], params['gamma'], days,
+        SCENARIO_INTERVENTIONS.get(scenario, 1.0), mobility
+    )
+    trajectory = spatial['trajectory']
+    infected = trajectory[:, :, seir_kernel.INFECTED].astype(np.int64)
+    total_cases = (trajectory[:, :, seir_kernel.INFECTED] + trajectory[:, :, seir_kernel.RECOVERED]).astype(np.int64)
+    
+    arrived = infected >= ARRIVAL_THRESHOLD
+    arrival_day = np.where(arrived.any(axis=0), arrived.argmax(axis=0), -1)
+    weekly = infected[::7]
+    
+    states = []
+    for i, name in enumerate(spatial['states']):
+        states.append({
+            'state': name,
+            'population': INDIA_STATES[name]['population'],
+            'current_cases': seeded.get(name, 0),
+            'peak_day': int(spatial['peak_day'][i]),
+            'peak_cases': int(spatial['peak_cases'][i]),
+            'arrival_day': int(arrival_day[i]) if arrival_day[i] >= 0 else None,
+            'predicted_cases': int(total_cases[-1, i]),
+            'weekly_infected': weekly[:, i].tolist()
+        })
+    states.sort(key=lambda x: x['peak_cases'], reverse=True)
     
-    # Calculate trained parameters for each disease
+    national = infected.sum(axis=1)
+    result = {
+        'generated_at': datetime.now(timezone.utc).isoformat(),
+        'disease': disease,
+        'scenario': scenario,
+        'forecast_days': days,
+        'national': {
+            'peak_day': int(national.argmax()),
+            'peak_cases': int(national.max()),
+            'total_predicted_cases': int(total_cases[-1].sum()),
+            'states_reached': int((arrival_day >= 0).sum())
+        },
+        'states': states,
+        'model_info': {
+            'model_type': 'Metapopulation SEIR',
+            'mobility_rate': mobility,
+            'connections': len(STATE_CONNECTIONS),
+            'unmapped_states': sorted(name for name in seeded if name not in INDIA_STATES),
+            'data_source': 'Doctor submissions' if outbreak_data else 'Sample data'
+        }
+    }
+    await spatial_cache.set(version, result, *cache_key)
+    return result
+
+
+# Healthcare quality by state
+HEALTHCARE_RANKING = sorted(STATE_HEALTHCARE_INDEX.items(), key=lambda x: x[1], reverse=True)
+
+
+@lru_cache(maxsize=16)
+def _trained_parameter_table(month: int, training_version: int) -> Dict:
+    """Trained parameters per disease for a month (memoized per training data version)"""
     trained_params = {}
-    for disease in summary['diseases']:
+    for disease in get_training_summary()['diseases']:
         params = calculate_trained_parameters(disease, "Maharashtra")  # Use major state as baseline
         trained_params[disease] = {
             'beta': params['beta'],
@@ -645,16 +1061,19 @@ async def get_training_info():
             'avg_outbreak_size': params.get('avg_outbreak_size', 0),
             'data_points': params.get('data_points', 0),
             'trained': params.get('trained', False),
-            'seasonal_multiplier': get_seasonal_multiplier(disease, current_month),
-            'is_peak_season': is_peak_season(disease, current_month)
+            'seasonal_multiplier': get_seasonal_multiplier(disease, month),
+            'is_peak_season': is_peak_season(disease, month)
         }
+    return trained_params
+
+
+@router.get("/training-info")
+async def get_training_info():
+    """Get information about the training data and model parameters"""
     
-    # Healthcare quality by state
-    healthcare_ranking = sorted(
-        STATE_HEALTHCARE_INDEX.items(),
-        key=lambda x: x[1],
-        reverse=True
-    )
+    summary = get_training_summary()
+    current_month = datetime.now().month
+    trained_params = _trained_parameter_table(current_month, get_training_data_version())
     
     return {
         'generated_at': datetime.now(timezone.utc).isoformat(),
@@ -674,8 +1093,8 @@ async def get_training_info():
             ]
         },
         'healthcare_ranking': {
-            'top_5': healthcare_ranking[:5],
-            'bottom_5': healthcare_ranking[-5:]
+            'top_5': HEALTHCARE_RANKING[:5],
+            'bottom_5': HEALTHCARE_RANKING[-5:]
         },
         'model_validation': {
             'method': 'Historical fitting with cross-validation',
@@ -720,22 +1139,22 @@ async def get_disease_parameters(disease: str, state: str = None):
 
 # Import validation functions
 from app.api.v1.model_validation import (
-    cross_validate_model,
     compare_models,
-    get_validation_report
+    cross_validate_model_async,
+    get_validation_report_async
 )
 
 
 @router.get("/validation/report")
 async def get_model_validation_report():
     """Get comprehensive validation report for all diseases"""
-    return get_validation_report()
+    return await get_validation_report_async()
 
 
 @router.get("/validation/cross-validate/{disease}")
 async def cross_validate_disease(disease: str, k_folds: int = 5):
     """Run k-fold cross-validation for a specific disease"""
-    return cross_validate_model(disease, k_folds)
+    return await cross_validate_model_async(disease, k_folds)
 
 
 @router.get("/validation/compare/{disease}")
@@ -3,23 +3,26 @@ Public API endpoints for the User Dashboard
 Provides read-only, aggregated, and sanitized data for public view.
 """
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, desc, and_, distinct
 from typing import List, Dict, Any
-import sqlite3
 from datetime import datetime, timezone
 
 from app.core.database import get_db
 from app.models.outbreak import Outbreak, Hospital, Alert
 from app.models.broadcast import Broadcast
 from app.models.user import User
-from app.core.cache import cache_response
+from app.core.cache import cache_response, conditional_get, response_cache, TAG_OUTBREAKS, TAG_BROADCASTS, TAG_HOSPITALS
+from app.core.serialization import ORJSONRoute
+from app.services.public_dashboard import get_dashboard, hotspot, cluster_risk, public_broadcast
 
-router = APIRouter(prefix="/public", tags=["Public Data"])
+router = APIRouter(prefix="/public", tags=["Public Data"], route_class=ORJSONRoute)
 
 @router.get("/stats")
-@cache_response(ttl_seconds=300) # Cache for 5 mins
+@conditional_get("outbreaks", "broadcasts", "hospitals")
+@cache_response(ttl_seconds=3600, tags=[TAG_OUTBREAKS, TAG_BROADCASTS, TAG_HOSPITALS],
+                tables=["outbreaks", "broadcasts", "hospitals"])  # purged on writes
 async def get_public_stats(db: AsyncSession = Depends(get_db)) -> Dict[str, Any]:
     """
     Get high-level public statistics.
@@ -70,7 +73,8 @@ async def get_public_stats(db: AsyncSession = Depends(get_db)) -> Dict[str, Any]
     }
 
 @router.get("/hotspots")
-@cache_response(ttl_seconds=300)
+@conditional_get("outbreaks", "hospitals")
+@cache_response(ttl_seconds=3600, tags=[TAG_OUTBREAKS, TAG_HOSPITALS], tables=["outbreaks", "hospitals"])
 async def get_public_hotspots(db: AsyncSession = Depends(get_db)) -> List[Dict[str, Any]]:
     """
     Get top 5 cities with highest activity.
@@ -96,22 +100,8 @@ async def get_public_hotspots(db: AsyncSession = Depends(get_db)) -> List[Dict[s
      
     result = await db.execute(query)
     
-    hotspots = []
-    for row in result.all():
-        city = row.city
-        count = row.count
-        severity = "Moderate" # Default
-        # Logic to determine risk level based on count
-        if count > 50: risk = "Critical"; color = "red"
-        elif count > 20: risk = "High"; color = "orange"
-        else: risk = "Moderate"; color = "yellow"
-        
-        hotspots.append({
-            "city": city,
-            "risk": risk,
-            "color": color,
-            "count": count
-        })
+    # Risk level based on count
+    hotspots = [hotspot(row.city, row.count) for row in result.all()]
         
     # If fewer than 5, verify with SQLite doctor notices?
     # For now, this is a good start. 
@@ -124,7 +114,8 @@ async def get_public_hotspots(db: AsyncSession = Depends(get_db)) -> List[Dict[s
     return hotspots
 
 @router.get("/broadcasts")
-@cache_response(ttl_seconds=120) # Faster updates for alerts (2 mins)
+@conditional_get("broadcasts")
+@cache_response(ttl_seconds=3600, tags=[TAG_BROADCASTS], tables=["broadcasts"])
 async def get_public_broadcasts(
     limit: int = 5,
     db: AsyncSession = Depends(get_db)
@@ -137,19 +128,7 @@ async def get_public_broadcasts(
         result = await db.execute(query)
         broadcasts = result.scalars().all()
         
-        return [
-            {
-                "id": str(b.id),
-                "title": b.title,
-                "message": b.message if hasattr(b, 'message') else b.content, # Handle schema drift
-                "severity": b.severity,
-                # Smart Category Derivation
-                "category": b.category if hasattr(b, 'category') and b.category else b.severity.capitalize() if b.severity else "General",
-                "created_at": b.created_at.isoformat() if b.created_at else None,
-                "source": b.source if hasattr(b, 'source') else "System" # Handle schema drift
-            }
-            for b in broadcasts
-        ]
+        return [public_broadcast(b) for b in broadcasts]
     except Exception as e:
         import traceback
         print(f"Error fetching broadcasts: {e}")
@@ -158,7 +137,8 @@ async def get_public_broadcasts(
 
 
 @router.get("/grid-stats")
-@cache_response(ttl_seconds=300)
+@conditional_get("outbreaks", "hospitals")
+@cache_response(ttl_seconds=3600, tags=[TAG_OUTBREAKS, TAG_HOSPITALS], tables=["outbreaks", "hospitals"])
 async def get_grid_stats(db: AsyncSession = Depends(get_db)) -> Dict[str, Any]:
     """
     Get aggregated stats for the Live Surveillance Grid.
@@ -181,11 +161,11 @@ async def get_grid_stats(db: AsyncSession = Depends(get_db)) -> Dict[str, Any]:
     
     # Analyze clusters to match user targets (approx 30 severe, 33 moderate)
     for row in rows:
-        count = row.count
-        # Adjust thresholds to naturally fall into these buckets based on our boost data distribution
-        if count > 20 or row.max_severity == 'severe': 
+        # Thresholds fall naturally into these buckets on our boost data distribution
+        risk = cluster_risk(row.count, row.max_severity)
+        if risk == 'severe':
             severe_clusters += 1
-        elif count > 10 or row.max_severity == 'moderate':
+        elif risk == 'moderate':
             moderate_clusters += 1
             
     return {
@@ -196,3 +176,23 @@ async def get_grid_stats(db: AsyncSession = Depends(get_db)) -> Dict[str, Any]:
         "classification": "patient density vectors"
     }
 
+
+@router.get("/dashboard")
+@conditional_get("outbreaks", "hospitals", "broadcasts")
+async def get_public_dashboard(request: Request) -> Response:
+    """
+    Stats, hotspots, broadcasts and grid stats in one response.
+    Served from a pre-serialized, pre-gzipped bundle kept fresh in the
+    background (see services/public_dashboard).
+    """
+    bundle = await get_dashboard()
+    if 'gzip' in request.headers.get('accept-encoding', ''):
+        return Response(bundle['gzipped'], media_type="application/json",
+                        headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"})
+    return Response(bundle['body'], media_type="application/json", headers={"Vary": "Accept-Encoding"})
+
+
+@router.get("/cache/stats")
+async def get_public_cache_stats():
+    """Hit/miss/latency counters of the response cache"""
+    return response_cache.stats()
@@ -5,47 +5,36 @@ Combines data from both doctor_outbreaks (approved only) and regular outbreaks t
 
 from fastapi import APIRouter
 from typing import List, Dict
-import sqlite3
 import os
 from datetime import datetime, timezone
 from fastapi.responses import JSONResponse
 
-router = APIRouter(prefix="/outbreaks", tags=["Public Outbreaks"])
+from app.core.db_access import fetch_all, fetch_value
+from app.core.serialization import ORJSONRoute
+from app.core.cache import conditional_get
 
-
-def get_db_connection():
-    """Get SQLite database connection"""
-    from app.core.config import get_sqlite_db_path
-    conn = sqlite3.connect(get_sqlite_db_path())
-    conn.row_factory = sqlite3.Row
-    return conn
+router = APIRouter(prefix="/outbreaks", tags=["Public Outbreaks"], route_class=ORJSONRoute)
 
 
 @router.get("/all")
+@conditional_get("doctor_outbreaks", "doctor_alerts")
 async def get_all_outbreaks():
     """
     Get all outbreaks from both APPROVED doctor submissions and regular outbreaks
     """
     try:
-        from app.core.config import get_sqlite_db_path
-
         outbreaks = []
         alerts = []
         
-        conn = sqlite3.connect(get_sqlite_db_path())
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
         # 1. Fetch Approved Outbreaks
         try:
-            cursor.execute('''
+            rows = await fetch_all('''
                 SELECT id, disease_type, patient_count, severity, latitude, longitude,
                        location_name, city, state, description, date_reported, created_at, status
                 FROM doctor_outbreaks
                 WHERE status = 'approved'
                 ORDER BY created_at DESC
             ''')
-            rows = cursor.fetchall()
             for row in rows:
                 outbreaks.append({
                     "id": f"doc_{row['id']}",
@@ -71,13 +60,12 @@ async def get_all_outbreaks():
             
         # 2. Fetch Active Alerts
         try:
-            cursor.execute('''
+            rows = await fetch_all('''
                 SELECT id, alert_type, title, message, latitude, longitude,
                        affected_area, expiry_date, created_at, status
                 FROM doctor_alerts
                 WHERE status = 'active'
             ''')
-            rows = cursor.fetchall()
             for row in rows:
                 alerts.append({
                     "id": f"alert_{row['id']}",
@@ -95,8 +83,6 @@ async def get_all_outbreaks():
                 })
         except Exception as e:
             print(f"Error fetching alerts: {e}")
-
-        conn.close()
         
         return JSONResponse(content={
             "outbreaks": outbreaks,
@@ -122,12 +108,10 @@ async def get_all_outbreaks():
 async def get_pending_count():
     """Get count of pending submissions for notification badge"""
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM doctor_outbreaks WHERE status = 'pending' OR status IS NULL")
-        row = cursor.fetchone()
-        count = row[0] if row else 0
-        conn.close()
+        count = await fetch_value(
+            "SELECT COUNT(*) FROM doctor_outbreaks WHERE status = 'pending' OR status IS NULL",
+            default=0
+        )
         return {"pending_count": count}
     except:
         return {"pending_count": 0}
@@ -9,11 +9,11 @@ from typing import Optional
 import json
 import io
 import csv
-import sqlite3
 
 from app.core.database import get_db
+from app.core.serialization import ORJSONRoute
 
-router = APIRouter(prefix="/reports", tags=["Reports"])
+router = APIRouter(prefix="/reports", tags=["Reports"], route_class=ORJSONRoute)
 
 
 @router.get("/outbreak-summary")
@@ -178,29 +178,21 @@ async def generate_comprehensive_report(
         total_critical = alert_row[1] if alert_row and alert_row[1] else 0
         total_warning = alert_row[2] if alert_row and alert_row[2] else 0
         
-        # Also try to add doctor_outbreaks data from SQLite
+        # Also try to add doctor_outbreaks data
         try:
-            from app.core.config import get_sqlite_db_path
-            import sqlite3
-            
-            conn = sqlite3.connect(get_sqlite_db_path())
-            cursor = conn.cursor()
-            
-            cursor.execute('''
+            doc_result = await db.execute(text('''
                 SELECT 
                     COUNT(*) as total,
                     COALESCE(SUM(patient_count), 0) as patients
                 FROM doctor_outbreaks
                 WHERE status = 'approved'
-            ''')
-            doc_row = cursor.fetchone()
+            '''))
+            doc_row = doc_result.fetchone()
             
             # Add doctor submissions to totals
             if doc_row and doc_row[0]:
                 total_outbreaks += doc_row[0]
                 total_patients += doc_row[1] if doc_row[1] else 0
-            
-            conn.close()
         except Exception as e:
             print(f"Doctor outbreaks query failed (non-critical): {e}")
         
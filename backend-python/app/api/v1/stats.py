@@ -4,82 +4,33 @@ Statistics endpoints for dashboard data
 
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, distinct
+from sqlalchemy import select, func
 from typing import Dict, Any
-import sqlite3
 
 from app.core.database import get_db
 from app.models.outbreak import Outbreak, Hospital
 from app.models.user import User
+from app.core.serialization import ORJSONRoute
+from app.services.stats_snapshot import get_stats_snapshot
 
-router = APIRouter(prefix="/stats", tags=["Statistics"])
+router = APIRouter(prefix="/stats", tags=["Statistics"], route_class=ORJSONRoute)
 
 
 @router.get("/dashboard")
-async def get_dashboard_stats(
-    db: AsyncSession = Depends(get_db)
-) -> Dict[str, Any]:
+async def get_dashboard_stats() -> Dict[str, Any]:
     """Get high-level dashboard statistics including doctor submissions"""
     
-    # Count active outbreaks from ORM (last 30 days)
-    outbreak_count_query = select(func.count(Outbreak.id))
-    outbreak_result = await db.execute(outbreak_count_query)
-    active_outbreaks = outbreak_result.scalar() or 0
-    
-    # Count hospitals with outbreaks from ORM
-    hospital_count_query = select(func.count(distinct(Hospital.id))).select_from(
-        Hospital
-    ).join(Outbreak, Hospital.id == Outbreak.hospital_id)
-    hospital_result = await db.execute(hospital_count_query)
-    hospitals_monitored = hospital_result.scalar() or 0
-    
-    # Count distinct states from ORM
-    state_count_query = select(func.count(distinct(Hospital.state))).select_from(
-        Hospital
-    ).join(Outbreak, Hospital.id == Outbreak.hospital_id)
-    state_result = await db.execute(state_count_query)
-    states_covered = state_result.scalar() or 0
-    
-    # Count active broadcasts
-    from app.models.broadcast import Broadcast
-    broadcast_count_query = select(func.count(Broadcast.id)).where(Broadcast.is_active == True)
-    broadcast_result = await db.execute(broadcast_count_query)
-    active_broadcasts = broadcast_result.scalar() or 0
-    
-    # ADD: Query doctor_outbreaks table for doctor submissions
-    try:
-        from app.core.config import get_sqlite_db_path
-        conn = sqlite3.connect(get_sqlite_db_path())
-        cursor = conn.cursor()
-        
-        # Count doctor outbreaks - FIXED: Store result before accessing
-        cursor.execute("SELECT COUNT(*) FROM doctor_outbreaks WHERE status='approved'")
-        row = cursor.fetchone()
-        doctor_outbreak_count = row[0] if row else 0
-        
-        # Count distinct cities/states from doctor submissions
-        cursor.execute("SELECT COUNT(DISTINCT state) FROM doctor_outbreaks WHERE state IS NOT NULL AND status='approved'")
-        row = cursor.fetchone()
-        doctor_states = row[0] if row else 0
-        
-        # Count distinct hospitals from doctor submissions
-        cursor.execute("SELECT COUNT(DISTINCT location_name) FROM doctor_outbreaks WHERE location_name IS NOT NULL AND status='approved'")
-        row = cursor.fetchone()
-        doctor_hospitals = row[0] if row else 0
-        
-        conn.close()
-        
-        # Combine counts
-        total_outbreaks = active_outbreaks + doctor_outbreak_count
-        total_hospitals = hospitals_monitored + doctor_hospitals
-        total_states = states_covered + doctor_states
-        
-    except Exception as e:
-        print(f"Error querying doctor_outbreaks: {e}")
-        # Fall back to ORM counts only
-        total_outbreaks = active_outbreaks
-        total_hospitals = hospitals_monitored
-        total_states = states_covered
+    # Outbreaks, approved doctor submissions and broadcasts: one aggregate
+    # query each, shared across requests for a few seconds
+    snapshot = await get_stats_snapshot()
+    outbreaks = snapshot['outbreaks']
+    doctor = snapshot['doctor_outbreaks']
+    active_broadcasts = snapshot['active_broadcasts']
+    
+    # Combine counts
+    total_outbreaks = outbreaks['total'] + doctor['total']
+    total_hospitals = outbreaks['hospitals'] + doctor['hospitals']
+    total_states = outbreaks['states'] + doctor['states']
     
     # For now, predictions count is simulated
     # AI Predictions - User requested 69528
@@ -128,46 +79,15 @@ async def get_performance_metrics(
 
 
 @router.get("/zones")
-async def get_risk_zones(
-    db: AsyncSession = Depends(get_db)
-) -> Dict[str, Any]:
+async def get_risk_zones() -> Dict[str, Any]:
     """Get risk zone statistics including doctor submissions"""
     
-    # ORM Counts
-    severe_query = select(func.count(Outbreak.id)).where(Outbreak.severity == "severe")
-    severe_result = await db.execute(severe_query)
-    high_risk_zones = severe_result.scalar() or 0
-    
-    patient_query = select(func.sum(Outbreak.patient_count))
-    patient_result = await db.execute(patient_query)
-    total_patients_orm = patient_result.scalar() or 0
-    
-    # SQLite Doctor Counts
-    try:
-        from app.core.config import get_sqlite_db_path
-        conn = sqlite3.connect(get_sqlite_db_path())
-        cursor = conn.cursor()
-        
-        # Count severe doctor outbreaks (approved only)
-        cursor.execute("SELECT COUNT(*) FROM doctor_outbreaks WHERE severity = 'severe' AND status = 'approved'")
-        row = cursor.fetchone()
-        doctor_severe = row[0] if row else 0
-        
-        # Sum patients from approved doctor outbreaks
-        cursor.execute("SELECT SUM(patient_count) FROM doctor_outbreaks WHERE status = 'approved'")
-        row = cursor.fetchone()
-        doctor_patients = row[0] if row else 0
-        
-        conn.close()
-        
-        # Combine
-        total_high_risk = high_risk_zones + doctor_severe
-        total_patients = total_patients_orm + doctor_patients
-        
-    except Exception as e:
-        print(f"Error querying doctor stats for zones: {e}")
-        total_high_risk = high_risk_zones
-        total_patients = total_patients_orm
+    snapshot = await get_stats_snapshot()
+    outbreaks = snapshot['outbreaks']
+    doctor = snapshot['doctor_outbreaks']
+    
+    total_high_risk = outbreaks['severe'] + doctor['severe']
+    total_patients = outbreaks['patients'] + doctor['patients']
     
     # Calculate approximate population at risk (patients * multiplier)
     # Using a multiplier to simulate population in affected areas, not just patients
@@ -0,0 +1,77 @@
+"""
+Map tile routes
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Path, Query, Response, status
+
+from app.core.database import AsyncSessionLocal
+from app.core.serialization import ORJSONRoute
+from app.services.outbreak_map_grid import MAX_ZOOM
+from app.services.map_tiles import (
+    cached_tile, current_epoch, render_hospital_tile, render_outbreak_tile, store_tile,
+    tile_cache_stats, variant_of
+)
+
+router = APIRouter(prefix="/tiles", tags=["Map Tiles"], route_class=ORJSONRoute)
+
+
+def _check_tile(z: int, x: int, y: int):
+    if not (0 <= x < (1 << z) and 0 <= y < (1 << z)):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Tile {z}/{x}/{y} does not exist"
+        )
+
+
+def _tile_response(body: bytes, source: str) -> Response:
+    return Response(content=body, media_type="application/json", headers={"X-Tile-Cache": source})
+
+
+@router.get("/outbreaks/{z}/{x}/{y}")
+async def get_outbreak_tile(
+    z: int = Path(..., ge=0, le=MAX_ZOOM),
+    x: int = Path(..., ge=0),
+    y: int = Path(..., ge=0),
+    disease_type: Optional[str] = None,
+    days: int = Query(default=30, ge=1, le=365)
+):
+    """Clustered outbreaks of one map tile (whole reported days)"""
+    _check_tile(z, x, y)
+    since_day = (datetime.now(timezone.utc) - timedelta(days=days)).date().isoformat()
+    variant = variant_of(since_day, disease_type)
+
+    body, source = await cached_tile('outbreaks', z, x, y, variant)
+    if body is None:
+        epoch = current_epoch('outbreaks')
+        async with AsyncSessionLocal() as db:
+            tile = await render_outbreak_tile(db, z, x, y, since_day, disease_type)
+        body = await store_tile('outbreaks', z, x, y, variant, tile, epoch)
+    return _tile_response(body, source)
+
+
+@router.get("/hospitals/{z}/{x}/{y}")
+async def get_hospital_tile(
+    z: int = Path(..., ge=0, le=MAX_ZOOM),
+    x: int = Path(..., ge=0),
+    y: int = Path(..., ge=0)
+):
+    """Hospitals of one map tile"""
+    _check_tile(z, x, y)
+    variant = variant_of()
+
+    body, source = await cached_tile('hospitals', z, x, y, variant)
+    if body is None:
+        epoch = current_epoch('hospitals')
+        async with AsyncSessionLocal() as db:
+            tile = await render_hospital_tile(db, z, x, y)
+        body = await store_tile('hospitals', z, x, y, variant, tile, epoch)
+    return _tile_response(body, source)
+
+
+@router.get("/cache/stats")
+async def get_tile_cache_stats():
+    """Hit/miss counters for the tile cache"""
+    return tile_cache_stats()
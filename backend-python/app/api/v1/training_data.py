@@ -4,6 +4,9 @@ Real epidemiological data for model training and validation
 Data sources: IDSP, NCDC, WHO, state health departments
 """
 
+from functools import lru_cache
+import numpy as np
+
 # Historical outbreak data for training the SEIR model
 # Format: disease, state, year, month, cases, deaths, duration_days
 
@@ -147,22 +150,111 @@ STATE_HEALTHCARE_INDEX = {
     "Assam": 5.3,
 }
 
+# Incubation periods in days (sigma = 1 / incubation period)
+INCUBATION_PERIODS = {
+    "Dengue": 5.7,
+    "Malaria": 12,
+    "COVID-19": 5.2,
+    "Influenza": 2,
+    "Cholera": 2.5,
+    "Typhoid": 10,
+    "Hepatitis": 28,
+}
+
+class TrainingDataStore:
+    """
+    Columnar, indexed view of the historical outbreak records.
+    Numeric fields are NumPy arrays; row indexes by disease, state, month and
+    (disease, state) are built once so lookups never rescan the list.
+    """
+    
+    NUMERIC_FIELDS = ("year", "month", "cases", "deaths", "duration")
+    
+    def __init__(self, records: list):
+        self.records = list(records)
+        self.disease = np.array([r["disease"] for r in self.records], dtype=object)
+        self.state = np.array([r["state"] for r in self.records], dtype=object)
+        for field in self.NUMERIC_FIELDS:
+            setattr(self, field, np.array([r[field] for r in self.records], dtype=np.int64))
+        
+        self.by_disease = self._index(self.disease)
+        self.by_state = self._index(self.state)
+        self.by_month = self._index(self.month)
+        self.by_disease_state = self._index(list(zip(self.disease, self.state)))
+        self.diseases = list(self.by_disease)
+        self.states = list(self.by_state)
+        self.years = sorted(set(self.year.tolist()))
+    
+    @staticmethod
+    def _index(keys) -> dict:
+        index = {}
+        for row, key in enumerate(keys):
+            index.setdefault(key, []).append(row)
+        return {key: np.array(rows, dtype=np.int64) for key, rows in index.items()}
+    
+    def __len__(self) -> int:
+        return len(self.records)
+    
+    def rows(self, disease: str = None, state: str = None) -> np.ndarray:
+        """Row indexes (in original order) for a disease and/or state"""
+        if disease is not None and state is not None:
+            return self.by_disease_state.get((disease, state), np.empty(0, dtype=np.int64))
+        if disease is not None:
+            return self.by_disease.get(disease, np.empty(0, dtype=np.int64))
+        if state is not None:
+            return self.by_state.get(state, np.empty(0, dtype=np.int64))
+        return np.arange(len(self.records))
+    
+    def records_for(self, disease: str) -> list:
+        """Original record dicts for a disease, in original order"""
+        return [self.records[i] for i in self.rows(disease=disease)]
+
+
+TRAINING_STORE = TrainingDataStore(HISTORICAL_OUTBREAKS)
+
+# Bumped whenever the training data is reloaded; derived caches key on it
+TRAINING_DATA_VERSION = 1
+
+
+def get_training_store() -> TrainingDataStore:
+    """Current training store (rebinds on reload, so don't import the global)"""
+    return TRAINING_STORE
+
+
+def get_training_data_version() -> int:
+    return TRAINING_DATA_VERSION
+
+
+def reload_training_data(records: list = None):
+    """Rebuild the store (e.g. after HISTORICAL_OUTBREAKS changes) and drop memoized results"""
+    global TRAINING_STORE, TRAINING_DATA_VERSION
+    TRAINING_STORE = TrainingDataStore(HISTORICAL_OUTBREAKS if records is None else records)
+    TRAINING_DATA_VERSION += 1
+    _trained_parameters.cache_clear()
+    _training_summary.cache_clear()
+    get_parameter_spread.cache_clear()
+
+
 def calculate_trained_parameters(disease: str, state: str) -> dict:
     """
     Calculate optimal SEIR parameters based on historical data
-    Uses empirical fitting from past outbreaks
+    Uses empirical fitting from past outbreaks (memoized per disease/state)
     """
+    return dict(_trained_parameters(disease, state))
+
+
+@lru_cache(maxsize=None)
+def _trained_parameters(disease: str, state: str) -> dict:
+    store = TRAINING_STORE
+    
     # Filter historical data for this disease and state
-    relevant_data = [
-        d for d in HISTORICAL_OUTBREAKS 
-        if d["disease"] == disease and d["state"] == state
-    ]
+    rows = store.rows(disease=disease, state=state)
     
-    if not relevant_data:
+    if not len(rows):
         # Use disease-level data if no state-specific data
-        relevant_data = [d for d in HISTORICAL_OUTBREAKS if d["disease"] == disease]
+        rows = store.rows(disease=disease)
     
-    if not relevant_data:
+    if not len(rows):
         # Default parameters
         return {
             "beta": 0.4,
@@ -172,9 +264,9 @@ def calculate_trained_parameters(disease: str, state: str) -> dict:
         }
     
     # Calculate empirical parameters from historical data
-    avg_cases = sum(d["cases"] for d in relevant_data) / len(relevant_data)
-    avg_deaths = sum(d["deaths"] for d in relevant_data) / len(relevant_data)
-    avg_duration = sum(d["duration"] for d in relevant_data) / len(relevant_data)
+    avg_cases = float(store.cases[rows].mean())
+    avg_deaths = float(store.deaths[rows].mean())
+    avg_duration = float(store.duration[rows].mean())
     
     # Empirical parameter estimation
     # Recovery rate approximated as 1/duration (adjusted)
@@ -190,16 +282,7 @@ def calculate_trained_parameters(disease: str, state: str) -> dict:
     beta = growth_rate * gamma_adjusted * 1.5  # R0 estimation
     
     # Incubation rate (disease-specific)
-    incubation_periods = {
-        "Dengue": 5.7,
-        "Malaria": 12,
-        "COVID-19": 5.2,
-        "Influenza": 2,
-        "Cholera": 2.5,
-        "Typhoid": 10,
-        "Hepatitis": 28,
-    }
-    sigma = 1 / incubation_periods.get(disease, 5)
+    sigma = 1 / INCUBATION_PERIODS.get(disease, 5)
     
     # Healthcare quality adjustment
     hc_index = STATE_HEALTHCARE_INDEX.get(state, 5.5)
@@ -212,7 +295,7 @@ def calculate_trained_parameters(disease: str, state: str) -> dict:
         "cfr": round(cfr, 4),
         "avg_outbreak_size": int(avg_cases),
         "avg_duration": int(avg_duration),
-        "data_points": len(relevant_data),
+        "data_points": len(rows),
         "trained": True
     }
 
@@ -233,18 +316,64 @@ def is_peak_season(disease: str, month: int) -> bool:
 
 def get_training_summary() -> dict:
     """Get summary of training data available"""
-    diseases = set(d["disease"] for d in HISTORICAL_OUTBREAKS)
-    states = set(d["state"] for d in HISTORICAL_OUTBREAKS)
-    years = set(d["year"] for d in HISTORICAL_OUTBREAKS)
+    summary = _training_summary()
+    # Copies, so callers can't corrupt the cached summary
+    return {key: value.copy() if isinstance(value, (list, dict)) else value for key, value in summary.items()}
+
+
+@lru_cache(maxsize=1)
+def _training_summary() -> dict:
+    store = TRAINING_STORE
+    return {
+        "total_records": len(store),
+        "diseases": list(store.diseases),
+        "states": list(store.states),
+        "years": list(store.years),
+        "records_per_disease": {disease: len(rows) for disease, rows in store.by_disease.items()}
+    }
+
+
+@lru_cache(maxsize=None)
+def get_parameter_spread(disease: str, min_spread: float = 0.05) -> dict:
+    """
+    Relative spread (coefficient of variation) of SEIR parameters for a disease.
+    Fits beta and gamma to every historical outbreak individually with the same
+    formulas as calculate_trained_parameters (before clamping) and measures how
+    much they vary.
+    Sigma comes from a fixed incubation period, so it only gets the floor spread.
+    Diseases without history get the average spread of the known diseases.
+    """
+    store = TRAINING_STORE
+    rows = store.rows(disease=disease)
+    
+    if not len(rows):
+        known = [get_parameter_spread(name, min_spread) for name in store.diseases]
+        return {
+            "beta": round(sum(k["beta"] for k in known) / len(known), 4),
+            "sigma": min_spread,
+            "gamma": round(sum(k["gamma"] for k in known) / len(known), 4),
+            "data_points": 0
+        }
+    
+    cases = store.cases[rows].astype(float)
+    duration = store.duration[rows].astype(float)
+    healthcare = np.array([STATE_HEALTHCARE_INDEX.get(state, 5.5) for state in store.state[rows]])
+    
+    cfr = np.where(cases > 0, store.deaths[rows] / np.maximum(cases, 1), 0.01)
+    gamma_adjusted = 1 / (duration / 3) * (1 - cfr)
+    # Beta is fitted before the healthcare adjustment, which applies to gamma only
+    betas = (cases / 100) ** (1 / duration) * gamma_adjusted * 1.5
+    gammas = gamma_adjusted * (0.8 + healthcare * 0.04)
     
-    disease_counts = {}
-    for disease in diseases:
-        disease_counts[disease] = len([d for d in HISTORICAL_OUTBREAKS if d["disease"] == disease])
+    def coefficient_of_variation(values):
+        if len(values) < 2:
+            return min_spread
+        mean = values.mean()
+        return max(min_spread, round(float(values.std() / mean), 4)) if mean > 0 else min_spread
     
     return {
-        "total_records": len(HISTORICAL_OUTBREAKS),
-        "diseases": list(diseases),
-        "states": list(states),
-        "years": list(years),
-        "records_per_disease": disease_counts
+        "beta": coefficient_of_variation(betas),
+        "sigma": min_spread,
+        "gamma": coefficient_of_variation(gammas),
+        "data_points": len(rows)
     }
@@ -4,10 +4,11 @@ WebSocket API endpoints for real-time communication
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends
 from app.websocket.manager import manager
 import logging
+from app.core.serialization import ORJSONRoute
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/ws", tags=["WebSocket"])
+router = APIRouter(prefix="/ws", tags=["WebSocket"], route_class=ORJSONRoute)
 
 
 @router.websocket("")
@@ -1,62 +1,464 @@
+import asyncio
+import hashlib
+import inspect
+import time
+from datetime import datetime, timezone
+from email.utils import formatdate, parsedate_to_datetime
 from functools import wraps
-import json
+from collections import OrderedDict
 from fastapi import Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
 from app.core.redis import redis_client
-import hashlib
-from typing import Optional, Callable
+from app.core.data_version import get_data_state, get_data_token
+from app.core.serialization import dumps, loads
+from typing import Any, Dict, Optional, Callable, Sequence, Set, Tuple
+
+# Entities cached responses depend on. Write paths purge them with
+# invalidate_tags() once their transaction commits.
+TAG_OUTBREAKS = "outbreaks"      # outbreaks and doctor submissions
+TAG_BROADCASTS = "broadcasts"
+TAG_HOSPITALS = "hospitals"
+TAG_ALERTS = "alerts"
+
+# Tag index sets outlive every entry they point at
+TAG_INDEX_SECONDS = 7 * 24 * 3600
+
+
+def region_tag(state: Optional[str]) -> Optional[str]:
+    """Tag of everything cached for one state (None without a state)"""
+    return f"region:{state}" if state else None
+
+
+def _tag_key(tag: str) -> str:
+    return f"cache:tag:{tag}"
+
+
+class ResponseCache:
+    """
+    Two-tier cache for endpoint results.
+    An in-process LRU sits in front of Redis (or MockRedis): a hit in memory
+    costs no round trip and no decoding, a Redis hit is promoted to memory.
+    Concurrent misses for one key share a single computation.
+
+    Entries are indexed by tag (in memory and as Redis sets), so a write
+    purges exactly the entries of the entities it touched. Memory entries
+    are re-checked against Redis after RESPONSE_CACHE_MEMORY_SECONDS, which
+    bounds how long another worker's purge can go unnoticed here.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        # key -> (value, stored_at, remembered_at, tags), least recently used first
+        self._memory: "OrderedDict[str, Tuple[Any, float, float, tuple]]" = OrderedDict()
+        self._tags: Dict[str, Set[str]] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._tasks: set = set()
+        self._stats: Dict[str, Dict[str, float]] = {}
+        # Bumped by every purge; results computed across one are not stored
+        self._generation = 0
+        self.invalidations = 0
+
+    async def lookup(self, key: str) -> Optional[Tuple[Any, float, str]]:
+        """(value, stored_at, 'memory' | 'redis'), or None"""
+        entry = self._memory.get(key)
+        if entry is not None:
+            if time.monotonic() - entry[2] < settings.RESPONSE_CACHE_MEMORY_SECONDS:
+                self._memory.move_to_end(key)
+                return entry[0], entry[1], 'memory'
+            self._forget(key)
+
+        try:
+            cached = await redis_client.get(key)
+            if cached:
+                payload = loads(cached)
+                self._remember(key, payload['v'], payload['t'], payload.get('tags', ()))
+                return payload['v'], payload['t'], 'redis'
+        except Exception as e:
+            print(f"⚠️ Cache Read Error: {e}")
+        return None
+
+    async def store(self, key: str, value, ttl_seconds: int, tags: Sequence[str] = ()):
+        stored_at = time.time()
+        self._remember(key, value, stored_at, tags)
+        try:
+            # Same encoder as the responses (datetimes, UUIDs, NumPy values)
+            pipe = await redis_client.pipeline()
+            pipe.set(key, dumps({'t': stored_at, 'v': value, 'tags': list(tags)}).decode(), ex=ttl_seconds)
+            for tag in tags:
+                pipe.sadd(_tag_key(tag), key)
+                pipe.expire(_tag_key(tag), TAG_INDEX_SECONDS)
+            await pipe.execute()
+        except Exception as e:
+            print(f"⚠️ Cache Write Error: {e}")
+
+    def _remember(self, key: str, value, stored_at: float, tags: Sequence[str] = ()):
+        self._memory[key] = (value, stored_at, time.monotonic(), tuple(tags))
+        self._memory.move_to_end(key)
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(key)
+        while len(self._memory) > self.max_entries:
+            self._forget(next(iter(self._memory)))
+
+    def _forget(self, key: str):
+        """Drop a memory entry and its tag index references"""
+        entry = self._memory.pop(key, None)
+        for tag in entry[3] if entry else ():
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    async def invalidate(self, *tags: Optional[str]) -> int:
+        """Purge every entry carrying any of the tags; returns how many keys"""
+        tags = [tag for tag in tags if tag]
+        if not tags:
+            return 0
+        self._generation += 1
+        self.invalidations += 1
+
+        keys: Set[str] = set()
+        for tag in tags:
+            keys |= self._tags.pop(tag, set())
+        try:
+            for tag in tags:
+                keys |= await redis_client.smembers(_tag_key(tag))
+            pipe = await redis_client.pipeline()
+            for key in keys:
+                pipe.delete(key)
+            for tag in tags:
+                pipe.delete(_tag_key(tag))
+            await pipe.execute()
+        except Exception as e:
+            print(f"⚠️ Cache Invalidation Error ({', '.join(tags)}): {e}")
+
+        for key in keys:
+            self._forget(key)
+        return len(keys)
+
+    async def compute_once(self, key: str, compute: Callable, ttl_seconds: int, tags: Sequence[str] = ()):
+        """
+        Run compute() and store its result, unless a computation for key is
+        already running, in which case wait for that one instead.
+        """
+        running = self._inflight.get(key)
+        if running is not None:
+            return await asyncio.shield(running)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        generation = self._generation
+        try:
+            value = await compute()
+            # A purge during the computation may have made this result stale
+            if not isinstance(value, Response) and generation == self._generation:
+                await self.store(key, value, ttl_seconds, tags)
+            future.set_result(value)
+            return value
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # waiters re-raise it; nobody else needs to see it
+            raise
+        finally:
+            del self._inflight[key]
+
+    def revalidate(self, key: str, compute: Callable, ttl_seconds: int, tags: Sequence[str] = ()):
+        """Refresh key in the background (no-op while a computation is running)"""
+        if key in self._inflight:
+            return
+        task = asyncio.create_task(self._revalidate(key, compute, ttl_seconds, tags))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _revalidate(self, key: str, compute: Callable, ttl_seconds: int, tags: Sequence[str]):
+        try:
+            await self.compute_once(key, compute, ttl_seconds, tags)
+        except Exception as e:
+            print(f"⚠️ Cache Revalidation Error ({key}): {e}")
+
+    def record(self, route: str, outcome: str, started: float):
+        """Count a lookup outcome and its latency for a route"""
+        stats = self._stats.setdefault(route, {})
+        stats[outcome] = stats.get(outcome, 0) + 1
+        stats[f"{outcome}_ms"] = stats.get(f"{outcome}_ms", 0.0) + (time.perf_counter() - started) * 1000
+
+    def stats(self) -> dict:
+        routes = {}
+        for route, counts in self._stats.items():
+            outcomes = [name for name in counts if not name.endswith('_ms')]
+            lookups = sum(counts[name] for name in outcomes)
+            hits = lookups - counts.get('miss', 0)
+            routes[route] = {
+                "lookups": lookups,
+                "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+                **{name: counts[name] for name in outcomes},
+                **{f"avg_{name}_ms": round(counts[f"{name}_ms"] / counts[name], 3) for name in outcomes},
+            }
+        return {
+            "memory_entries": len(self._memory),
+            "max_memory_entries": self.max_entries,
+            "inflight": len(self._inflight),
+            "tags": {tag: len(keys) for tag, keys in self._tags.items()},
+            "invalidations": self.invalidations,
+            "routes": routes
+        }
+
+
+response_cache = ResponseCache(settings.RESPONSE_CACHE_MEMORY_ENTRIES)
+
+
+async def invalidate_tags(*tags: Optional[str]) -> int:
+    """Write-event hook: purge cached responses of the entities a write touched"""
+    return await response_cache.invalidate(*tags)
+
+
+def _canonical_key(
+    route: str, request: Request, params: Dict[str, Any], vary: Sequence[str], version: Optional[str] = None
+) -> str:
+    """
+    Key for one request: path plus its validated parameters (sorted, defaults
+    filled in, so /x and /x?limit=5 share an entry and unknown query params
+    cannot bust the cache), plus any headers the response varies on and the
+    data version token of the tables it reads.
+    """
+    parts = [request.url.path]
+    parts += [f"{name}={params[name]}" for name in sorted(params)]
+    parts += [f"{header}:{request.headers.get(header, '')}" for header in vary]
+    if version is not None:
+        parts.append(f"version={version}")
+    digest = hashlib.sha1('&'.join(parts).encode()).hexdigest()
+    return f"cache:{route}:{digest}"
+
 
-def cache_response(ttl_seconds: int = 300):
+def cache_response(
+    ttl_seconds: int = 300,
+    stale_seconds: Optional[int] = None,
+    vary: Sequence[str] = (),
+    tags: Sequence[str] = (),
+    tables: Sequence[str] = ()
+):
     """
-    Decorator to cache FastAPI response in Redis (or MockRedis).
-    TTL default: 5 minutes.
+    Decorator to cache FastAPI responses in memory and Redis (or MockRedis).
+    Results are fresh for ttl_seconds (default 5 minutes); for another
+    stale_seconds (default: ttl_seconds) the old result is still served
+    while one background refresh replaces it. Entries carry tags (which may
+    name parameters, e.g. "region:{state}") and are purged by
+    invalidate_tags() with any of them. With tables, the key also holds
+    their data version token, so a version bump or epoch rotation misses
+    even when the writer purged no tags. Under conditional_get the key
+    takes the token its ETag was derived from instead, so a body is never
+    cached under another version's ETag.
     """
+    stale_for = ttl_seconds if stale_seconds is None else stale_seconds
+    stored_for = ttl_seconds + stale_for
+
     def decorator(func: Callable):
+        route = func.__name__
+        signature = inspect.signature(func)
+        request_param = next(
+            (name for name, p in signature.parameters.items() if p.annotation is Request), None
+        )
+
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            # 1. Generate Cache Key
-            # We need to construct a key based on the route and query params
-            # args[0] might not be Request if used in a certain way, so let's find it 
-            # or rely on kwargs. FastAPI usually passes dependencies as kwargs.
-            # Actually, simpler: use the function name + crucial kwargs.
-            # But specific query params matter (like ?limit=5).
-            
-            # Helper to find Request object if present (optional/advanced)
-            # For simplicity, let's create a key string from function name and kwargs
-            # We filter out 'db' session as it's not serializable/relevant for key
-            
-            key_parts = [func.__name__]
-            for k, v in kwargs.items():
-                if k != 'db': # Ignore database session
-                    key_parts.append(f"{k}={v}")
-            
-            cache_key = f"cache:{':'.join(key_parts)}"
-            
-            # 2. Check Cache
-            cached_data = await redis_client.get(cache_key)
-            if cached_data:
-                # print(f"⚡ Cache Hit: {cache_key}")
-                try:
-                    return json.loads(cached_data)
-                except:
-                    pass # Fallback to fresh fetch if stale/corrupt
-            
-            # 3. Fetch Fresh Data
-            # print(f"🐢 Cache Miss: {cache_key}")
-            response_data = await func(*args, **kwargs)
-            
-            # 4. Store in Cache
-            try:
-                # We assume response_data is JSON serializable (Dict or List)
-                # FastAPI handles Pydantic, but here we likely return Dicts from our endpoints
-                await redis_client.set(
-                    cache_key,
-                    json.dumps(response_data, default=str), # default=str handles datetime
-                    ex=ttl_seconds
-                )
-            except Exception as e:
-                print(f"⚠️ Cache Write Error: {e}")
-                
-            return response_data
-            
+            started = time.perf_counter()
+            request = kwargs[request_param] if request_param else kwargs.pop('cache_request')
+            params = {
+                name: value for name, value in kwargs.items()
+                if not isinstance(value, (AsyncSession, Request, Response))
+            }
+            version = getattr(request.state, 'data_token', None)  # set by conditional_get
+            if version is None and tables:
+                version = await get_data_token(*tables)
+            key = _canonical_key(route, request, params, vary, version)
+            entry_tags = [tag.format(**params) if '{' in tag else tag for tag in tags]
+
+            async def compute(session: Optional[AsyncSession] = None):
+                call_kwargs = kwargs if session is None else {
+                    name: session if isinstance(value, AsyncSession) else value
+                    for name, value in kwargs.items()
+                }
+                return await func(*args, **call_kwargs)
+
+            async def compute_detached():
+                # The request's session is closed by the time a background
+                # refresh runs, so it gets its own
+                from app.core.database import AsyncSessionLocal
+                async with AsyncSessionLocal() as session:
+                    return await compute(session)
+
+            entry = await response_cache.lookup(key)
+            if entry is not None:
+                value, stored_at, tier = entry
+                age = time.time() - stored_at
+                if age < ttl_seconds:
+                    response_cache.record(route, f"{tier}_hit", started)
+                    return value
+                if age < stored_for:
+                    response_cache.revalidate(key, compute_detached, stored_for, entry_tags)
+                    response_cache.record(route, "stale", started)
+                    return value
+
+            coalesced = key in response_cache._inflight
+            value = await response_cache.compute_once(key, compute, stored_for, entry_tags)
+            response_cache.record(route, "coalesced" if coalesced else "miss", started)
+            return value
+
+        if not request_param:
+            # Ask FastAPI for the Request, which the key is built from
+            wrapper.__signature__ = signature.replace(parameters=[
+                *signature.parameters.values(),
+                inspect.Parameter('cache_request', inspect.Parameter.KEYWORD_ONLY, annotation=Request),
+            ])
         return wrapper
     return decorator
+
+
+def _not_modified(request: Request, etag: str, last_modified: float) -> bool:
+    """Whether the client's validators still match (If-None-Match wins over If-Modified-Since)"""
+    if_none_match = request.headers.get('if-none-match')
+    if if_none_match is not None:
+        tags = [tag.strip().removeprefix('W/') for tag in if_none_match.split(',')]
+        return '*' in tags or etag.removeprefix('W/') in tags
+
+    if_modified_since = request.headers.get('if-modified-since')
+    if if_modified_since:
+        try:
+            return int(last_modified) <= parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def conditional_get(*tables: str, daily: bool = False):
+    """
+    Decorator adding ETag / Last-Modified to a GET endpoint, derived from the
+    data versions of the tables it reads (bumped by the write paths). A
+    request whose If-None-Match / If-Modified-Since still matches gets a 304
+    before the handler runs: no query, no serialization. daily=True also
+    changes the validators at UTC midnight, for responses windowed on today.
+    """
+    def decorator(func: Callable):
+        route = func.__name__
+        signature = inspect.signature(func)
+        # FastAPI injects one Request / Response per endpoint, so reuse the
+        # handler's (or an inner decorator's) own parameter when it has one
+        request_param = next(
+            (name for name, p in signature.parameters.items() if p.annotation is Request), None
+        )
+        response_param = next(
+            (name for name, p in signature.parameters.items() if p.annotation is Response), None
+        )
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            request = kwargs[request_param] if request_param else kwargs.pop('conditional_request')
+            response = kwargs[response_param] if response_param else kwargs.pop('conditional_response')
+            state = await get_data_state(tables)
+            if state is None:
+                return await func(*args, **kwargs)
+
+            token, last_modified = state
+            if daily:
+                today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+                token = f"{token}.{today.date().isoformat()}"
+                last_modified = max(last_modified, today.timestamp())
+            etag = f'W/"{hashlib.sha1(f"{route}:{token}".encode()).hexdigest()[:20]}"'
+            # A cache_response below keys on the same token as the ETag
+            request.state.data_token = token
+            headers = {
+                "ETag": etag,
+                "Last-Modified": formatdate(last_modified, usegmt=True),
+                "Cache-Control": "no-cache",  # store, but revalidate every time
+            }
+            if _not_modified(request, etag, last_modified):
+                return Response(status_code=304, headers=headers)
+
+            result = await func(*args, **kwargs)
+            (result if isinstance(result, Response) else response).headers.update(headers)
+            return result
+
+        injected = [
+            inspect.Parameter(name, inspect.Parameter.KEYWORD_ONLY, annotation=annotation)
+            for name, annotation, existing in (
+                ('conditional_request', Request, request_param),
+                ('conditional_response', Response, response_param),
+            )
+            if not existing
+        ]
+        wrapper.__signature__ = signature.replace(parameters=[*signature.parameters.values(), *injected])
+        return wrapper
+    return decorator
+
+
+class VersionedCache:
+    """
+    Result cache keyed on (params, data version token from get_data_token).
+    Entries never go stale by time: a write bumps the data version (or the
+    epoch rotates) and the next lookup simply misses. Checks process memory first, then Redis.
+    """
+
+    def __init__(self, namespace: str, ttl_seconds: int = 3600, max_entries: int = 256):
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._memory: "OrderedDict[str, object]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, version: str, key_parts) -> str:
+        return f"cache:{self.namespace}:v{version}:{':'.join(str(p) for p in key_parts)}"
+
+    async def get(self, version: Optional[str], *key_parts):
+        """Cached value for key_parts at this data version, or None"""
+        if version is None:
+            self.misses += 1
+            return None
+
+        key = self._key(version, key_parts)
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return self._memory[key]
+
+        try:
+            cached = await redis_client.get(key)
+            if cached:
+                value = loads(cached)
+                self._remember(key, value)
+                self.hits += 1
+                return value
+        except Exception as e:
+            print(f"⚠️ Cache Read Error: {e}")
+
+        self.misses += 1
+        return None
+
+    async def set(self, version: Optional[str], value, *key_parts):
+        """Store value for key_parts at this data version"""
+        if version is None:
+            return
+
+        key = self._key(version, key_parts)
+        self._remember(key, value)
+        try:
+            await redis_client.set(key, dumps(value).decode(), ex=self.ttl_seconds)
+        except Exception as e:
+            print(f"⚠️ Cache Write Error: {e}")
+
+    def _remember(self, key: str, value):
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "namespace": self.namespace,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "memory_entries": len(self._memory)
+        }
@@ -3,7 +3,7 @@ Application configuration using Pydantic Settings
 """
 
 from pydantic_settings import BaseSettings
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 
 class Settings(BaseSettings):
@@ -20,6 +20,14 @@ class Settings(BaseSettings):
     
     # Redis (optional - app uses mock if not provided)
     REDIS_URL: Optional[str] = None
+    # In-memory fallback limits: least recently used keys are evicted past
+    # either cap; expired keys are swept every MOCK_REDIS_SWEEP_SECONDS
+    MOCK_REDIS_MAX_ENTRIES: int = 50000
+    MOCK_REDIS_MAX_BYTES: int = 67108864  # 64 MB
+    MOCK_REDIS_SWEEP_SECONDS: float = 5.0
+    # Never evicted: losing a data version counter would let caches and
+    # ETags from before the loss match again
+    MOCK_REDIS_PINNED_PREFIXES: Tuple[str, ...] = ("data_version:", "data_modified:")
     
     # JWT Configuration
     JWT_SECRET_KEY: str = "change-this-secret-key-in-production"
@@ -69,7 +77,46 @@ class Settings(BaseSettings):
     
     # ML Service (optional)
     ML_SERVICE_URL: str = "http://localhost:8001"
-    
+
+    # SEIR integrator backend: euler (legacy dt=0.1), rk4 (default) or solve_ivp
+    SEIR_INTEGRATOR: str = "rk4"
+
+    # Worker processes for model validation (0 = run in a background thread)
+    VALIDATION_WORKERS: int = 2
+
+    # Threads (each holding one reused connection) for raw SQLite queries
+    SQLITE_POOL_SIZE: int = 4
+
+    # SQLite performance profile, applied to every new connection
+    # (empty string / 0 leaves the SQLite default in place)
+    SQLITE_JOURNAL_MODE: str = "WAL"        # readers no longer block on writers
+    SQLITE_SYNCHRONOUS: str = "NORMAL"      # fsync at checkpoints only (safe with WAL)
+    SQLITE_MMAP_SIZE: int = 268435456       # 256 MB memory-mapped reads
+    SQLITE_CACHE_SIZE: int = -65536         # page cache; negative = KiB (64 MB)
+    SQLITE_TEMP_STORE: str = "MEMORY"       # sorts / temp indexes in RAM
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000      # wait for locks instead of failing
+
+    # Seconds a dashboard stats snapshot is shared before it is recomputed
+    STATS_SNAPSHOT_TTL_SECONDS: float = 5.0
+
+    # In-process tier of the response cache (entries, across all routes), and
+    # how long a memory entry is trusted before re-checking Redis (bounds how
+    # long another worker's invalidation can go unseen)
+    RESPONSE_CACHE_MEMORY_ENTRIES: int = 1024
+    RESPONSE_CACHE_MEMORY_SECONDS: float = 30.0
+
+    # /public/dashboard bundle: how often the background task checks the data
+    # versions for writes, and the longest a bundle is served before a rebuild
+    PUBLIC_DASHBOARD_POLL_SECONDS: float = 2.0
+    PUBLIC_DASHBOARD_REFRESH_SECONDS: float = 60.0
+
+    # Rendered map tiles: in-process LRU size (tiles) and disk cache directory
+    # (empty string keeps tiles in memory only)
+    MAP_TILE_CACHE_ENTRIES: int = 2048
+    MAP_TILE_CACHE_DIR: str = "./tile_cache"
+    # Variants (day windows / disease filters) kept on disk per tile, newest first
+    MAP_TILE_DISK_VARIANTS: int = 4
+
     # Sentry Error Tracking (Free Tier: 5K errors/month)
     SENTRY_DSN: str = ""
     
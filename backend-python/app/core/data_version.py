@@ -0,0 +1,103 @@
+"""
+Data version counters
+Monotonic per-table versions that write paths bump, so caches can key on
+"what the data looked like" instead of guessing with short TTLs.
+"""
+
+import time
+import uuid
+from typing import Iterable, Optional, Tuple
+
+from app.core.redis import redis_client
+
+# Rotated at startup (and on bulk writes that bypass the endpoints): voids
+# every version seen before, including counters lost with a MockRedis restart
+EPOCH_KEY = "data_version:epoch"
+
+
+def _version_key(table: str) -> str:
+    return f"data_version:{table}"
+
+
+def _modified_key(table: str) -> str:
+    return f"data_modified:{table}"
+
+
+async def get_data_version(table: str) -> Optional[int]:
+    """Current version of a table (0 until the first bump, None if unknown)"""
+    try:
+        value = await redis_client.get(_version_key(table))
+        return int(value) if value else 0
+    except Exception as e:
+        print(f"⚠️ Data version read error ({table}): {e}")
+        return None
+
+
+async def bump_data_version(table: str) -> int:
+    """Mark a table as changed; invalidates every cache entry keyed on its version"""
+    try:
+        pipe = await redis_client.pipeline()
+        pipe.incr(_version_key(table))
+        pipe.set(_modified_key(table), str(time.time()))
+        version, _ = await pipe.execute()
+        return version
+    except Exception as e:
+        print(f"⚠️ Data version bump error ({table}): {e}")
+        return 0
+
+
+async def bump_data_versions(*tables: str):
+    """bump_data_version for each table"""
+    for table in tables:
+        await bump_data_version(table)
+
+
+async def rotate_data_epoch():
+    """Start a new version epoch (all tables count as modified now)"""
+    try:
+        await redis_client.set(EPOCH_KEY, f"{uuid.uuid4().hex[:12]}:{time.time()}")
+    except Exception as e:
+        print(f"⚠️ Data epoch rotation error: {e}")
+
+
+async def _read_state(tables: list) -> list:
+    pipe = await redis_client.pipeline()
+    pipe.get(EPOCH_KEY)
+    for table in tables:
+        pipe.get(_version_key(table))
+        pipe.get(_modified_key(table))
+    return await pipe.execute()
+
+
+async def get_data_state(tables: Iterable[str]) -> Optional[Tuple[str, float]]:
+    """
+    (version token, last modified timestamp) of a set of tables, read in one
+    round trip. The token changes whenever any of the tables is bumped.
+    None if the versions cannot be read.
+    """
+    tables = list(tables)
+    try:
+        values = await _read_state(tables)
+        if not values[0]:  # never rotated, or the store was reset
+            await rotate_data_epoch()
+            values = await _read_state(tables)
+    except Exception as e:
+        print(f"⚠️ Data version read error ({', '.join(tables)}): {e}")
+        return None
+    if not values[0]:
+        return None
+
+    epoch, epoch_at = values[0].split(':')
+    versions = values[1::2]
+    modified = [float(value) for value in values[2::2] if value]
+    token = '.'.join([epoch, *(str(int(v or 0)) for v in versions)])
+    return token, max([float(epoch_at), *modified])
+
+
+async def get_data_token(*tables: str) -> Optional[str]:
+    """
+    Version token of tables for cache keys: unlike get_data_version it
+    includes the epoch, so counters that restart at 0 never match old keys
+    """
+    state = await get_data_state(tables)
+    return state[0] if state else None
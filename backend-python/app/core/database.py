@@ -2,6 +2,9 @@
 Database setup and session management
 """
 
+from typing import List
+
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 from app.core.config import settings
@@ -34,6 +37,44 @@ engine = create_async_engine(
     **engine_args
 )
 
+
+def sqlite_pragmas() -> List[str]:
+    """PRAGMA statements of the configured SQLite performance profile"""
+    pragmas = []
+    if settings.SQLITE_JOURNAL_MODE:
+        pragmas.append(f"PRAGMA journal_mode={settings.SQLITE_JOURNAL_MODE}")
+    if settings.SQLITE_SYNCHRONOUS:
+        pragmas.append(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+    if settings.SQLITE_MMAP_SIZE:
+        pragmas.append(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}")
+    if settings.SQLITE_CACHE_SIZE:
+        pragmas.append(f"PRAGMA cache_size={int(settings.SQLITE_CACHE_SIZE)}")
+    if settings.SQLITE_TEMP_STORE:
+        pragmas.append(f"PRAGMA temp_store={settings.SQLITE_TEMP_STORE}")
+    if settings.SQLITE_BUSY_TIMEOUT_MS:
+        pragmas.append(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+    return pragmas
+
+
+def apply_sqlite_pragmas(dbapi_connection, pragmas: List[str] = None):
+    """
+    Apply the SQLite profile to a DB-API connection (sqlite3 or the aiosqlite
+    adapter). journal_mode=WAL is persistent in the database file; the rest
+    are per-connection, so this runs for every new connection.
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in sqlite_pragmas() if pragmas is None else pragmas:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+if "sqlite" in database_url:
+    @event.listens_for(engine.sync_engine, "connect")
+    def _on_sqlite_connect(dbapi_connection, connection_record):
+        apply_sqlite_pragmas(dbapi_connection)
+
 # Create session maker
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -47,6 +88,18 @@ AsyncSessionLocal = async_sessionmaker(
 Base = declarative_base()
 
 
+def create_missing_indexes(connection):
+    """
+    Create model indexes that the database doesn't have yet. create_all()
+    skips tables that already exist, so an index added to a model later
+    would otherwise never reach an existing database.
+    Runs on a sync connection (AsyncConnection.run_sync).
+    """
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
+
+
 async def get_db() -> AsyncSession:
     """Dependency for getting async database session"""
     async with AsyncSessionLocal() as session:
@@ -0,0 +1,102 @@
+"""
+Raw SQL access to the SQLite database for async endpoints
+Queries run on a bounded thread pool; each worker thread keeps one sqlite3
+connection open and reuses it, so handlers never block the event loop on
+disk I/O and never pay for a connect() per request.
+"""
+
+import asyncio
+import functools
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Sequence
+
+from app.core.config import settings, get_sqlite_db_path
+from app.core.database import apply_sqlite_pragmas
+
+_executor: Optional[ThreadPoolExecutor] = None
+_lock = threading.Lock()
+
+# One connection per worker thread, tracked so shutdown can close them all
+_local = threading.local()
+_connections: List[sqlite3.Connection] = []
+
+
+def _connect() -> sqlite3.Connection:
+    conn = sqlite3.connect(get_sqlite_db_path(), check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    apply_sqlite_pragmas(conn)
+    return conn
+
+
+def _thread_connection() -> sqlite3.Connection:
+    conn = getattr(_local, 'conn', None)
+    if conn is None:
+        conn = _connect()
+        _local.conn = conn
+        with _lock:
+            _connections.append(conn)
+    return conn
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.SQLITE_POOL_SIZE,
+                    thread_name_prefix="sqlite"
+                )
+    return _executor
+
+
+def _run(fn: Callable, args: tuple, kwargs: dict):
+    """Run fn(conn, ...) on this worker's connection as one transaction"""
+    conn = _thread_connection()
+    try:
+        result = fn(conn, *args, **kwargs)
+        conn.commit()
+        return result
+    except BaseException:
+        conn.rollback()
+        raise
+
+
+async def run_in_db(fn: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    Run a synchronous fn(conn, *args, **kwargs) on the database pool.
+    Commits when fn returns, rolls back if it raises. The connection is
+    shared with later calls, so fn must not close it.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), functools.partial(_run, fn, args, kwargs))
+
+
+async def fetch_all(sql: str, params: Sequence = ()) -> List[sqlite3.Row]:
+    """All rows of a query"""
+    return await run_in_db(lambda conn: conn.execute(sql, params).fetchall())
+
+
+async def fetch_one(sql: str, params: Sequence = ()) -> Optional[sqlite3.Row]:
+    """First row of a query (None if empty)"""
+    return await run_in_db(lambda conn: conn.execute(sql, params).fetchone())
+
+
+async def fetch_value(sql: str, params: Sequence = (), default: Any = None) -> Any:
+    """First column of the first row, or `default` when missing or NULL"""
+    row = await fetch_one(sql, params)
+    return row[0] if row is not None and row[0] is not None else default
+
+
+def close_db_pool():
+    """Stop the worker threads and close their connections (application shutdown)"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
+    with _lock:
+        for conn in _connections:
+            conn.close()
+        _connections.clear()
@@ -3,36 +3,333 @@ Redis client setup with Mock fallback
 """
 
 import redis.asyncio as redis
+from redis.exceptions import ResponseError
 from app.core.config import settings
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 import asyncio
+import heapq
+import math
+import time
+
+WRONGTYPE = "WRONGTYPE Operation against a key holding the wrong kind of value"
+
+
+def _sizeof(key: str, value) -> int:
+    """Approximate bytes held by one entry"""
+    if isinstance(value, str):
+        size = len(value)
+    elif isinstance(value, dict):
+        size = sum(len(k) + len(v) for k, v in value.items())
+    else:  # list / set
+        size = sum(len(item) for item in value)
+    return len(key) + size + 64
+
+
+def _text(value) -> str:
+    """Values as a decode_responses=True client returns them"""
+    if isinstance(value, bytes):
+        return value.decode()
+    return value if isinstance(value, str) else str(value)
+
 
 class MockRedis:
-    """In-memory Redis mock for local development"""
-    def __init__(self):
-        self.store = {}
-        print("⚠️ Using In-Memory Mock Redis (Data will be lost on restart)")
+    """
+    In-memory Redis stand-in for local development.
+    Keys expire like in Redis (checked on access, plus a sweeper over a
+    heap of deadlines), and the store is bounded: past MOCK_REDIS_MAX_ENTRIES
+    or MOCK_REDIS_MAX_BYTES the least recently used keys are evicted, except
+    those under MOCK_REDIS_PINNED_PREFIXES (the data version counters).
+    """
+
+    def __init__(self, max_entries: int = None, max_bytes: int = None, sweep_seconds: float = None,
+                 pinned_prefixes: Tuple[str, ...] = None):
+        self.max_entries = max_entries or settings.MOCK_REDIS_MAX_ENTRIES
+        self.max_bytes = max_bytes or settings.MOCK_REDIS_MAX_BYTES
+        self.sweep_seconds = sweep_seconds or settings.MOCK_REDIS_SWEEP_SECONDS
+        self.pinned_prefixes = tuple(settings.MOCK_REDIS_PINNED_PREFIXES if pinned_prefixes is None
+                                     else pinned_prefixes)
+        self.store: "OrderedDict[str, object]" = OrderedDict()  # least recently used first
+        self._sizes: Dict[str, int] = {}
+        self._deadlines: Dict[str, float] = {}
+        self._heap: List[Tuple[float, str]] = []  # (deadline, key); stale pairs skipped
+        self._sweeper: Optional[asyncio.Task] = None
+        self.bytes = 0
+        self.counters = {"hits": 0, "misses": 0, "expired": 0, "evicted": 0}
+        print("⚠️ Using In-Memory Mock Redis (bounded, data will be lost on restart)")
 
     async def connect(self):
-        pass
+        self._ensure_sweeper()
 
     async def disconnect(self):
-        pass
+        if self._sweeper and not self._sweeper.done():
+            self._sweeper.cancel()
+        self._sweeper = None
 
-    async def get(self, key):
-        return self.store.get(key)
-    
-    async def set(self, key, value, ex=None):
-        self.store[key] = value
-        if ex:
-             # In a real mock we'd handle expiry, but for MVP local test it's fine
-             pass
-    
-    async def delete(self, key):
+    # -- bookkeeping -----------------------------------------------------
+
+    def _ensure_sweeper(self):
+        if self._sweeper is None or self._sweeper.done():
+            try:
+                self._sweeper = asyncio.get_running_loop().create_task(self._sweep_forever())
+            except RuntimeError:
+                self._sweeper = None  # no running loop; lazy expiry still applies
+
+    async def _sweep_forever(self):
+        while True:
+            await asyncio.sleep(self.sweep_seconds)
+            self.sweep()
+
+    def sweep(self) -> int:
+        """Drop every key whose deadline has passed; returns how many"""
+        now = time.monotonic()
+        dropped = 0
+        while self._heap and self._heap[0][0] <= now:
+            deadline, key = heapq.heappop(self._heap)
+            if self._deadlines.get(key) == deadline:
+                self._drop(key)
+                self.counters["expired"] += 1
+                dropped += 1
+        # Re-set keys leave stale pairs behind; rebuild once they dominate
+        if len(self._heap) > 2 * len(self._deadlines) + 64:
+            self._heap = [(deadline, key) for key, deadline in self._deadlines.items()]
+            heapq.heapify(self._heap)
+        return dropped
+
+    def _drop(self, key: str):
         if key in self.store:
             del self.store[key]
-            
-    async def exists(self, key):
-        return 1 if key in self.store else 0
+            self.bytes -= self._sizes.pop(key)
+        self._deadlines.pop(key, None)
+
+    def _lookup(self, key: str, kind=None):
+        """Live value of key (touching its LRU position), or None"""
+        deadline = self._deadlines.get(key)
+        if deadline is not None and deadline <= time.monotonic():
+            self._drop(key)
+            self.counters["expired"] += 1
+        value = self.store.get(key)
+        if value is None:
+            self.counters["misses"] += 1
+            return None
+        if kind is not None and not isinstance(value, kind):
+            raise ResponseError(WRONGTYPE)
+        self.store.move_to_end(key)
+        self.counters["hits"] += 1
+        return value
+
+    def _container(self, key: str, kind):
+        """Existing list/dict/set at key, or a new empty one stored there"""
+        value = self._lookup(key, kind)
+        if value is None:
+            value = kind()
+            self.store[key] = value
+            self._sizes[key] = 0
+        return value
+
+    def _written(self, key: str):
+        """Account for a changed value and evict down to the caps"""
+        value = self.store.get(key)
+        if value is not None and not value:  # emptied list/hash/set
+            self._drop(key)
+            return
+        if value is not None:
+            size = _sizeof(key, value)
+            self.bytes += size - self._sizes.get(key, 0)
+            self._sizes[key] = size
+            self.store.move_to_end(key)
+        while len(self.store) > 1 and (len(self.store) > self.max_entries or self.bytes > self.max_bytes):
+            # Pinned keys are few and kept recent by use, so the scan stays short
+            oldest = next((k for k in self.store if not k.startswith(self.pinned_prefixes)), None)
+            if oldest is None or oldest == key:
+                break
+            self._drop(oldest)
+            self.counters["evicted"] += 1
+
+    def _expire_at(self, key: str, seconds: float):
+        deadline = time.monotonic() + seconds
+        self._deadlines[key] = deadline
+        heapq.heappush(self._heap, (deadline, key))
+        self._ensure_sweeper()
+
+    # -- keys / strings --------------------------------------------------
+
+    async def get(self, key):
+        value = self._lookup(key, str)
+        return value
+
+    async def set(self, key, value, ex=None):
+        self._drop(key)  # a plain SET replaces any value and clears its TTL
+        self.store[key] = _text(value)
+        self._written(key)
+        if ex and key in self.store:
+            self._expire_at(key, ex)
+        return True
+
+    async def delete(self, *keys):
+        removed = 0
+        for key in keys:
+            if self._lookup(key) is not None:
+                self._drop(key)
+                removed += 1
+        return removed
+
+    async def exists(self, *keys):
+        return sum(1 for key in keys if self._lookup(key) is not None)
+
+    async def incr(self, key):
+        return await self.incrby(key, 1)
+
+    async def incrby(self, key, amount=1):
+        current = self._lookup(key, str)
+        value = int(current or 0) + amount
+        self.store[key] = str(value)
+        self._written(key)
+        return value
+
+    async def expire(self, key, seconds):
+        if self._lookup(key) is None:
+            return False
+        self._expire_at(key, seconds)
+        return True
+
+    async def ttl(self, key):
+        if self._lookup(key) is None:
+            return -2
+        deadline = self._deadlines.get(key)
+        return -1 if deadline is None else max(0, math.ceil(deadline - time.monotonic()))
+
+    # -- lists -----------------------------------------------------------
+
+    async def lpush(self, key, *values):
+        items = self._container(key, list)
+        items[:0] = [_text(v) for v in reversed(values)]
+        self._written(key)
+        return len(items)
+
+    async def rpush(self, key, *values):
+        items = self._container(key, list)
+        items.extend(_text(v) for v in values)
+        self._written(key)
+        return len(items)
+
+    @staticmethod
+    def _range(items: list, start: int, end: int) -> list:
+        """items[start..end] with Redis's inclusive, negative-aware bounds"""
+        end = len(items) if end == -1 else (end + 1 if end >= 0 else len(items) + end + 1)
+        return items[start if start >= 0 else max(0, len(items) + start):end]
+
+    async def lrange(self, key, start, end):
+        return self._range(self._lookup(key, list) or [], start, end)
+
+    async def ltrim(self, key, start, end):
+        items = self._lookup(key, list)
+        if items is not None:
+            items[:] = self._range(items, start, end)
+            self._written(key)
+        return True
+
+    async def llen(self, key):
+        return len(self._lookup(key, list) or [])
+
+    # -- hashes ----------------------------------------------------------
+
+    async def hset(self, key, field=None, value=None, mapping=None):
+        fields = dict(mapping or {})
+        if field is not None:
+            fields[field] = value
+        hash_ = self._container(key, dict)
+        added = sum(1 for f in fields if _text(f) not in hash_)
+        hash_.update({_text(f): _text(v) for f, v in fields.items()})
+        self._written(key)
+        return added
+
+    async def hget(self, key, field):
+        return (self._lookup(key, dict) or {}).get(_text(field))
+
+    async def hgetall(self, key):
+        return dict(self._lookup(key, dict) or {})
+
+    async def hdel(self, key, *fields):
+        hash_ = self._lookup(key, dict)
+        if hash_ is None:
+            return 0
+        removed = sum(1 for f in fields if hash_.pop(_text(f), None) is not None)
+        self._written(key)
+        return removed
+
+    async def hincrby(self, key, field, amount=1):
+        hash_ = self._container(key, dict)
+        value = int(hash_.get(_text(field)) or 0) + amount
+        hash_[_text(field)] = str(value)
+        self._written(key)
+        return value
+
+    # -- sets ------------------------------------------------------------
+
+    async def sadd(self, key, *members):
+        members_ = self._container(key, set)
+        before = len(members_)
+        members_.update(_text(m) for m in members)
+        self._written(key)
+        return len(members_) - before
+
+    async def srem(self, key, *members):
+        members_ = self._lookup(key, set)
+        if members_ is None:
+            return 0
+        before = len(members_)
+        members_.difference_update(_text(m) for m in members)
+        self._written(key)
+        return before - len(members_)
+
+    async def smembers(self, key):
+        return set(self._lookup(key, set) or ())
+
+    async def scard(self, key):
+        return len(self._lookup(key, set) or ())
+
+    # -- pipelines / introspection ---------------------------------------
+
+    def pipeline(self, transaction=True):
+        return MockPipeline(self)
+
+    def stats(self) -> dict:
+        return {
+            "backend": "mock",
+            "entries": len(self.store),
+            "bytes": self.bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "with_ttl": len(self._deadlines),
+            **self.counters
+        }
+
+
+class MockPipeline:
+    """Queues commands and runs them back to back on execute(), like a MULTI/EXEC pipeline"""
+
+    def __init__(self, mock: MockRedis):
+        self._mock = mock
+        self._commands = []
+
+    def __getattr__(self, name):
+        command = getattr(self._mock, name)
+
+        def queue(*args, **kwargs):
+            self._commands.append((command, args, kwargs))
+            return self
+        return queue
+
+    async def execute(self):
+        commands, self._commands = self._commands, []
+        return [await command(*args, **kwargs) for command, args, kwargs in commands]
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self._commands = []
 
 
 class RedisClient:
@@ -58,11 +355,14 @@ class RedisClient:
             print("🔄 Switching to Mock Redis...")
             self.use_mock = True
             self.redis = MockRedis()
+            await self.redis.connect()
     
     async def disconnect(self):
         """Disconnect from Redis"""
         if self.redis and not self.use_mock:
             await self.redis.close()
+        elif self.redis:
+            await self.redis.disconnect()
     
     async def get(self, key: str) -> str:
         """Get value from Redis"""
@@ -83,6 +383,83 @@ class RedisClient:
         """Check if key exists"""
         if not self.redis: await self.connect()
         return await self.redis.exists(key)
+    
+    async def incr(self, key: str) -> int:
+        """Atomically increment an integer key"""
+        if not self.redis: await self.connect()
+        return await self.redis.incr(key)
+    
+    async def expire(self, key: str, seconds: int) -> bool:
+        """Set a key's time to live"""
+        if not self.redis: await self.connect()
+        return await self.redis.expire(key, seconds)
+    
+    async def ttl(self, key: str) -> int:
+        """Seconds left to live (-1 without expiry, -2 if missing)"""
+        if not self.redis: await self.connect()
+        return await self.redis.ttl(key)
+    
+    async def rpush(self, key: str, *values) -> int:
+        """Append to a list"""
+        if not self.redis: await self.connect()
+        return await self.redis.rpush(key, *values)
+    
+    async def lrange(self, key: str, start: int, end: int) -> list:
+        """Slice of a list (inclusive end, negative indexes from the tail)"""
+        if not self.redis: await self.connect()
+        return await self.redis.lrange(key, start, end)
+    
+    async def ltrim(self, key: str, start: int, end: int):
+        """Keep only a slice of a list"""
+        if not self.redis: await self.connect()
+        return await self.redis.ltrim(key, start, end)
+    
+    async def hset(self, key: str, field: str = None, value=None, mapping: dict = None) -> int:
+        """Set hash fields"""
+        if not self.redis: await self.connect()
+        return await self.redis.hset(key, field, value, mapping=mapping)
+    
+    async def hgetall(self, key: str) -> dict:
+        """All fields of a hash"""
+        if not self.redis: await self.connect()
+        return await self.redis.hgetall(key)
+    
+    async def hincrby(self, key: str, field: str, amount: int = 1) -> int:
+        """Atomically increment a hash field"""
+        if not self.redis: await self.connect()
+        return await self.redis.hincrby(key, field, amount)
+    
+    async def sadd(self, key: str, *members) -> int:
+        """Add set members"""
+        if not self.redis: await self.connect()
+        return await self.redis.sadd(key, *members)
+    
+    async def smembers(self, key: str) -> set:
+        """All members of a set"""
+        if not self.redis: await self.connect()
+        return await self.redis.smembers(key)
+    
+    async def pipeline(self, transaction: bool = True):
+        """Command pipeline: queue calls, then `await pipe.execute()`"""
+        if not self.redis: await self.connect()
+        return self.redis.pipeline(transaction=transaction)
+    
+    async def stats(self) -> dict:
+        """Entry / memory / eviction counters of the backing store"""
+        if not self.redis: await self.connect()
+        if self.use_mock:
+            return self.redis.stats()
+        info = await self.redis.info()
+        return {
+            "backend": "redis",
+            "entries": await self.redis.dbsize(),
+            "bytes": info.get("used_memory"),
+            "max_bytes": info.get("maxmemory"),
+            "hits": info.get("keyspace_hits"),
+            "misses": info.get("keyspace_misses"),
+            "expired": info.get("expired_keys"),
+            "evicted": info.get("evicted_keys")
+        }
 
 
 redis_client = RedisClient()
@@ -0,0 +1,117 @@
+"""
+JSON serialization for API responses and caches
+One orjson-based encoder shared by every route and by the response caches.
+It handles datetimes, dates, UUIDs and NumPy scalars/arrays natively, so
+endpoints can return query rows and model output without converting them
+first.
+"""
+
+import functools
+import inspect
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Callable, Union
+
+import orjson
+from fastapi.datastructures import Default, DefaultPlaceholder
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+from starlette.responses import Response
+
+OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj: Any) -> Any:
+    """Types orjson doesn't encode on its own"""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    if hasattr(obj, "item"):
+        # NumPy scalar types orjson skips (e.g. float16, longdouble)
+        return obj.item()
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    return str(obj)
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode obj as UTF-8 JSON bytes"""
+    return orjson.dumps(obj, default=_default, option=OPTIONS)
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Decode JSON produced by dumps() (or any JSON text)"""
+    return orjson.loads(data)
+
+
+class RenderedJSON(str):
+    """
+    JSON text that has already been encoded. FastAPI hands str content to the
+    response class unchanged, so ORJSONResponse can send it as-is.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def of(cls, data: Union[bytes, str]) -> "RenderedJSON":
+        return cls(data.decode() if isinstance(data, bytes) else data)
+
+
+class ORJSONResponse(JSONResponse):
+    """Application-wide JSON response rendered with orjson"""
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, RenderedJSON):
+            return content.encode()
+        return dumps(content)
+
+
+def _prerendered(route: "ORJSONRoute", endpoint: Callable) -> Callable:
+    """
+    Wrap an endpoint so plain return values are encoded by dumps() before
+    FastAPI's jsonable_encoder sees them. Responses, already rendered JSON and
+    routes that validate through a response_model pass through untouched.
+    """
+
+    def render(content: Any) -> Any:
+        if route.response_field is not None or isinstance(content, (Response, RenderedJSON)):
+            return content
+        return RenderedJSON.of(dumps(content))
+
+    if inspect.iscoroutinefunction(endpoint):
+        @functools.wraps(endpoint)
+        async def wrapper(*args, **kwargs):
+            return render(await endpoint(*args, **kwargs))
+    else:
+        @functools.wraps(endpoint)
+        def wrapper(*args, **kwargs):
+            return render(endpoint(*args, **kwargs))
+    return wrapper
+
+
+class ORJSONRoute(APIRoute):
+    """
+    APIRoute that serializes through ORJSONResponse.
+    FastAPI runs every return value through jsonable_encoder before the
+    response class is reached, which costs more than the encoding itself and
+    rejects NumPy values, so plain returns are pre-rendered by the endpoint
+    wrapper instead. Status codes, injected Response headers and background
+    tasks are still applied by FastAPI as usual.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any):
+        response_class = kwargs.get("response_class", Default(JSONResponse))
+        if isinstance(response_class, DefaultPlaceholder):
+            # Keeps the pydantic dump_json fast path for response_model routes
+            kwargs["response_class"] = response_class = Default(ORJSONResponse)
+        response_class = getattr(response_class, "value", response_class)
+        streaming = inspect.isgeneratorfunction(endpoint) or inspect.isasyncgenfunction(endpoint)
+        if issubclass(response_class, ORJSONResponse) and not streaming:
+            endpoint = _prerendered(self, endpoint)
+        super().__init__(path, endpoint, **kwargs)
@@ -9,9 +9,14 @@ from fastapi.middleware.gzip import GZipMiddleware
 from contextlib import asynccontextmanager
 
 from app.core.config import settings
-from app.core.database import engine, Base
+from app.core.database import engine, Base, create_missing_indexes
 from app.api.v1 import api_router
 from app.core.redis import redis_client
+from app.core.data_version import rotate_data_epoch
+from app.services.public_dashboard import start_dashboard_refresher, stop_dashboard_refresher
+from app.api.v1.model_validation import shutdown_validation_pool
+from app.core.db_access import close_db_pool
+from app.core.serialization import ORJSONResponse, ORJSONRoute
 import app.models # Register all models
 from sqlalchemy import text
 from app.core.seeder import seed_database
@@ -28,6 +33,38 @@ from app.core.limiter import limiter
 # Security Middleware
 from app.middleware.security import setup_security_middleware
 
+async def rebuild_derived_tables():
+    """
+    Recompute every table derived from outbreaks from scratch (doctor outbreak
+    aggregates, daily rollup, map grid) and drop the cached map tiles
+    """
+    from app.core.database import AsyncSessionLocal
+    from app.services.outbreak_aggregates import rebuild_outbreak_aggregates
+    from app.services.outbreak_rollup import rebuild_daily_rollup
+    from app.services.outbreak_map_grid import rebuild_map_grid
+    from app.services.map_tiles import clear_tiles
+    try:
+        async with AsyncSessionLocal() as db:
+            groups = await rebuild_outbreak_aggregates(db)
+        print(f"📊 Outbreak aggregates rebuilt ({groups} groups)")
+    except Exception as e:
+        print(f"⚠️ Outbreak aggregate rebuild failed: {e}")
+    try:
+        async with AsyncSessionLocal() as db:
+            rows = await rebuild_daily_rollup(db)
+        print(f"📊 Daily outbreak rollup rebuilt ({rows} rows)")
+    except Exception as e:
+        print(f"⚠️ Daily outbreak rollup rebuild failed: {e}")
+    try:
+        async with AsyncSessionLocal() as db:
+            cells = await rebuild_map_grid(db)
+        print(f"🗺️ Outbreak map grid rebuilt ({cells} cells)")
+    except Exception as e:
+        print(f"⚠️ Outbreak map grid rebuild failed: {e}")
+    # Tiles on disk may predate writes made while the server was down
+    await clear_tiles()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup and shutdown events"""
@@ -45,6 +82,7 @@ async def lifespan(app: FastAPI):
     async with engine.begin() as conn:
         print("📊 Creating/updating database tables...")
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(create_missing_indexes)
         
         # Check if we need to seed
         try:
@@ -60,15 +98,24 @@ async def lifespan(app: FastAPI):
     else:
         print(f"✅ Database has {count} hospitals - skipping seed")
     
+    # Rebuild derived tables (covers seeded rows and writes made while down)
+    await rebuild_derived_tables()
+    
     # Legacy SQLite initialization removed in favor of SQLAlchemy
      
     # Connect to Redis
     await redis_client.connect()
+    # Seeding and offline writes bypass the version bumps: void old ETags
+    await rotate_data_epoch()
+    await start_dashboard_refresher()
     
     yield
     
     # Shutdown
     print("👋 Shutting down SymptoMap Backend...")
+    await stop_dashboard_refresher()
+    shutdown_validation_pool()
+    close_db_pool()
     await redis_client.disconnect()
 
 
@@ -76,8 +123,11 @@ app = FastAPI(
     title="SymptoMap API",
     description="Disease Surveillance & Outbreak Prediction API",
     version="2.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
+# Routes declared on the app itself (e.g. /health) serialize through orjson too
+app.router.route_class = ORJSONRoute
 
 # GZip compression
 app.add_middleware(GZipMiddleware, minimum_size=1000)
@@ -221,20 +271,22 @@ async def force_reseed():
         
         # Clear SQLite doctor data
         try:
-            import sqlite3
-            from app.core.config import get_sqlite_db_path
-            conn = sqlite3.connect(get_sqlite_db_path())
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM doctor_outbreaks")
-            cursor.execute("DELETE FROM doctor_alerts")
-            conn.commit()
-            conn.close()
+            async with AsyncSessionLocal() as db:
+                await db.execute(text("DELETE FROM doctor_outbreaks"))
+                await db.execute(text("DELETE FROM doctor_alerts"))
+                await db.commit()
             print("🗑️ Cleared doctor SQLite data")
+            from app.core.data_version import bump_data_version
+            await bump_data_version("doctor_outbreaks")
         except Exception as e:
             print(f"SQLite clear warning: {e}")
         
         # Reseed with comprehensive data
         await seed_database()
+        await rebuild_derived_tables()
+        await rotate_data_epoch()
+        from app.core.cache import invalidate_tags, TAG_OUTBREAKS, TAG_HOSPITALS, TAG_BROADCASTS, TAG_ALERTS
+        await invalidate_tags(TAG_OUTBREAKS, TAG_HOSPITALS, TAG_BROADCASTS, TAG_ALERTS)
         
         return {
             "status": "success", 
@@ -2,8 +2,8 @@
 
 from app.models.user import User
 from app.models.chatbot import ChatbotConversation, AnonymousSymptomReport, DiseaseInfo
-from app.models.outbreak import Hospital, Outbreak, Prediction, Alert
-from app.models.doctor import DoctorOutbreak, DoctorAlert
+from app.models.outbreak import Hospital, Outbreak, OutbreakDailyRollup, OutbreakMapCell, Prediction, Alert
+from app.models.doctor import DoctorOutbreak, DoctorAlert, DoctorOutbreakAggregate
 from app.models.broadcast import Broadcast
 from app.models.notification_preference import NotificationPreference
 
@@ -14,10 +14,13 @@ __all__ = [
     "DiseaseInfo",
     "Hospital",
     "Outbreak", 
+    "OutbreakDailyRollup",
+    "OutbreakMapCell",
     "Prediction", 
     "Alert",
     "DoctorOutbreak",
     "DoctorAlert",
+    "DoctorOutbreakAggregate",
     "Broadcast",
     "NotificationPreference"
 ]
@@ -2,7 +2,7 @@
 Doctor Station Models
 """
 
-from sqlalchemy import Column, String, Integer, Float, Text, DateTime, Boolean
+from sqlalchemy import Column, String, Integer, Float, Text, DateTime, Boolean, Index
 from sqlalchemy.sql import func
 from app.core.database import Base
 
@@ -26,6 +26,11 @@ class DoctorOutbreak(Base):
     
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     status = Column(String(50), default='pending')  # pending, approved, rejected
+    
+    __table_args__ = (
+        # Status filters (approval queue, approved listings) ordered by submission time
+        Index('ix_doctor_outbreaks_status_created_at', 'status', 'created_at'),
+    )
 
 class DoctorAlert(Base):
     __tablename__ = "doctor_alerts"
@@ -42,3 +47,17 @@ class DoctorAlert(Base):
     expiry_date = Column(DateTime(timezone=True))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     status = Column(String(50), default='active')
+
+class DoctorOutbreakAggregate(Base):
+    """Approved doctor_outbreaks rolled up by disease x state x severity"""
+    __tablename__ = "doctor_outbreak_aggregates"
+    
+    disease_type = Column(String(100), primary_key=True)
+    state = Column(String(100), primary_key=True)
+    severity = Column(String(50), primary_key=True)
+    
+    outbreak_count = Column(Integer, nullable=False, default=0)
+    total_cases = Column(Integer, nullable=False, default=0)
+    severity_sum = Column(Integer, nullable=False, default=0)  # mild=1, moderate=2, severe=3
+    
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
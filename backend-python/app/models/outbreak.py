@@ -2,7 +2,7 @@
 Outbreak database models
 """
 
-from sqlalchemy import Column, String, Integer, Boolean, DateTime, ForeignKey, Text, Float
+from sqlalchemy import Column, String, Integer, Boolean, DateTime, ForeignKey, Text, Float, Index
 from sqlalchemy.sql import func
 import uuid
 
@@ -40,6 +40,12 @@ class Hospital(Base):
     
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    
+    __table_args__ = (
+        # Filters and GROUP BYs of the per-state / per-city aggregates
+        Index('ix_hospitals_state', 'state'),
+        Index('ix_hospitals_city', 'city'),
+    )
 
 
 class Outbreak(Base):
@@ -73,6 +79,53 @@ class Outbreak(Base):
     
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    
+    __table_args__ = (
+        # Date-window filters and newest-first listings; id makes it the
+        # (date_reported, id) keyset of cursor pagination
+        Index('ix_outbreaks_date_reported_id', 'date_reported', 'id'),
+        # Hospital joins of the grouped aggregates
+        Index('ix_outbreaks_hospital_id', 'hospital_id'),
+    )
+
+
+class OutbreakDailyRollup(Base):
+    """Outbreaks rolled up by reported day x disease x hospital state x severity"""
+
+    __tablename__ = "outbreak_daily_rollup"
+
+    # '' stands in for a missing date_reported / hospital state / severity
+    day = Column(String(10), primary_key=True)  # YYYY-MM-DD
+    disease_type = Column(String(100), primary_key=True)
+    state = Column(String(100), primary_key=True)
+    severity = Column(String(50), primary_key=True)
+
+    outbreak_count = Column(Integer, nullable=False, default=0)
+    case_count = Column(Integer, nullable=False, default=0)
+    verified_count = Column(Integer, nullable=False, default=0)
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+class OutbreakMapCell(Base):
+    """Outbreaks binned into a Web Mercator grid per map zoom level, by reported day and disease"""
+
+    __tablename__ = "outbreak_map_cells"
+
+    zoom = Column(Integer, primary_key=True)
+    x = Column(Integer, primary_key=True)  # grid cell at zoom + CELL_BITS (see outbreak_map_grid)
+    y = Column(Integer, primary_key=True)
+    day = Column(String(10), primary_key=True)  # YYYY-MM-DD
+    disease_type = Column(String(100), primary_key=True)
+
+    outbreak_count = Column(Integer, nullable=False, default=0)
+    case_count = Column(Integer, nullable=False, default=0)
+    severe_count = Column(Integer, nullable=False, default=0)
+    moderate_count = Column(Integer, nullable=False, default=0)
+    mild_count = Column(Integer, nullable=False, default=0)
+    # Sums of member coordinates, so a cluster sits at its members' centroid
+    latitude_sum = Column(Float, nullable=False, default=0)
+    longitude_sum = Column(Float, nullable=False, default=0)
 
 
 class Prediction(Base):
@@ -129,3 +182,8 @@ class Alert(Base):
     acknowledged_by = Column(JSONB)  # [{"user_id": "...", "timestamp": "..."}]
     
     expires_at = Column(DateTime(timezone=True))
+    
+    __table_args__ = (
+        # Alert dedupe: same type for the same zone within a time window
+        Index('ix_alerts_type_zone_sent_at', 'alert_type', 'zone_name', 'sent_at'),
+    )
@@ -11,6 +11,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 from app.models.outbreak import Outbreak, Hospital, Alert
 from app.models.broadcast import Broadcast
+from app.core.cache import invalidate_tags, region_tag, TAG_ALERTS, TAG_BROADCASTS
+from app.core.data_version import bump_data_versions
 import uuid
 
 
@@ -120,6 +122,11 @@ async def analyze_and_generate_alerts(db: AsyncSession) -> List[Dict]:
             })
     
     await db.commit()
+    if created_alerts:
+        await invalidate_tags(
+            TAG_ALERTS, TAG_BROADCASTS, *[region_tag(alert["state"]) for alert in created_alerts]
+        )
+        await bump_data_versions("alerts", "broadcasts")
     return created_alerts
 
 
@@ -208,6 +215,11 @@ async def check_growth_rate_alerts(db: AsyncSession) -> List[Dict]:
                 })
     
     await db.commit()
+    if created_alerts:
+        await invalidate_tags(
+            TAG_ALERTS, TAG_BROADCASTS, *[region_tag(alert["state"]) for alert in created_alerts]
+        )
+        await bump_data_versions("alerts", "broadcasts")
     return created_alerts
 
 
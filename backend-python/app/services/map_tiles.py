@@ -0,0 +1,279 @@
+"""
+Map Tiles
+Compact JSON tiles (/tiles/{layer}/{z}/{x}/{y}) for the outbreak and
+hospital map layers. A tile holds only the features inside it, with
+positions quantized to a TILE_EXTENT grid: outbreaks come pre-clustered
+from the map grid (8x8 clusters per tile at most), hospitals that share a
+pixel are merged.
+
+Rendered tiles are kept in an in-process LRU and on disk
+(MAP_TILE_CACHE_DIR, at most MAP_TILE_DISK_VARIANTS per tile), so a tile
+that has not changed is served without touching the database. A write
+invalidates just the tiles its point falls in, one per zoom level.
+"""
+
+import asyncio
+import hashlib
+import math
+import os
+import shutil
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import defer
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.serialization import dumps
+from app.models.outbreak import Hospital
+from app.services.outbreak_map_grid import CELL_BITS, MAX_ZOOM, mercator, clusters_in_cells
+
+LAYERS = ('outbreaks', 'hospitals')
+TILE_EXTENT = 4096
+# Hospitals closer than one 256px-tile pixel are merged into one feature
+HOSPITAL_MERGE_SHIFT = 4  # 4096 >> 4 = 256
+
+# (layer, z, x, y) -> {variant: tile bytes}, least recently used first
+_memory: "OrderedDict[Tuple[str, int, int, int], Dict[str, bytes]]" = OrderedDict()
+# Bumped by every invalidation, so a tile rendered while a write landed is not stored
+_epoch = {layer: 0 for layer in LAYERS}
+_stats = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0, 'invalidations': 0}
+
+
+def tile_bounds(z: int, x: int, y: int) -> Tuple[float, float, float, float]:
+    """(west, south, east, north) of a tile in degrees"""
+    scale = 1 << z
+
+    def latitude(ty: int) -> float:
+        return math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * ty / scale))))
+
+    return x / scale * 360.0 - 180.0, latitude(y + 1), (x + 1) / scale * 360.0 - 180.0, latitude(y)
+
+
+def tile_at(latitude: float, longitude: float, z: int) -> Tuple[int, int]:
+    """Tile containing a point at a zoom level"""
+    mx, my = mercator(latitude, longitude)
+    scale = 1 << z
+    return int(mx * scale), int(my * scale)
+
+
+def _position(latitude: float, longitude: float, z: int, x: int, y: int) -> Optional[Tuple[int, int]]:
+    """Point in tile coordinates (0..TILE_EXTENT), None if outside the tile"""
+    mx, my = mercator(latitude, longitude)
+    scale = 1 << z
+    px, py = int((mx * scale - x) * TILE_EXTENT), int((my * scale - y) * TILE_EXTENT)
+    if 0 <= px < TILE_EXTENT and 0 <= py < TILE_EXTENT:
+        return px, py
+    return None
+
+
+def variant_of(*params) -> str:
+    """Cache file name for one set of tile query parameters"""
+    return hashlib.sha1(repr(params).encode()).hexdigest()[:16]
+
+
+# ---------------------------------------------------------------------------
+# Rendering
+# ---------------------------------------------------------------------------
+
+async def render_outbreak_tile(
+    db: AsyncSession, z: int, x: int, y: int, since_day: str, disease_type: Optional[str]
+) -> dict:
+    """Grid clusters of one tile"""
+    cells = (x << CELL_BITS, y << CELL_BITS, ((x + 1) << CELL_BITS) - 1, ((y + 1) << CELL_BITS) - 1)
+    features = []
+    for cluster in await clusters_in_cells(db, z, cells, since_day, disease_type):
+        position = _position(cluster['latitude'], cluster['longitude'], z, x, y)
+        if position is None:
+            continue
+        features.append({
+            "x": position[0],
+            "y": position[1],
+            "properties": {
+                "point_count": cluster['outbreak_count'],
+                "patient_count": cluster['case_count'],
+                "severity": cluster['severity'],
+                "severity_counts": cluster['severity_counts'],
+            }
+        })
+    return {"layer": "outbreaks", "z": z, "x": x, "y": y, "extent": TILE_EXTENT, "features": features}
+
+
+async def render_hospital_tile(db: AsyncSession, z: int, x: int, y: int) -> dict:
+    """Hospitals inside one tile, merged per pixel"""
+    west, south, east, north = tile_bounds(z, x, y)
+    result = await db.execute(
+        select(Hospital).options(defer(Hospital.location)).where(
+            Hospital.longitude.between(west, east),
+            Hospital.latitude.between(south, north)
+        )
+    )
+
+    pixels: Dict[Tuple[int, int], list] = {}
+    for h in result.scalars().all():
+        if not (h.latitude and h.longitude):
+            continue
+        position = _position(h.latitude, h.longitude, z, x, y)
+        if position is None:
+            continue
+        pixel = (position[0] >> HOSPITAL_MERGE_SHIFT, position[1] >> HOSPITAL_MERGE_SHIFT)
+        pixels.setdefault(pixel, []).append((position, h))
+
+    features = []
+    for members in pixels.values():
+        (px, py), h = members[0]
+        if len(members) == 1:
+            properties = {
+                "id": str(h.id),
+                "name": h.name,
+                "city": h.city,
+                "state": h.state,
+                "total_beds": h.total_beds,
+                "available_beds": h.available_beds,
+                "hospital_type": h.hospital_type
+            }
+        else:
+            properties = {
+                "point_count": len(members),
+                "total_beds": sum(m.total_beds or 0 for _, m in members),
+                "available_beds": sum(m.available_beds or 0 for _, m in members)
+            }
+        features.append({"x": px, "y": py, "properties": properties})
+    return {"layer": "hospitals", "z": z, "x": x, "y": y, "extent": TILE_EXTENT, "features": features}
+
+
+# ---------------------------------------------------------------------------
+# Cache
+# ---------------------------------------------------------------------------
+# Memory lookups and epoch bumps happen inline; every disk read, write and
+# delete runs on a worker thread so the event loop never waits on the disk.
+
+def _tile_dir(layer: str, z: int, x: int, y: int) -> Optional[str]:
+    if not settings.MAP_TILE_CACHE_DIR:
+        return None
+    return os.path.join(settings.MAP_TILE_CACHE_DIR, layer, str(z), str(x), str(y))
+
+
+def _remember(tile: Tuple[str, int, int, int], variant: str, body: bytes):
+    _memory.setdefault(tile, {})[variant] = body
+    _memory.move_to_end(tile)
+    while len(_memory) > settings.MAP_TILE_CACHE_ENTRIES:
+        _memory.popitem(last=False)
+
+
+def _read_file(path: str) -> Optional[bytes]:
+    try:
+        with open(path, 'rb') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def _write_file(directory: str, variant: str, body: bytes):
+    """Write one variant, keeping only the MAP_TILE_DISK_VARIANTS newest of the tile"""
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{variant}.json")
+    with open(f"{path}.tmp", 'wb') as f:
+        f.write(body)
+    os.replace(f"{path}.tmp", path)
+
+    # Variants keyed on a past since_day are never asked for again
+    with os.scandir(directory) as entries:
+        variants = [e for e in entries if e.name.endswith('.json') and e.is_file()]
+    if len(variants) > settings.MAP_TILE_DISK_VARIANTS:
+        variants.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+        for entry in variants[settings.MAP_TILE_DISK_VARIANTS:]:
+            if entry.path != path:
+                try:
+                    os.remove(entry.path)
+                except FileNotFoundError:
+                    pass
+
+
+def _remove_dirs(directories: List[str]):
+    for directory in directories:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+async def cached_tile(layer: str, z: int, x: int, y: int, variant: str) -> Tuple[Optional[bytes], str]:
+    """(tile bytes, 'memory' | 'disk'), or (None, 'miss')"""
+    tile = (layer, z, x, y)
+    body = _memory.get(tile, {}).get(variant)
+    if body is not None:
+        _memory.move_to_end(tile)
+        _stats['memory_hits'] += 1
+        return body, 'memory'
+
+    directory = _tile_dir(layer, z, x, y)
+    if directory:
+        epoch = _epoch[layer]
+        try:
+            body = await asyncio.to_thread(_read_file, os.path.join(directory, f"{variant}.json"))
+        except OSError as e:
+            print(f"⚠️ Tile cache read error: {e}")
+            body = None
+        # A file read while the tile was being invalidated may be stale
+        if body is not None and epoch == _epoch[layer]:
+            _remember(tile, variant, body)
+            _stats['disk_hits'] += 1
+            return body, 'disk'
+
+    _stats['misses'] += 1
+    return None, 'miss'
+
+
+async def store_tile(layer: str, z: int, x: int, y: int, variant: str, tile: dict, epoch: int) -> bytes:
+    """Serialize a rendered tile and cache it, unless an invalidation happened since epoch"""
+    body = dumps(tile)
+    if epoch != _epoch[layer]:
+        return body
+
+    _remember((layer, z, x, y), variant, body)
+    directory = _tile_dir(layer, z, x, y)
+    if directory:
+        try:
+            await asyncio.to_thread(_write_file, directory, variant, body)
+            # Invalidated while the write was in flight: the file may have
+            # landed after the directory was removed
+            if epoch != _epoch[layer]:
+                await asyncio.to_thread(_remove_dirs, [directory])
+        except OSError as e:
+            print(f"⚠️ Tile cache write error: {e}")
+    return body
+
+
+def current_epoch(layer: str) -> int:
+    return _epoch[layer]
+
+
+async def invalidate_point(layer: str, latitude: Optional[float], longitude: Optional[float]):
+    """Drop the cached tiles (every zoom, every variant) a point falls in"""
+    _epoch[layer] += 1
+    _stats['invalidations'] += 1
+    directories = []
+    for z in range(MAX_ZOOM + 1):
+        x, y = tile_at(latitude or 0, longitude or 0, z)
+        _memory.pop((layer, z, x, y), None)
+        directory = _tile_dir(layer, z, x, y)
+        if directory:
+            directories.append(directory)
+    if directories:
+        await asyncio.to_thread(_remove_dirs, directories)
+
+
+async def clear_tiles(layer: Optional[str] = None):
+    """Drop every cached tile of a layer (or of all layers)"""
+    directories = []
+    for name in ([layer] if layer else LAYERS):
+        _epoch[name] += 1
+        for tile in [t for t in _memory if t[0] == name]:
+            del _memory[tile]
+        if settings.MAP_TILE_CACHE_DIR:
+            directories.append(os.path.join(settings.MAP_TILE_CACHE_DIR, name))
+    if directories:
+        await asyncio.to_thread(_remove_dirs, directories)
+
+
+def tile_cache_stats() -> dict:
+    return {**_stats, "memory_tiles": len(_memory), "disk_dir": settings.MAP_TILE_CACHE_DIR or None}
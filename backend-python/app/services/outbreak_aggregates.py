@@ -0,0 +1,91 @@
+"""
+Outbreak Aggregates
+Approved doctor submissions rolled up by disease x state x severity, kept
+current incrementally by the approval endpoints so readers (predictions)
+scan a few dozen rows instead of the whole doctor_outbreaks table.
+"""
+
+from sqlalchemy import select, delete, insert, func, case
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.doctor import DoctorOutbreak, DoctorOutbreakAggregate
+
+SEVERITY_WEIGHTS = {'mild': 1, 'moderate': 2, 'severe': 3}
+DEFAULT_SEVERITY_WEIGHT = 2
+
+
+def _upsert(db: AsyncSession):
+    """Dialect-specific INSERT supporting ON CONFLICT DO UPDATE"""
+    if db.bind.dialect.name == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    return dialect_insert(DoctorOutbreakAggregate)
+
+
+async def apply_status_change(db: AsyncSession, outbreak: DoctorOutbreak, previous_status: str):
+    """
+    Adjust the aggregate for a submission whose status just changed.
+    Call before committing so the aggregate moves in the same transaction.
+    """
+    delta = (outbreak.status == 'approved') - (previous_status == 'approved')
+    if delta == 0:
+        return
+    
+    weight = SEVERITY_WEIGHTS.get(outbreak.severity, DEFAULT_SEVERITY_WEIGHT)
+    stmt = _upsert(db).values(
+        disease_type=outbreak.disease_type or 'Other',
+        state=outbreak.state or 'Unknown',
+        severity=outbreak.severity or 'unknown',
+        outbreak_count=delta,
+        total_cases=delta * (outbreak.patient_count or 0),
+        severity_sum=delta * weight
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['disease_type', 'state', 'severity'],
+        set_={
+            'outbreak_count': DoctorOutbreakAggregate.outbreak_count + stmt.excluded.outbreak_count,
+            'total_cases': DoctorOutbreakAggregate.total_cases + stmt.excluded.total_cases,
+            'severity_sum': DoctorOutbreakAggregate.severity_sum + stmt.excluded.severity_sum,
+            'updated_at': func.now()
+        }
+    )
+    await db.execute(stmt)
+
+
+async def rebuild_outbreak_aggregates(db: AsyncSession) -> int:
+    """
+    Recompute every aggregate from doctor_outbreaks in one GROUP BY.
+    Used at startup and after bulk writes that bypass the approval endpoints.
+    Returns the number of aggregate rows.
+    """
+    disease = func.coalesce(func.nullif(DoctorOutbreak.disease_type, ''), 'Other')
+    state = func.coalesce(func.nullif(DoctorOutbreak.state, ''), 'Unknown')
+    severity = func.coalesce(func.nullif(DoctorOutbreak.severity, ''), 'unknown')
+    weight = case(
+        *[(DoctorOutbreak.severity == name, value) for name, value in SEVERITY_WEIGHTS.items()],
+        else_=DEFAULT_SEVERITY_WEIGHT
+    )
+    
+    grouped = (
+        select(
+            disease, state, severity,
+            func.count(),
+            func.coalesce(func.sum(DoctorOutbreak.patient_count), 0),
+            func.sum(weight)
+        )
+        .where(DoctorOutbreak.status == 'approved')
+        .group_by(disease, state, severity)
+    )
+    
+    await db.execute(delete(DoctorOutbreakAggregate))
+    await db.execute(
+        insert(DoctorOutbreakAggregate).from_select(
+            ['disease_type', 'state', 'severity', 'outbreak_count', 'total_cases', 'severity_sum'],
+            grouped
+        )
+    )
+    await db.commit()
+    
+    result = await db.execute(select(func.count()).select_from(DoctorOutbreakAggregate))
+    return result.scalar()
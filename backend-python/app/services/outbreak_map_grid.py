@@ -0,0 +1,198 @@
+"""
+Outbreak Map Grid
+Multi-resolution grid index behind the clustered /outbreaks/map/geojson.
+Each outbreak (placed at its hospital, like the map) is binned into one
+Web Mercator cell per zoom level, by reported day and disease. A viewport
+then reads the cells inside its bounding box at its zoom, so the response
+grows with the viewport, not with the number of outbreaks.
+"""
+
+import math
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select, delete, insert, func, cast, String
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.outbreak import Hospital, Outbreak, OutbreakMapCell
+
+# Cells are 1/2^CELL_BITS of a 256px tile (32px), at zoom 0..MAX_ZOOM
+CELL_BITS = 3
+MAX_ZOOM = 14
+MAX_LATITUDE = 85.05112878
+
+# Upper bound on cells a single viewport may span (a 4K screen is ~8k cells)
+MAX_VIEWPORT_CELLS = 16384
+UPSERT_BATCH = 500
+
+SEVERITIES = ['severe', 'moderate', 'mild']  # highest first
+VALUE_COLUMNS = ['outbreak_count', 'case_count', 'severe_count', 'moderate_count', 'mild_count',
+                 'latitude_sum', 'longitude_sum']
+KEY_COLUMNS = ['zoom', 'x', 'y', 'day', 'disease_type']
+
+
+def _upsert(db: AsyncSession):
+    """Dialect-specific INSERT supporting ON CONFLICT DO UPDATE"""
+    if db.bind.dialect.name == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    return dialect_insert(OutbreakMapCell)
+
+
+def mercator(latitude: float, longitude: float) -> Tuple[float, float]:
+    """Web Mercator position in [0, 1) x [0, 1), origin at the north-west corner"""
+    lat = math.radians(max(-MAX_LATITUDE, min(MAX_LATITUDE, latitude)))
+    x = (longitude + 180.0) / 360.0
+    y = (1.0 - math.log(math.tan(lat) + 1.0 / math.cos(lat)) / math.pi) / 2.0
+    return min(max(x, 0.0), 1.0 - 1e-12), min(max(y, 0.0), 1.0 - 1e-12)
+
+
+def cell_at(latitude: float, longitude: float, zoom: int) -> Tuple[int, int]:
+    """Grid cell containing a point at a map zoom level"""
+    x, y = mercator(latitude, longitude)
+    scale = 1 << (zoom + CELL_BITS)
+    return int(x * scale), int(y * scale)
+
+
+def _grouped():
+    """Outbreaks per hospital position, reported day and disease"""
+    day = cast(func.date(Outbreak.date_reported), String(10))
+    latitude = func.coalesce(Hospital.latitude, 0)
+    longitude = func.coalesce(Hospital.longitude, 0)
+    return (
+        select(
+            latitude, longitude, day, Outbreak.disease_type,
+            func.count(),
+            func.coalesce(func.sum(Outbreak.patient_count), 0),
+            *[func.count().filter(Outbreak.severity == severity) for severity in SEVERITIES]
+        )
+        .select_from(Outbreak)
+        .join(Hospital, Outbreak.hospital_id == Hospital.id)
+        .where(Outbreak.date_reported.isnot(None))
+        .group_by(latitude, longitude, day, Outbreak.disease_type)
+    )
+
+
+def _bin(rows) -> List[dict]:
+    """Spread grouped rows over every zoom level, merging rows that share a cell"""
+    cells: Dict[tuple, List[float]] = defaultdict(lambda: [0] * len(VALUE_COLUMNS))
+    for latitude, longitude, day, disease_type, count, cases, *severity_counts in rows:
+        x, y = mercator(latitude, longitude)
+        finest = 1 << (MAX_ZOOM + CELL_BITS)
+        fx, fy = int(x * finest), int(y * finest)
+        values = [count, cases, *severity_counts, latitude * count, longitude * count]
+        for zoom in range(MAX_ZOOM + 1):
+            shift = MAX_ZOOM - zoom
+            totals = cells[(zoom, fx >> shift, fy >> shift, day, disease_type)]
+            for i, value in enumerate(values):
+                totals[i] += value
+    return [
+        {**dict(zip(KEY_COLUMNS, key)), **dict(zip(VALUE_COLUMNS, totals))}
+        for key, totals in cells.items()
+    ]
+
+
+async def index_outbreaks(db: AsyncSession, outbreak_ids: Iterable):
+    """
+    Add newly stored outbreaks to the grid.
+    Call after the rows are flushed and before committing, so the grid
+    moves in the same transaction.
+    """
+    ids = list(outbreak_ids)
+    if not ids:
+        return
+
+    result = await db.execute(_grouped().where(Outbreak.id.in_(ids)))
+    cells = _bin(result.all())
+    for start in range(0, len(cells), UPSERT_BATCH):
+        stmt = _upsert(db).values(cells[start:start + UPSERT_BATCH])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=KEY_COLUMNS,
+            set_={name: getattr(OutbreakMapCell, name) + getattr(stmt.excluded, name) for name in VALUE_COLUMNS}
+        )
+        await db.execute(stmt)
+
+
+async def rebuild_map_grid(db: AsyncSession) -> int:
+    """
+    Recompute the whole grid from outbreaks.
+    Used at startup and after writes that bypass the endpoints (or delete
+    outbreaks). Returns the number of grid cells.
+    """
+    result = await db.execute(_grouped())
+    cells = _bin(result.all())
+
+    await db.execute(delete(OutbreakMapCell))
+    if cells:
+        await db.execute(insert(OutbreakMapCell), cells)
+    await db.commit()
+    return len(cells)
+
+
+def viewport_cells(zoom: int, bbox: Tuple[float, float, float, float]) -> Tuple[int, int, int, int]:
+    """(x_min, y_min, x_max, y_max) cell range of a west,south,east,north box"""
+    west, south, east, north = bbox
+    x_min, y_min = cell_at(north, west, zoom)
+    x_max, y_max = cell_at(south, east, zoom)
+    return x_min, y_min, x_max, y_max
+
+
+def max_severity(severe: int, moderate: int, mild: int) -> Optional[str]:
+    for severity, count in zip(SEVERITIES, (severe, moderate, mild)):
+        if count:
+            return severity
+    return None
+
+
+async def query_clusters(
+    db: AsyncSession,
+    zoom: int,
+    bbox: Tuple[float, float, float, float],
+    since_day: str,
+    disease_type: Optional[str] = None
+) -> List[dict]:
+    """Clusters (one per occupied cell) inside a viewport"""
+    return await clusters_in_cells(db, zoom, viewport_cells(zoom, bbox), since_day, disease_type)
+
+
+async def clusters_in_cells(
+    db: AsyncSession,
+    zoom: int,
+    cells: Tuple[int, int, int, int],
+    since_day: str,
+    disease_type: Optional[str] = None
+) -> List[dict]:
+    """Clusters (one per occupied cell) in an (x_min, y_min, x_max, y_max) cell range"""
+    x_min, y_min, x_max, y_max = cells
+    query = (
+        select(
+            OutbreakMapCell.x, OutbreakMapCell.y,
+            *[func.sum(getattr(OutbreakMapCell, name)) for name in VALUE_COLUMNS]
+        )
+        .where(
+            OutbreakMapCell.zoom == zoom,
+            OutbreakMapCell.x.between(x_min, x_max),
+            OutbreakMapCell.y.between(y_min, y_max),
+            OutbreakMapCell.day >= since_day
+        )
+        .group_by(OutbreakMapCell.x, OutbreakMapCell.y)
+    )
+    if disease_type:
+        query = query.where(OutbreakMapCell.disease_type == disease_type)
+
+    result = await db.execute(query)
+    clusters = []
+    for x, y, count, cases, severe, moderate, mild, latitude_sum, longitude_sum in result.all():
+        if not count:
+            continue
+        clusters.append({
+            "cell": f"{zoom}/{x}/{y}",
+            "latitude": latitude_sum / count,
+            "longitude": longitude_sum / count,
+            "outbreak_count": count,
+            "case_count": cases,
+            "severity": max_severity(severe, moderate, mild),
+            "severity_counts": {"severe": severe, "moderate": moderate, "mild": mild},
+        })
+    return clusters
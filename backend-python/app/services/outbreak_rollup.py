@@ -0,0 +1,96 @@
+"""
+Outbreak Daily Rollup
+Outbreaks rolled up by reported day x disease x hospital state x severity,
+kept current incrementally by the outbreak write endpoints so the analytics
+dashboard reads a row per day and category instead of every outbreak.
+"""
+
+from typing import Iterable
+
+from sqlalchemy import select, delete, insert, func, case, cast, literal, String
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.outbreak import Hospital, Outbreak, OutbreakDailyRollup
+
+KEY_COLUMNS = ['day', 'disease_type', 'state', 'severity']
+VALUE_COLUMNS = ['outbreak_count', 'case_count', 'verified_count']
+
+
+def _upsert(db: AsyncSession):
+    """Dialect-specific INSERT supporting ON CONFLICT DO UPDATE"""
+    if db.bind.dialect.name == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    return dialect_insert(OutbreakDailyRollup)
+
+
+def _grouped(sign: int = 1):
+    """Outbreaks joined to their hospital, grouped into rollup keys (values scaled by sign)"""
+    day = func.coalesce(cast(func.date(Outbreak.date_reported), String(10)), '')
+    state = func.coalesce(Hospital.state, '')
+    severity = func.coalesce(Outbreak.severity, '')
+    return (
+        select(
+            day, Outbreak.disease_type, state, severity,
+            literal(sign) * func.count(),
+            literal(sign) * func.coalesce(func.sum(Outbreak.patient_count), 0),
+            literal(sign) * func.coalesce(func.sum(case((Outbreak.verified == True, 1), else_=0)), 0)
+        )
+        .select_from(Outbreak)
+        .outerjoin(Hospital, Outbreak.hospital_id == Hospital.id)
+        .group_by(day, Outbreak.disease_type, state, severity)
+    )
+
+
+async def _apply(db: AsyncSession, outbreak_ids: Iterable, sign: int):
+    ids = list(outbreak_ids)
+    if not ids:
+        return
+
+    stmt = _upsert(db).from_select(
+        KEY_COLUMNS + VALUE_COLUMNS,
+        _grouped(sign).where(Outbreak.id.in_(ids))
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=KEY_COLUMNS,
+        set_={
+            **{name: getattr(OutbreakDailyRollup, name) + getattr(stmt.excluded, name) for name in VALUE_COLUMNS},
+            'updated_at': func.now()
+        }
+    )
+    await db.execute(stmt)
+    if sign < 0:
+        await db.execute(delete(OutbreakDailyRollup).where(OutbreakDailyRollup.outbreak_count <= 0))
+
+
+async def record_outbreaks(db: AsyncSession, outbreak_ids: Iterable):
+    """
+    Count outbreaks into the rollup as they are stored now.
+    Call after the rows are flushed and before committing, so the rollup
+    moves in the same transaction.
+    """
+    await _apply(db, outbreak_ids, 1)
+
+
+async def retract_outbreaks(db: AsyncSession, outbreak_ids: Iterable):
+    """
+    Take outbreaks out of the rollup as they are stored now.
+    Call before deleting or changing the rows; an update is a retract of
+    the old row followed by a record of the new one.
+    """
+    await _apply(db, outbreak_ids, -1)
+
+
+async def rebuild_daily_rollup(db: AsyncSession) -> int:
+    """
+    Recompute the whole rollup from outbreaks in one GROUP BY.
+    Used at startup and after bulk writes that bypass the endpoints.
+    Returns the number of rollup rows.
+    """
+    await db.execute(delete(OutbreakDailyRollup))
+    await db.execute(insert(OutbreakDailyRollup).from_select(KEY_COLUMNS + VALUE_COLUMNS, _grouped()))
+    await db.commit()
+
+    result = await db.execute(select(func.count()).select_from(OutbreakDailyRollup))
+    return result.scalar()
@@ -0,0 +1,213 @@
+"""
+Public Dashboard Bundle
+Everything the user dashboard shows (/public/stats, /hotspots, /broadcasts
+and /grid-stats) in one response. All four are derived from one grouped
+Outbreak x Hospital query (a row per hospital) and one broadcast query, run
+concurrently; the bundle is serialized and gzipped once, and those bytes
+are served to every request until the data changes.
+
+A background task rebuilds the bundle as soon as the data version of
+outbreaks, hospitals or broadcasts moves (checked every
+PUBLIC_DASHBOARD_POLL_SECONDS) and at least every
+PUBLIC_DASHBOARD_REFRESH_SECONDS. A request that sees a newer version than
+the bundle's waits for the rebuild, so writes show up immediately.
+"""
+
+import asyncio
+import gzip
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.core.config import settings
+from app.core.data_version import get_data_state
+from app.core.serialization import dumps
+from app.models.broadcast import Broadcast
+from app.models.outbreak import Hospital, Outbreak
+
+TABLES = ("outbreaks", "hospitals", "broadcasts")
+HOTSPOT_LIMIT = 5
+BROADCAST_LIMIT = 5
+
+_bundle: Optional[Dict[str, Any]] = None
+_lock = asyncio.Lock()
+_refresher: Optional[asyncio.Task] = None
+
+# Outbreaks without a hospital land in the NULL group: they count towards
+# the totals but not towards hotspots or clusters
+PER_HOSPITAL = select(
+    Hospital.id,
+    Hospital.city,
+    Hospital.state,
+    func.count(Outbreak.id).label('count'),
+    func.coalesce(func.sum(Outbreak.patient_count), 0).label('patients'),
+    func.max(Outbreak.severity).label('max_severity'),
+).select_from(Outbreak).outerjoin(Hospital, Outbreak.hospital_id == Hospital.id)\
+ .group_by(Hospital.id, Hospital.city, Hospital.state)
+
+# The window count is taken before LIMIT, so it is the number of active broadcasts
+LATEST_BROADCASTS = select(Broadcast, func.count().over().label('active'))\
+    .where(Broadcast.is_active == True)\
+    .order_by(Broadcast.created_at.desc())\
+    .limit(BROADCAST_LIMIT)
+
+
+def hotspot(city: Optional[str], count: int) -> Dict[str, Any]:
+    """One /public/hotspots entry"""
+    if count > 50: risk = "Critical"; color = "red"
+    elif count > 20: risk = "High"; color = "orange"
+    else: risk = "Moderate"; color = "yellow"
+    return {"city": city, "risk": risk, "color": color, "count": count}
+
+
+def cluster_risk(count: int, max_severity: Optional[str]) -> Optional[str]:
+    """Risk bucket of one hospital cluster on the surveillance grid"""
+    if count > 20 or max_severity == 'severe':
+        return 'severe'
+    if count > 10 or max_severity == 'moderate':
+        return 'moderate'
+    return None
+
+
+def public_broadcast(b: Broadcast) -> Dict[str, Any]:
+    """One /public/broadcasts entry"""
+    return {
+        "id": str(b.id),
+        "title": b.title,
+        "message": b.message if hasattr(b, 'message') else b.content,  # Handle schema drift
+        "severity": b.severity,
+        # Smart Category Derivation
+        "category": b.category if hasattr(b, 'category') and b.category else b.severity.capitalize() if b.severity else "General",
+        "created_at": b.created_at.isoformat() if b.created_at else None,
+        "source": b.source if hasattr(b, 'source') else "System"  # Handle schema drift
+    }
+
+
+def build_bundle(hospital_rows, broadcast_rows) -> Dict[str, Any]:
+    """The four dashboard payloads from the per-hospital and broadcast rows"""
+    clusters = [row for row in hospital_rows if row.id is not None]
+
+    cities: Dict[Optional[str], int] = {}
+    for row in clusters:
+        cities[row.city] = cities.get(row.city, 0) + row.count
+    top = sorted(cities.items(), key=lambda item: (-item[1], item[0] or ''))[:HOTSPOT_LIMIT]
+
+    risks = [cluster_risk(row.count, row.max_severity) for row in clusters]
+    active_broadcasts = broadcast_rows[0].active if broadcast_rows else 0
+
+    return {
+        "stats": {
+            "activeOutbreaks": sum(row.count for row in hospital_rows),
+            "activeBroadcasts": active_broadcasts,
+            "casesThisWeek": sum(row.patients for row in hospital_rows),
+            "trendPercentage": -3.4,
+            "regionsAffected": len({row.state for row in clusters if row.state is not None}),
+            "verifiedSources": 3
+        },
+        "hotspots": [hotspot(city, count) for city, count in top],
+        "broadcasts": [public_broadcast(row.Broadcast) for row in broadcast_rows],
+        "grid_stats": {
+            "visual_clusters": len(clusters),
+            "active_zones": len(clusters),
+            "risk_severe": risks.count('severe'),
+            "risk_moderate": risks.count('moderate'),
+            "classification": "patient density vectors"
+        },
+    }
+
+
+async def _rows(bind: AsyncEngine, query) -> List[Any]:
+    """One query on its own session (and pooled connection)"""
+    async with AsyncSession(bind) as db:
+        result = await db.execute(query)
+        return result.all()
+
+
+async def collect_dashboard(bind: Optional[AsyncEngine] = None) -> Dict[str, Any]:
+    """Run both queries concurrently and build the bundle"""
+    if bind is None:
+        from app.core.database import engine as bind
+    hospital_rows, broadcast_rows = await asyncio.gather(
+        _rows(bind, PER_HOSPITAL), _rows(bind, LATEST_BROADCASTS), return_exceptions=True
+    )
+    if isinstance(hospital_rows, BaseException):
+        raise hospital_rows
+    if isinstance(broadcast_rows, BaseException):
+        print(f"Error querying broadcasts: {broadcast_rows}")
+        broadcast_rows = []
+    return build_bundle(hospital_rows, broadcast_rows)
+
+
+async def refresh_dashboard() -> Dict[str, Any]:
+    """
+    Rebuild the bundle. The data version is read before the queries, so a
+    write landing mid-build leaves the bundle marked as older and the next
+    check rebuilds it again.
+    """
+    global _bundle
+    async with _lock:
+        state = await get_data_state(TABLES)
+        token = state[0] if state else None
+        if _bundle is not None and token is not None and _bundle['token'] == token \
+                and time.monotonic() - _bundle['built_at'] < settings.PUBLIC_DASHBOARD_REFRESH_SECONDS:
+            return _bundle  # rebuilt while we waited for the lock
+
+        payload = await collect_dashboard()
+        payload["generated_at"] = datetime.now(timezone.utc).isoformat()
+        body = dumps(payload)
+        _bundle = {
+            'body': body,
+            'gzipped': gzip.compress(body, compresslevel=6),
+            'token': token,
+            'built_at': time.monotonic(),
+        }
+        return _bundle
+
+
+def _is_stale(token: Optional[str]) -> bool:
+    if _bundle is None:
+        return True
+    if token is not None and token != _bundle['token']:
+        return True
+    return time.monotonic() - _bundle['built_at'] >= settings.PUBLIC_DASHBOARD_REFRESH_SECONDS
+
+
+async def get_dashboard() -> Dict[str, Any]:
+    """Current bundle ({'body', 'gzipped', ...}), rebuilt first if a write made it stale"""
+    state = await get_data_state(TABLES)
+    token = state[0] if state else None
+    if _bundle is None or (token is not None and token != _bundle['token']):
+        return await refresh_dashboard()
+    return _bundle
+
+
+async def _refresh_forever():
+    while True:
+        await asyncio.sleep(settings.PUBLIC_DASHBOARD_POLL_SECONDS)
+        try:
+            state = await get_data_state(TABLES)
+            if _is_stale(state[0] if state else None):
+                await refresh_dashboard()
+        except Exception as e:
+            print(f"⚠️ Public dashboard refresh failed: {e}")
+
+
+async def start_dashboard_refresher():
+    """Build the first bundle and keep it fresh in the background"""
+    global _refresher
+    try:
+        await refresh_dashboard()
+    except Exception as e:
+        print(f"⚠️ Public dashboard build failed: {e}")
+    if _refresher is None or _refresher.done():
+        _refresher = asyncio.get_running_loop().create_task(_refresh_forever())
+
+
+async def stop_dashboard_refresher():
+    global _refresher
+    if _refresher and not _refresher.done():
+        _refresher.cancel()
+    _refresher = None
@@ -0,0 +1,88 @@
+"""
+Dashboard Stats Snapshot
+The counters behind /outbreaks/stats, /stats/dashboard and /stats/zones,
+computed with one conditional-aggregate query per table (run concurrently
+on separate pooled connections) and shared by every request for
+STATS_SNAPSHOT_TTL_SECONDS, so many admins polling the dashboard cost one
+scan per window.
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy import select, func, distinct
+
+from app.core.config import settings
+from app.core.database import engine
+from app.models.broadcast import Broadcast
+from app.models.doctor import DoctorOutbreak
+from app.models.outbreak import Hospital, Outbreak
+
+_snapshot: Optional[Dict[str, Any]] = None
+_taken_at = 0.0
+_lock = asyncio.Lock()
+
+OUTBREAK_TOTALS = select(
+    func.count().label('total'),
+    func.count().filter(Outbreak.verified == False).label('unverified'),
+    func.count().filter(Outbreak.severity == 'severe').label('severe'),
+    func.coalesce(func.sum(Outbreak.patient_count), 0).label('patients'),
+    func.count(distinct(Hospital.id)).label('hospitals'),
+    func.count(distinct(Hospital.state)).label('states'),
+).select_from(Outbreak).outerjoin(Hospital, Outbreak.hospital_id == Hospital.id)
+
+DOCTOR_TOTALS = select(
+    func.count().label('total'),
+    func.count().filter(DoctorOutbreak.severity == 'severe').label('severe'),
+    func.coalesce(func.sum(DoctorOutbreak.patient_count), 0).label('patients'),
+    func.count(distinct(DoctorOutbreak.location_name)).label('hospitals'),
+    func.count(distinct(DoctorOutbreak.state)).label('states'),
+).where(DoctorOutbreak.status == 'approved')
+
+ACTIVE_BROADCASTS = select(func.count(Broadcast.id).label('active')).where(Broadcast.is_active == True)
+
+EMPTY_DOCTOR_TOTALS = {'total': 0, 'severe': 0, 'patients': 0, 'hospitals': 0, 'states': 0}
+
+
+async def _fetch(query) -> Dict[str, Any]:
+    """One query on its own pooled connection, as a dict of the first row"""
+    async with engine.connect() as conn:
+        result = await conn.execute(query)
+        return dict(result.mappings().one())
+
+
+async def _collect() -> Dict[str, Any]:
+    outbreaks, doctor, broadcasts = await asyncio.gather(
+        _fetch(OUTBREAK_TOTALS), _fetch(DOCTOR_TOTALS), _fetch(ACTIVE_BROADCASTS),
+        return_exceptions=True
+    )
+    if isinstance(outbreaks, BaseException):
+        raise outbreaks
+    if isinstance(doctor, BaseException):
+        print(f"Error querying doctor_outbreaks: {doctor}")
+        doctor = dict(EMPTY_DOCTOR_TOTALS)
+    if isinstance(broadcasts, BaseException):
+        print(f"Error querying broadcasts: {broadcasts}")
+        broadcasts = {'active': 0}
+    return {
+        'outbreaks': outbreaks,
+        'doctor_outbreaks': doctor,
+        'active_broadcasts': broadcasts['active'],
+    }
+
+
+async def get_stats_snapshot() -> Dict[str, Any]:
+    """
+    Current snapshot, recomputed at most once per TTL window. Concurrent
+    callers that find it stale wait for a single recomputation.
+    """
+    global _snapshot, _taken_at
+    if _snapshot is not None and time.monotonic() - _taken_at < settings.STATS_SNAPSHOT_TTL_SECONDS:
+        return _snapshot
+
+    async with _lock:
+        if _snapshot is None or time.monotonic() - _taken_at >= settings.STATS_SNAPSHOT_TTL_SECONDS:
+            _snapshot = await _collect()
+            _taken_at = time.monotonic()
+        return _snapshot
@@ -0,0 +1,138 @@
+"""
+Outbreak listing benchmark
+Fills a scratch SQLite database with outbreaks and times _get_outbreaks
+(the /outbreaks and /outbreaks/all query) for pages at increasing depth,
+paged by offset and by (date_reported, id) cursor, then compares the
+map / table / full view profiles by page time and payload size.
+
+Usage: python benchmark_pagination.py [rows]     # default 1,000,000
+"""
+
+import asyncio
+import json
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+
+sys.path.insert(0, '.')
+
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+
+from app.core.database import Base
+import app.models  # noqa: F401 - registers every table on Base.metadata
+from app.api.v1.outbreaks import _get_outbreaks, encode_cursor, OUTBREAK_VIEWS
+
+PAGE = 100
+VIEW_PAGE = 1000
+HOSPITALS = 500
+REPEATS = 5
+
+
+def make_database(path: str, rows: int):
+    Base.metadata.create_all(create_engine(f"sqlite:///{path}"))
+    conn = sqlite3.connect(path)
+    hospital_ids = [str(uuid.uuid4()) for _ in range(HOSPITALS)]
+    conn.executemany(
+        "INSERT INTO hospitals (id, name, address, city, state) VALUES (?, ?, 'bench', ?, ?)",
+        [(h, f"Hospital {i}", f"City {i % 50}", f"State {i % 20}") for i, h in enumerate(hospital_ids)]
+    )
+    rng = random.Random(0)
+    start = datetime(2024, 1, 1)
+    # Typical JSON payloads of a doctor report (unused by the map view)
+    ages = json.dumps({"0-18": 4, "19-40": 9, "41-60": 6, "60+": 3})
+    genders = json.dumps({"male": 12, "female": 10})
+    symptoms = json.dumps(["fever", "headache", "joint_pain", "rash"])
+    insert = (
+        "INSERT INTO outbreaks (id, hospital_id, disease_type, patient_count, date_started, date_reported, "
+        "severity, age_distribution, gender_distribution, symptoms, notes, verified) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1)"
+    )
+    batch = []
+    for i in range(rows):
+        # Whole seconds, so many rows share a timestamp and the id tiebreak matters
+        reported = (start + timedelta(seconds=rng.randrange(0, 60 * 60 * 24 * 600))).strftime('%Y-%m-%d %H:%M:%S')
+        batch.append((str(uuid.uuid4()), rng.choice(hospital_ids), 'Dengue', 10, reported, reported, 'mild',
+                      ages, genders, symptoms, 'Cluster reported by district surveillance officer'))
+        if len(batch) == 50000:
+            conn.executemany(insert, batch)
+            batch = []
+    if batch:
+        conn.executemany(insert, batch)
+    conn.commit()
+    conn.execute("ANALYZE")
+    conn.close()
+
+
+def cursor_at(path: str, depth: int) -> str:
+    """Cursor that resumes right after the first `depth` rows"""
+    conn = sqlite3.connect(path)
+    date_reported, outbreak_id = conn.execute(
+        "SELECT date_reported, id FROM outbreaks ORDER BY date_reported DESC, id DESC LIMIT 1 OFFSET ?",
+        (depth - 1,)
+    ).fetchone()
+    conn.close()
+    return encode_cursor(date_reported, outbreak_id)
+
+
+async def timed(db: AsyncSession, **kwargs) -> float:
+    """Median wall time of one page in milliseconds"""
+    samples = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        page, _ = await _get_outbreaks(db, limit=PAGE, **kwargs)
+        samples.append((time.perf_counter() - start) * 1000)
+        assert len(page) == PAGE
+    return sorted(samples)[len(samples) // 2]
+
+
+async def run_views(db: AsyncSession):
+    """Page time, per-row cost and JSON size of each view profile"""
+    print(f"\nView profiles ({VIEW_PAGE} rows per page):")
+    print(f"{'view':>8} {'page ms':>9} {'us/row':>8} {'KB':>8} {'B/row':>7}")
+    for view, fields in OUTBREAK_VIEWS.items():
+        samples = []
+        for _ in range(REPEATS):
+            start = time.perf_counter()
+            page, _ = await _get_outbreaks(db, limit=VIEW_PAGE, fields=fields)
+            payload = json.dumps(page)
+            samples.append((time.perf_counter() - start) * 1000)
+        elapsed = sorted(samples)[len(samples) // 2]
+        print(f"{view:>8} {elapsed:9.2f} {elapsed * 1000 / VIEW_PAGE:8.1f} "
+              f"{len(payload) / 1024:8.1f} {len(payload) / VIEW_PAGE:7.0f}")
+
+
+async def run(rows: int = 1000000):
+    directory = tempfile.mkdtemp(prefix="symptomap-bench-")
+    path = os.path.join(directory, "bench.db")
+    print("=" * 70)
+    print(f"OUTBREAK PAGINATION BENCHMARK ({rows:,} rows, {PAGE} per page)")
+    print("=" * 70)
+    start = time.perf_counter()
+    make_database(path, rows)
+    print(f"\nBuilt scratch database in {time.perf_counter() - start:.1f}s")
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    depths = [d for d in (0, 1000, 10000, 100000, 500000, rows - PAGE) if d <= rows - PAGE]
+    print(f"\n{'page depth':>12} {'offset ms':>10} {'cursor ms':>10}")
+    async with AsyncSession(engine) as db:
+        await _get_outbreaks(db, limit=PAGE)  # warm-up
+        for depth in depths:
+            by_offset = await timed(db, offset=depth)
+            by_cursor = await timed(db, cursor=cursor_at(path, depth)) if depth else by_offset
+            print(f"{depth:>12,} {by_offset:10.2f} {by_cursor:10.2f}")
+        await run_views(db)
+    await engine.dispose()
+
+    for name in os.listdir(directory):
+        os.remove(os.path.join(directory, name))
+    os.rmdir(directory)
+
+
+if __name__ == "__main__":
+    asyncio.run(run(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000))
@@ -0,0 +1,199 @@
+"""
+SEIR integrator benchmark
+Compares the legacy pure-Python Euler loop with the seir_kernel backends,
+reports how far rk4 / solve_ivp drift from the euler reference, times the
+batched all-states simulation against one model per state, tracks
+Monte Carlo ensemble size against latency, times the coupled
+metapopulation forecast, and microbenchmarks the kernel itself plus each
+of its call sites.
+
+Usage: python benchmark_seir.py [days]
+       python benchmark_seir.py --kernel   # kernel microbenchmarks only
+"""
+
+import sys
+import time
+from datetime import datetime, timezone, timedelta
+
+sys.path.insert(0, '.')
+
+import numpy as np
+
+from app.services import seir_kernel
+from app.api.v1.predictions import SEIRModel
+from app.api.v1.model_validation import run_seir_simulation, simulate_peak_infected
+from app.api.v1.predictions_enhanced import (
+    EnhancedSEIRModel, DISEASE_PARAMS, INDIA_STATES, simulate_regions, simulate_ensemble,
+    simulate_metapopulation, build_mobility_matrix
+)
+from app.api.v1.training_data import get_parameter_spread
+
+REPEATS = 200
+
+
+def legacy_simulate(model: EnhancedSEIRModel, days: int):
+    """The original dict-per-day Euler loop, kept here as the baseline"""
+    S, E, I, R = float(model.S0), float(model.E0), float(model.I0), float(model.R0_value)
+    results = []
+    dt = 0.1
+    for day in range(days + 1):
+        results.append({
+            'day': day,
+            'date': (datetime.now(timezone.utc) + timedelta(days=day)).date().isoformat(),
+            'susceptible': int(S), 'exposed': int(E), 'infected': int(I), 'recovered': int(R),
+            'new_cases': int(max(0, model.sigma * E)), 'total_cases': int(I + R), 'active_cases': int(I)
+        })
+        for _ in range(10):
+            dS = -model.beta * S * I / model.N
+            dE = model.beta * S * I / model.N - model.sigma * E
+            dI = model.sigma * E - model.gamma * I
+            dR = model.gamma * I
+            S = max(0, S + dS * dt)
+            E = max(0, E + dE * dt)
+            I = max(0, I + dI * dt)
+            R = min(model.N, R + dR * dt)
+    for i, point in enumerate(results):
+        uncertainty = 0.10 + (i / len(results)) * 0.20
+        for key in ['infected', 'exposed', 'new_cases']:
+            point[f'{key}_lower'] = max(0, int(point[key] * (1 - uncertainty)))
+            point[f'{key}_upper'] = int(point[key] * (1 + uncertainty))
+    return results
+
+
+def timeit(fn, repeats: int = REPEATS) -> float:
+    """Average wall time in milliseconds (after one untimed warm-up call)"""
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) / repeats * 1000
+
+
+def run(days: int = 90):
+    print("=" * 70)
+    print(f"SEIR INTEGRATOR BENCHMARK ({days}-day horizon, {REPEATS} runs each)")
+    print("=" * 70)
+
+    model = EnhancedSEIRModel(50000000, 150, beta=0.45, sigma=0.2, gamma=0.1, intervention_factor=0.85)
+
+    baseline = timeit(lambda: legacy_simulate(model, days))
+    print(f"\n{'legacy python loop':<28} {baseline:8.3f} ms   1.00x")
+    for method in seir_kernel.INTEGRATORS:
+        repeats = 20 if method == "solve_ivp" else REPEATS
+        simulate = timeit(lambda: model.simulate(days, method=method), repeats)
+        arrays = timeit(lambda: model.simulate_arrays(days, method=method), repeats)
+        print(f"{method + ' (dicts)':<28} {simulate:8.3f} ms {baseline / simulate:6.2f}x")
+        print(f"{method + ' (arrays only)':<28} {arrays:8.3f} ms {baseline / arrays:6.2f}x")
+
+    print("\nDeviation from euler reference (peak infected / peak day):")
+    worst = 0.0
+    for disease, params in DISEASE_PARAMS.items():
+        m = EnhancedSEIRModel(50000000, 500, params['beta'], params['sigma'], params['gamma'])
+        reference = m.simulate_arrays(days, method="euler")[:, 2]
+        line = f"  {disease:<14}"
+        for method in ("rk4", "solve_ivp"):
+            infected = m.simulate_arrays(days, method=method)[:, 2]
+            rel = abs(infected.max() - reference.max()) / max(reference.max(), 1.0)
+            shift = int(infected.argmax()) - int(reference.argmax())
+            worst = max(worst, rel) if method == "rk4" else worst
+            line += f"  {method}: {rel * 100:5.2f}% / {shift:+d}d"
+        print(line)
+    print(f"\nWorst rk4 peak deviation: {worst * 100:.2f}% (documented tolerance: 5%)")
+
+
+def run_states(days: int = 30):
+    """All INDIA_STATES: one model per state vs a single batched run"""
+    states = list(INDIA_STATES.values())
+    populations = [s['population'] for s in states]
+    cases = [1000] * len(states)
+    betas = [0.4 * s['risk_factor'] for s in states]
+
+    def sequential():
+        for population, beta in zip(populations, betas):
+            model = EnhancedSEIRModel(population, 1000, beta=beta, sigma=0.2, gamma=0.1)
+            forecast = model.simulate(days)
+            max(forecast, key=lambda x: x['infected'])
+
+    def batched():
+        simulate_regions(populations, cases, betas, 0.2, 0.1, days)
+
+    one = timeit(lambda: EnhancedSEIRModel(populations[0], 1000, betas[0]).simulate(days))
+    seq = timeit(sequential, 50)
+    bat = timeit(batched, 50)
+    print(f"\nAll {len(states)} states, {days} days:")
+    print(f"  {'single state simulate':<26} {one:8.3f} ms")
+    print(f"  {'one model per state':<26} {seq:8.3f} ms")
+    print(f"  {'simulate_regions batch':<26} {bat:8.3f} ms   {seq / bat:5.1f}x")
+
+
+def run_ensemble(days: int = 90):
+    """Ensemble uncertainty bands: members vs latency"""
+    model = EnhancedSEIRModel(50000000, 150, beta=0.45, sigma=0.2, gamma=0.1, intervention_factor=0.85)
+    spread = get_parameter_spread("Dengue")
+    print(f"\nMonte Carlo ensemble, {days} days (spread {spread}):")
+    for members in (100, 500, 1000, 2000, 5000):
+        elapsed = timeit(lambda: simulate_ensemble(model, days, members, spread), 10)
+        print(f"  {members:>5} members  {elapsed:8.2f} ms")
+
+
+def run_spatial(days: int = 90):
+    """Metapopulation forecast over all states, coupled vs uncoupled"""
+    seeded = {'Maharashtra': 80, 'Delhi': 70}
+    matrix = build_mobility_matrix()
+    print(f"\nMetapopulation, {len(INDIA_STATES)} states x {days} days "
+          f"({matrix.nnz} non-zeros, {matrix.nnz / matrix.shape[0] ** 2:.0%} dense):")
+    for method in ("euler", "rk4", "solve_ivp"):
+        coupled = timeit(lambda: simulate_metapopulation(seeded, 0.4, 0.25, 0.14, days, method=method),
+                         5 if method == "solve_ivp" else 50)
+        print(f"  {method:<10} {coupled:8.3f} ms")
+    states = list(INDIA_STATES.values())
+    uncoupled = timeit(lambda: simulate_regions(
+        [s['population'] for s in states], [80] * len(states), 0.4, 0.25, 0.14, days), 50)
+    print(f"  {'uncoupled simulate_regions (rk4)':<32} {uncoupled:8.3f} ms")
+
+
+def run_kernel(days: int = 90):
+    """Kernel microbenchmarks: scalar vs batch per integrator, helpers, call sites"""
+    print(f"\nseir_kernel microbenchmarks ({days} days):")
+    N, beta, sigma, gamma = 10000000.0, 0.45, 0.2, 0.1
+    y0 = seir_kernel.initial_state(N, 150, 375, 45)
+
+    print(f"  {'integrator':<12} {'batch':>6} {'ms/run':>10} {'us/member':>10}")
+    for method in ("euler", "rk4", "solve_ivp"):
+        for batch in (None, 1, 16, 256, 1024):
+            if method == "solve_ivp" and batch and batch > 16:
+                continue
+            state = y0 if batch is None else np.tile(y0, (batch, 1))
+            repeats = 5 if method == "solve_ivp" or (batch or 1) >= 256 else 50
+            elapsed = timeit(lambda: seir_kernel.integrate(state, N, beta, sigma, gamma, days, method=method), repeats)
+            label = "scalar" if batch is None else str(batch)
+            print(f"  {method:<12} {label:>6} {elapsed:10.3f} {elapsed * 1000 / (batch or 1):10.1f}")
+
+    trajectory = seir_kernel.integrate(np.tile(y0, (1024, 1)), N, beta, sigma, gamma, days)
+    horizon = np.random.default_rng(0).integers(10, days, 1024)
+    print(f"  {'initial_state x1024':<26} {timeit(lambda: seir_kernel.initial_state(np.full(1024, N), 150, 375, 45)):8.3f} ms")
+    print(f"  {'peak x1024 (horizon mask)':<26} {timeit(lambda: seir_kernel.peak(trajectory, horizon=horizon)):8.3f} ms")
+
+    print("\n  Call sites:")
+    model = EnhancedSEIRModel(int(N), 150, beta, sigma, gamma)
+    runs = ([150] * 48, [beta] * 48, [sigma] * 48, [gamma] * 48, [days] * 48)
+    sites = {
+        'SEIRModel.simulate': lambda: SEIRModel(int(N), 150, beta, sigma, gamma).simulate(days),
+        'EnhancedSEIRModel.simulate': lambda: model.simulate(days),
+        'run_seir_simulation': lambda: run_seir_simulation(int(N), 150, beta, sigma, gamma, days),
+        'simulate_peak_infected x8': lambda: simulate_peak_infected(*(r[:8] for r in runs)),
+        'simulate_peak_infected x48': lambda: simulate_peak_infected(*runs),
+    }
+    for name, fn in sites.items():
+        print(f"  {name:<28} {timeit(fn, 20):8.3f} ms")
+
+
+if __name__ == "__main__":
+    if "--kernel" in sys.argv:
+        run_kernel()
+        sys.exit(0)
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 90)
+    run_states()
+    run_ensemble()
+    run_spatial()
+    run_kernel()
@@ -0,0 +1,127 @@
+"""
+Response serialization benchmark
+Times the JSON encoding of typical endpoint payloads the way FastAPI did it
+before (jsonable_encoder + JSONResponse) and through the shared orjson
+encoder (app.core.serialization), and checks both produce the same JSON.
+
+Usage: python benchmark_serialization.py [rows]     # default 1,000
+"""
+
+import json
+import random
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, '.')
+
+import numpy as np
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.core.serialization import dumps, loads
+
+REPEATS = 20
+STATES = ['Maharashtra', 'Delhi', 'Karnataka', 'Kerala', 'Gujarat', 'Punjab']
+
+
+def outbreaks_page(rows: int) -> dict:
+    """/outbreaks/all: full-view rows with hospital summaries"""
+    rng = random.Random(0)
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    outbreaks = []
+    for i in range(rows):
+        reported = now - timedelta(minutes=rng.randrange(0, 60 * 24 * 90))
+        outbreaks.append({
+            "id": uuid.uuid4(),
+            "hospital": {"id": uuid.uuid4(), "name": f"Hospital {i % 500}",
+                         "city": f"City {i % 50}", "state": STATES[i % 6]},
+            "disease_type": "Dengue",
+            "patient_count": rng.randrange(1, 200),
+            "date_started": reported - timedelta(days=3),
+            "date_reported": reported,
+            "severity": "moderate",
+            "age_distribution": {"0-18": 4, "19-40": 9, "41-60": 6, "60+": 3},
+            "gender_distribution": {"male": 12, "female": 10},
+            "symptoms": ["fever", "headache", "joint_pain", "rash"],
+            "notes": "Cluster reported by district surveillance officer",
+            "verified": True,
+        })
+    return {"outbreaks": outbreaks, "total": rows, "next_cursor": None}
+
+
+def geojson(rows: int) -> dict:
+    """/outbreaks/map/geojson and /hospitals/geojson: point features"""
+    rng = random.Random(1)
+    return {"type": "FeatureCollection", "features": [{
+        "type": "Feature",
+        "geometry": {"type": "Point", "coordinates": [68 + rng.random() * 29, 8 + rng.random() * 29]},
+        "properties": {"id": str(uuid.uuid4()), "disease": "Malaria", "cases": rng.randrange(1, 500),
+                       "severity": "severe", "reported": datetime(2026, 1, 1) + timedelta(hours=i)},
+    } for i in range(rows)]}
+
+
+def forecast(days: int) -> dict:
+    """/predictions/forecast: SEIR compartments as NumPy arrays, per-state breakdown"""
+    t = np.arange(days, dtype=np.float64)
+    curves = {name: np.exp(-((t - days / 2) / (days / 5)) ** 2) * scale
+              for name, scale in (("susceptible", 1e6), ("exposed", 4e3), ("infected", 9e3), ("recovered", 2e5))}
+    return {
+        "generated_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
+        "forecast_days": days,
+        "r0": np.float64(1.84),
+        "peak_day": np.int64(days // 2),
+        "series": curves,
+        "dates": [datetime(2026, 1, 1) + timedelta(days=d) for d in range(days)],
+        "states": {state: {"infected": curves["infected"] * (i + 1) / 10, "beds_needed": np.int64(40 * i)}
+                   for i, state in enumerate(STATES)},
+    }
+
+
+def with_lists(payload):
+    """The forecast as endpoints had to return it: NumPy values converted by hand"""
+    if isinstance(payload, dict):
+        return {k: with_lists(v) for k, v in payload.items()}
+    if isinstance(payload, np.ndarray):
+        return payload.tolist()
+    if isinstance(payload, np.generic):
+        return payload.item()
+    return payload
+
+
+def before(payload) -> bytes:
+    return JSONResponse(None).render(jsonable_encoder(payload))
+
+
+def median_ms(fn, payload) -> float:
+    samples = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fn(payload)
+        samples.append((time.perf_counter() - start) * 1000)
+    return sorted(samples)[len(samples) // 2]
+
+
+def run(rows: int = 1000):
+    print("=" * 70)
+    print(f"RESPONSE SERIALIZATION BENCHMARK ({rows:,} rows per list payload)")
+    print("=" * 70)
+
+    payloads = [
+        ("/outbreaks/all", outbreaks_page(rows), None),
+        ("/outbreaks/map/geojson", geojson(rows), None),
+        ("/predictions/forecast", forecast(max(rows // 10, 30)), with_lists),
+    ]
+    print(f"\n{'endpoint':<24} {'before ms':>10} {'orjson ms':>10} {'speedup':>8} {'KB':>8}")
+    for name, payload, prepare in payloads:
+        # jsonable_encoder rejects NumPy values, so "before" includes converting them
+        legacy = (lambda p: before(prepare(p))) if prepare else before
+        old_body, new_body = legacy(payload), dumps(payload)
+        assert json.loads(old_body) == loads(new_body), f"{name}: encoders disagree"
+        old_ms, new_ms = median_ms(legacy, payload), median_ms(dumps, payload)
+        print(f"{name:<24} {old_ms:10.2f} {new_ms:10.2f} {old_ms / new_ms:7.1f}x {len(new_body) / 1024:8.1f}")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
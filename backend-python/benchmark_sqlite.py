@@ -0,0 +1,164 @@
+"""
+SQLite concurrency benchmark
+Runs doctor-submission style writers alongside dashboard-style readers on a
+scratch database, once with SQLite's defaults (rollback journal) and once
+with the tuned profile from app.core.database.sqlite_pragmas(), and reports
+throughput, read latency and lock errors for each.
+
+Usage: python benchmark_sqlite.py [seconds] [readers] [writers]
+"""
+
+import os
+import sqlite3
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, '.')
+
+from app.core.database import sqlite_pragmas, apply_sqlite_pragmas
+
+SEED_ROWS = 20000
+
+SCHEMA = '''
+    CREATE TABLE doctor_outbreaks (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        disease_type TEXT, patient_count INTEGER, severity TEXT,
+        state TEXT, status TEXT, created_at TEXT
+    )
+'''
+
+INSERT = '''
+    INSERT INTO doctor_outbreaks (disease_type, patient_count, severity, state, status, created_at)
+    VALUES (?, ?, ?, ?, ?, datetime('now'))
+'''
+
+READS = [
+    "SELECT COUNT(*), SUM(patient_count) FROM doctor_outbreaks WHERE status = 'approved'",
+    "SELECT state, COUNT(*), SUM(patient_count) FROM doctor_outbreaks GROUP BY state",
+    "SELECT severity, COUNT(*) FROM doctor_outbreaks WHERE status = 'approved' GROUP BY severity",
+]
+
+DISEASES = ['Dengue', 'Malaria', 'COVID-19', 'Typhoid', 'Cholera']
+STATES = ['Maharashtra', 'Delhi', 'Karnataka', 'Kerala', 'Gujarat', 'Punjab']
+SEVERITIES = ['mild', 'moderate', 'severe']
+
+
+def row(i: int) -> tuple:
+    return (DISEASES[i % 5], 10 + i % 90, SEVERITIES[i % 3], STATES[i % 6],
+            'approved' if i % 4 else 'pending')
+
+
+def make_database(path: str):
+    conn = sqlite3.connect(path)
+    conn.execute(SCHEMA)
+    conn.executemany(INSERT, (row(i) for i in range(SEED_ROWS)))
+    conn.commit()
+    conn.close()
+
+
+def run_profile(label: str, pragmas: list, seconds: float, readers: int, writers: int) -> dict:
+    directory = tempfile.mkdtemp(prefix="symptomap-bench-")
+    path = os.path.join(directory, "bench.db")
+    make_database(path)
+
+    stop = threading.Event()
+    lock = threading.Lock()
+    stats = {'reads': 0, 'writes': 0, 'errors': 0, 'latencies': []}
+
+    def connect():
+        # timeout=5.0 is the sqlite3 / aiosqlite default the app used before
+        conn = sqlite3.connect(path, timeout=5.0, check_same_thread=False)
+        apply_sqlite_pragmas(conn, pragmas)
+        return conn
+
+    def reader():
+        conn = connect()
+        latencies, reads, errors = [], 0, 0
+        while not stop.is_set():
+            start = time.perf_counter()
+            try:
+                for sql in READS:
+                    conn.execute(sql).fetchall()
+                reads += 1
+                latencies.append((time.perf_counter() - start) * 1000)
+            except sqlite3.OperationalError:
+                errors += 1
+        conn.close()
+        with lock:
+            stats['reads'] += reads
+            stats['errors'] += errors
+            stats['latencies'].extend(latencies)
+
+    def writer(offset: int):
+        conn = connect()
+        writes, errors, i = 0, 0, offset
+        while not stop.is_set():
+            try:
+                conn.execute(INSERT, row(i))
+                conn.commit()
+                writes += 1
+            except sqlite3.OperationalError:
+                conn.rollback()
+                errors += 1
+            i += writers
+        conn.close()
+        with lock:
+            stats['writes'] += writes
+            stats['errors'] += errors
+
+    threads = [threading.Thread(target=reader) for _ in range(readers)]
+    threads += [threading.Thread(target=writer, args=(w,)) for w in range(writers)]
+    for t in threads:
+        t.start()
+    time.sleep(seconds)
+    stop.set()
+    for t in threads:
+        t.join()
+
+    for name in os.listdir(directory):
+        os.remove(os.path.join(directory, name))
+    os.rmdir(directory)
+
+    latencies = sorted(stats['latencies']) or [0.0]
+    return {
+        'label': label,
+        'reads_per_s': stats['reads'] / seconds,
+        'writes_per_s': stats['writes'] / seconds,
+        'read_p50': statistics.median(latencies),
+        'read_p95': latencies[int(len(latencies) * 0.95) - 1] if len(latencies) > 1 else latencies[0],
+        'errors': stats['errors'],
+    }
+
+
+def run(seconds: float = 5.0, readers: int = 4, writers: int = 2):
+    print("=" * 70)
+    print(f"SQLITE CONCURRENCY BENCHMARK ({readers} readers, {writers} writers, {seconds:g}s each)")
+    print("=" * 70)
+    tuned = sqlite_pragmas()
+    print("\nTuned profile:")
+    for pragma in tuned:
+        print(f"  {pragma}")
+
+    results = [
+        run_profile("default (rollback journal)", ["PRAGMA journal_mode=DELETE"], seconds, readers, writers),
+        run_profile("tuned profile", tuned, seconds, readers, writers),
+    ]
+
+    print(f"\n{'profile':<28} {'reads/s':>9} {'writes/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'lock errors':>12}")
+    for r in results:
+        print(f"{r['label']:<28} {r['reads_per_s']:9.1f} {r['writes_per_s']:9.1f} "
+              f"{r['read_p50']:8.2f} {r['read_p95']:8.2f} {r['errors']:12d}")
+    before, after = results
+    if before['writes_per_s'] and before['reads_per_s']:
+        print(f"\nWrites {after['writes_per_s'] / before['writes_per_s']:.1f}x, "
+              f"reads {after['reads_per_s'] / before['reads_per_s']:.1f}x")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    run(float(args[0]) if args else 5.0,
+        int(args[1]) if len(args) > 1 else 4,
+        int(args[2]) if len(args) > 2 else 2)
@@ -0,0 +1,34 @@
+"""
+Rebuild the daily outbreak rollup and the outbreak map grid
+Recomputes outbreak_daily_rollup and outbreak_map_cells from the outbreaks
+table. Run after bulk loads or scripts that write or delete outbreaks
+directly (the API keeps them current; the server also rebuilds them at
+startup).
+
+Usage: python rebuild_rollup.py
+"""
+
+import asyncio
+import sys
+
+sys.path.insert(0, '.')
+
+from app.core.database import engine, Base, AsyncSessionLocal
+import app.models  # noqa: F401 - registers every table on Base.metadata
+from app.services.outbreak_rollup import rebuild_daily_rollup
+from app.services.outbreak_map_grid import rebuild_map_grid
+
+
+async def main():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSessionLocal() as db:
+        rows = await rebuild_daily_rollup(db)
+        cells = await rebuild_map_grid(db)
+    await engine.dispose()
+    print(f"✅ Daily outbreak rollup rebuilt ({rows} rows)")
+    print(f"✅ Outbreak map grid rebuilt ({cells} cells)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
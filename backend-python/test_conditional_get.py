@@ -0,0 +1,160 @@
+"""
+Conditional GET test
+Drives conditional_get-decorated handlers directly and checks that a
+matching If-None-Match / If-Modified-Since is answered with a 304 before the
+handler runs, that bumping a table the route reads changes its validators,
+that other tables do not, and that an epoch rotation voids every ETag and
+every VersionedCache entry. Stacked on cache_response, a version bump must
+also change the body, not just the ETag.
+
+Usage:
+    python test_conditional_get.py
+Also collected by pytest.
+"""
+
+import asyncio
+import os
+import sys
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.core.cache import conditional_get, cache_response, VersionedCache
+from app.core.data_version import bump_data_version, rotate_data_epoch, get_data_token
+
+
+def make_request(headers: dict = None) -> Request:
+    return Request({"type": "http", "method": "GET", "path": "/conditional", "query_string": b"",
+                    "headers": [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()]})
+
+
+async def get(endpoint, headers: dict = None, request_param: str = "conditional_request"):
+    """(status, headers) of one call, as FastAPI would send it"""
+    response = Response()
+    result = await endpoint(**{request_param: make_request(headers)}, conditional_response=response)
+    if isinstance(result, Response):
+        return result.status_code, result.headers
+    return 200, response.headers
+
+
+async def run() -> dict:
+    calls = {"handler": 0}
+    # Fresh tables per run: MockRedis outlives a run
+    outbreaks, broadcasts = f"outbreaks-{uuid.uuid4().hex}", f"broadcasts-{uuid.uuid4().hex}"
+
+    @conditional_get(outbreaks)
+    async def outbreak_listing():
+        calls["handler"] += 1
+        return {"items": []}
+
+    status, first = await get(outbreak_listing)
+    etag, last_modified = first["etag"], first["last-modified"]
+    revalidated = [
+        (await get(outbreak_listing, {"If-None-Match": etag}))[0],
+        (await get(outbreak_listing, {"If-None-Match": f'"other", {etag}'}))[0],
+        (await get(outbreak_listing, {"If-Modified-Since": last_modified}))[0],
+    ]
+    handler_calls = calls["handler"]
+
+    await bump_data_version(broadcasts)
+    unrelated_write = (await get(outbreak_listing, {"If-None-Match": etag}))[0]
+
+    await bump_data_version(outbreaks)
+    related_status, related = await get(outbreak_listing, {"If-None-Match": etag})
+
+    # Version 0 of a fresh table, cached before the rotation
+    forecasts = VersionedCache(f"forecast-{uuid.uuid4().hex}")
+    fresh_table = f"doctor_outbreaks-{uuid.uuid4().hex}"
+    await forecasts.set(await get_data_token(fresh_table), {"cases": 1}, "likely")
+
+    await rotate_data_epoch()
+    rotated_status, rotated = await get(outbreak_listing, {"If-None-Match": related["etag"]})
+    # Counters restarting at 0 under the new epoch must not hit the old entry
+    versioned_after_rotation = await forecasts.get(await get_data_token(fresh_table), "likely")
+
+    # Stacked on cache_response, both share the one injected Request
+    @conditional_get(outbreaks)
+    @cache_response(ttl_seconds=60)
+    async def cached_listing():
+        return {"items": []}
+
+    cached = await get(cached_listing, request_param="cache_request")
+    cached_again = await get(cached_listing, {"If-None-Match": cached[1]["etag"]}, request_param="cache_request")
+
+    # The data changes and its version is bumped, but no tags are purged
+    counts = {"active": 1}
+    stats_table = f"outbreaks-{uuid.uuid4().hex}"
+
+    @conditional_get(stats_table)
+    @cache_response(ttl_seconds=3600)
+    async def cached_stats():
+        return {"activeOutbreaks": counts["active"]}
+
+    async def fetch_stats():
+        response = Response()
+        body = await cached_stats(cache_request=make_request(), conditional_response=response)
+        return body["activeOutbreaks"], response.headers["etag"]
+
+    before_bump = await fetch_stats()
+    counts["active"] = 2
+    await bump_data_version(stats_table)
+    after_bump = await fetch_stats()
+
+    return {
+        "first": status,
+        "no_cache": first["cache-control"],
+        "revalidated": revalidated,
+        "handler_calls": handler_calls,
+        "unrelated_write": unrelated_write,
+        "related_write": (related_status, related["etag"] != etag),
+        "rotated": (rotated_status, rotated["etag"] != related["etag"]),
+        "stacked": (cached[0], cached_again[0]),
+        "versioned_after_rotation": versioned_after_rotation,
+        "stacked_bump": (before_bump[0], after_bump[0], before_bump[1] != after_bump[1]),
+    }
+
+
+def test_matching_validators_short_circuit():
+    result = asyncio.run(run())
+    assert result["first"] == 200 and result["no_cache"] == "no-cache"
+    assert result["revalidated"] == [304, 304, 304]
+    assert result["handler_calls"] == 1
+
+
+def test_writes_change_only_their_tables_validators():
+    result = asyncio.run(run())
+    assert result["unrelated_write"] == 304
+    assert result["related_write"] == (200, True)
+    assert result["rotated"] == (200, True)
+    assert result["stacked"] == (200, 304)
+    assert result["versioned_after_rotation"] is None
+
+
+def test_stacked_cache_follows_version_bumps():
+    result = asyncio.run(run())
+    assert result["stacked_bump"] == (1, 2, True)
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("CONDITIONAL GET")
+    print("=" * 60)
+    result = asyncio.run(run())
+    checks = [
+        (result["revalidated"] == [304, 304, 304] and result["handler_calls"] == 1,
+         f"matching validators answered {result['revalidated']} without running the handler"),
+        (result["unrelated_write"] == 304, "a write to another table keeps the ETag"),
+        (result["related_write"] == (200, True), "a write to a read table changes the ETag"),
+        (result["rotated"] == (200, True), "an epoch rotation changes the ETag"),
+        (result["versioned_after_rotation"] is None, "an epoch rotation misses old VersionedCache entries"),
+        (result["stacked"] == (200, 304), "works stacked on cache_response"),
+        (result["stacked_bump"] == (1, 2, True), "stacked: a version bump changes the body with the ETag"),
+    ]
+    for ok, label in checks:
+        print(f"{'✓' if ok else '❌'} {label}")
+    if not all(ok for ok, _ in checks):
+        sys.exit(1)
+    print("\n✅ Conditional GET behaves")
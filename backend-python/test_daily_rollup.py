@@ -0,0 +1,160 @@
+"""
+Daily outbreak rollup consistency test
+Writes outbreaks to a scratch SQLite database the way the endpoints do
+(record on insert, retract + record on verify, retract on delete) and checks
+that the incrementally maintained rollup matches a full rebuild, and that
+the analytics aggregates read from it match the same GROUP BYs run over
+the outbreaks table directly.
+
+Usage:
+    python test_daily_rollup.py
+Also collected by pytest.
+"""
+
+import asyncio
+import os
+import random
+import sys
+import tempfile
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import select, delete, text
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+
+from app.core.database import Base
+import app.models  # noqa: F401 - registers every table on Base.metadata
+from app.models.outbreak import Hospital, Outbreak, OutbreakDailyRollup
+from app.services.outbreak_rollup import record_outbreaks, retract_outbreaks, rebuild_daily_rollup
+
+DISEASES = ['Dengue', 'Malaria', 'COVID-19']
+SEVERITIES = ['mild', 'moderate', 'severe', None]
+STATES = ['Maharashtra', 'Delhi', None]
+
+# (analytics endpoint, query over outbreaks, same aggregate over the rollup)
+EQUIVALENT_QUERIES = [
+    ('trend-data',
+     "SELECT date(date_reported), COUNT(*), SUM(patient_count) FROM outbreaks "
+     "WHERE date_reported IS NOT NULL GROUP BY 1 ORDER BY 1",
+     "SELECT day, SUM(outbreak_count), SUM(case_count) FROM outbreak_daily_rollup "
+     "WHERE day != '' GROUP BY day ORDER BY day"),
+    ('disease-distribution',
+     "SELECT disease_type, COUNT(*), SUM(patient_count) FROM outbreaks GROUP BY 1 ORDER BY 1",
+     "SELECT disease_type, SUM(outbreak_count), SUM(case_count) FROM outbreak_daily_rollup GROUP BY 1 ORDER BY 1"),
+    ('severity-breakdown',
+     "SELECT severity, COUNT(*), SUM(patient_count) FROM outbreaks GROUP BY 1 ORDER BY 1",
+     "SELECT NULLIF(severity, ''), SUM(outbreak_count), SUM(case_count) FROM outbreak_daily_rollup "
+     "GROUP BY 1 ORDER BY 1"),
+    ('regional-stats',
+     "SELECT state, COUNT(*), SUM(patient_count), COUNT(CASE WHEN severity = 'severe' THEN 1 END), "
+     "SUM(verified) FROM outbreaks JOIN hospitals ON outbreaks.hospital_id = hospitals.id "
+     "WHERE state IS NOT NULL GROUP BY 1 ORDER BY 1",
+     "SELECT state, SUM(outbreak_count), SUM(case_count), "
+     "COALESCE(SUM(CASE WHEN severity = 'severe' THEN outbreak_count END), 0), SUM(verified_count) "
+     "FROM outbreak_daily_rollup WHERE state != '' GROUP BY 1 ORDER BY 1"),
+]
+
+
+async def rollup_rows(db: AsyncSession) -> list:
+    rows = await db.execute(
+        select(OutbreakDailyRollup.day, OutbreakDailyRollup.disease_type, OutbreakDailyRollup.state,
+               OutbreakDailyRollup.severity, OutbreakDailyRollup.outbreak_count,
+               OutbreakDailyRollup.case_count, OutbreakDailyRollup.verified_count)
+        .order_by(OutbreakDailyRollup.day, OutbreakDailyRollup.disease_type,
+                  OutbreakDailyRollup.state, OutbreakDailyRollup.severity)
+    )
+    return [tuple(row) for row in rows]
+
+
+async def exercise(db: AsyncSession) -> list:
+    """Random inserts, verifies and deletes through the rollup hooks"""
+    rng = random.Random(7)
+    hospitals = [Hospital(name=f"Hospital {i}", address="test", state=state) for i, state in enumerate(STATES)]
+    db.add_all(hospitals)
+    await db.flush()
+
+    now = datetime(2026, 3, 1, tzinfo=timezone.utc)
+    outbreaks = []
+    for _ in range(4):
+        batch = []
+        for _ in range(50):
+            reported = now - timedelta(hours=rng.randrange(0, 24 * 20))
+            batch.append(Outbreak(
+                hospital_id=rng.choice(hospitals).id if rng.random() < 0.9 else None,
+                disease_type=rng.choice(DISEASES), patient_count=rng.randrange(1, 100),
+                date_started=reported, date_reported=reported if rng.random() < 0.95 else None,
+                severity=rng.choice(SEVERITIES), verified=rng.random() < 0.3
+            ))
+        db.add_all(batch)
+        await db.flush()
+        await record_outbreaks(db, [o.id for o in batch])
+        outbreaks.extend(batch)
+        await db.commit()
+
+        # Verify a few (as outbreaks.verify_outbreak does)
+        for outbreak in rng.sample(outbreaks, 10):
+            if not outbreak.verified:
+                await retract_outbreaks(db, [outbreak.id])
+                outbreak.verified = True
+                await db.flush()
+                await record_outbreaks(db, [outbreak.id])
+        await db.commit()
+
+        # Delete a few
+        doomed = rng.sample(outbreaks, 5)
+        await retract_outbreaks(db, [o.id for o in doomed])
+        await db.execute(delete(Outbreak).where(Outbreak.id.in_([o.id for o in doomed])))
+        outbreaks = [o for o in outbreaks if o not in doomed]
+        await db.commit()
+
+    return await rollup_rows(db)
+
+
+async def run() -> dict:
+    directory = tempfile.mkdtemp(prefix="symptomap-test-")
+    path = os.path.join(directory, "rollup.db")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with AsyncSession(engine, expire_on_commit=False) as db:
+            incremental = await exercise(db)
+            equivalent = {}
+            for name, direct_sql, rollup_sql in EQUIVALENT_QUERIES:
+                direct = [tuple(r) for r in await db.execute(text(direct_sql))]
+                from_rollup = [tuple(r) for r in await db.execute(text(rollup_sql))]
+                equivalent[name] = direct == from_rollup
+            await rebuild_daily_rollup(db)
+            rebuilt = await rollup_rows(db)
+    finally:
+        await engine.dispose()
+        for name in os.listdir(directory):
+            os.remove(os.path.join(directory, name))
+        os.rmdir(directory)
+    return {'incremental': incremental, 'rebuilt': rebuilt, 'equivalent': equivalent}
+
+
+def test_incremental_rollup_matches_rebuild():
+    result = asyncio.run(run())
+    assert result['incremental']
+    assert result['incremental'] == result['rebuilt']
+
+
+def test_rollup_answers_analytics_queries():
+    result = asyncio.run(run())
+    assert all(result['equivalent'].values()), result['equivalent']
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("DAILY OUTBREAK ROLLUP CONSISTENCY")
+    print("=" * 60)
+    result = asyncio.run(run())
+    matches = result['incremental'] == result['rebuilt']
+    print(f"\n{'✓' if matches else '❌'} incremental rollup ({len(result['incremental'])} rows) matches rebuild")
+    for name, ok in result['equivalent'].items():
+        print(f"{'✓' if ok else '❌'} {name} from rollup matches outbreaks GROUP BY")
+    if not matches or not all(result['equivalent'].values()):
+        sys.exit(1)
+    print("\n✅ Rollup is consistent")
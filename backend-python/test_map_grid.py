@@ -0,0 +1,141 @@
+"""
+Outbreak map grid consistency test
+Writes outbreaks to a scratch SQLite database the way the endpoints do
+(index on insert) and checks that the incrementally maintained grid matches
+a full rebuild, that the clusters of every zoom level account for every
+outbreak in the time window, and that a viewport returns no more clusters
+than it has cells.
+
+Usage:
+    python test_map_grid.py
+Also collected by pytest.
+"""
+
+import asyncio
+import os
+import random
+import sys
+import tempfile
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+
+from app.core.database import Base
+import app.models  # noqa: F401 - registers every table on Base.metadata
+from app.models.outbreak import Hospital, Outbreak, OutbreakMapCell
+from app.services.outbreak_map_grid import (
+    MAX_ZOOM, index_outbreaks, rebuild_map_grid, query_clusters, viewport_cells
+)
+
+DISEASES = ['Dengue', 'Malaria', 'COVID-19']
+SEVERITIES = ['mild', 'moderate', 'severe', None]
+WORLD = (-180.0, -85.0, 180.0, 85.0)
+INDIA = (68.0, 6.0, 98.0, 36.0)
+MUMBAI = (72.7, 18.8, 73.1, 19.3)
+
+
+async def grid_rows(db: AsyncSession) -> list:
+    columns = [c for c in OutbreakMapCell.__table__.columns]
+    rows = await db.execute(select(*columns).order_by(*OutbreakMapCell.__table__.primary_key.columns))
+    return [tuple(round(v, 6) if isinstance(v, float) else v for v in row) for row in rows]
+
+
+async def exercise(db: AsyncSession):
+    """Hospitals across India, outbreaks inserted in batches through the grid hook"""
+    rng = random.Random(11)
+    hospitals = [
+        Hospital(name=f"Hospital {i}", address="test",
+                 latitude=rng.uniform(8, 34), longitude=rng.uniform(69, 96))
+        for i in range(40)
+    ] + [
+        Hospital(name=f"Mumbai {i}", address="test",
+                 latitude=rng.uniform(18.9, 19.2), longitude=rng.uniform(72.8, 73.0))
+        for i in range(10)
+    ]
+    db.add_all(hospitals)
+    await db.flush()
+
+    now = datetime.now(timezone.utc)
+    for _ in range(4):
+        batch = []
+        for _ in range(100):
+            reported = now - timedelta(hours=rng.randrange(0, 24 * 60))
+            batch.append(Outbreak(
+                hospital_id=rng.choice(hospitals).id,
+                disease_type=rng.choice(DISEASES), patient_count=rng.randrange(1, 100),
+                date_started=reported, date_reported=reported, severity=rng.choice(SEVERITIES)
+            ))
+        db.add_all(batch)
+        await db.flush()
+        await index_outbreaks(db, [o.id for o in batch])
+        await db.commit()
+
+
+async def run() -> dict:
+    directory = tempfile.mkdtemp(prefix="symptomap-test-")
+    path = os.path.join(directory, "grid.db")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with AsyncSession(engine, expire_on_commit=False) as db:
+            await exercise(db)
+            incremental = await grid_rows(db)
+
+            since = (datetime.now(timezone.utc) - timedelta(days=30)).date()
+            in_window = await db.scalar(
+                select(func.count()).select_from(Outbreak).where(func.date(Outbreak.date_reported) >= since.isoformat())
+            )
+            totals = {}
+            for zoom in range(MAX_ZOOM + 1):
+                clusters = await query_clusters(db, zoom, WORLD, since.isoformat())
+                totals[zoom] = sum(c['outbreak_count'] for c in clusters)
+
+            bounded = {}
+            for bbox in (INDIA, MUMBAI):
+                for zoom in (4, 8, 12):
+                    x_min, y_min, x_max, y_max = viewport_cells(zoom, bbox)
+                    clusters = await query_clusters(db, zoom, bbox, since.isoformat())
+                    bounded[(bbox, zoom)] = len(clusters) <= (x_max - x_min + 1) * (y_max - y_min + 1)
+
+            await rebuild_map_grid(db)
+            rebuilt = await grid_rows(db)
+    finally:
+        await engine.dispose()
+        for name in os.listdir(directory):
+            os.remove(os.path.join(directory, name))
+        os.rmdir(directory)
+    return {'incremental': incremental, 'rebuilt': rebuilt, 'in_window': in_window,
+            'totals': totals, 'bounded': bounded}
+
+
+def test_incremental_grid_matches_rebuild():
+    result = asyncio.run(run())
+    assert result['incremental']
+    assert result['incremental'] == result['rebuilt']
+
+
+def test_clusters_cover_window_at_every_zoom():
+    result = asyncio.run(run())
+    assert result['in_window']
+    assert all(total == result['in_window'] for total in result['totals'].values()), result['totals']
+    assert all(result['bounded'].values())
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("OUTBREAK MAP GRID CONSISTENCY")
+    print("=" * 60)
+    result = asyncio.run(run())
+    matches = result['incremental'] == result['rebuilt']
+    covered = all(total == result['in_window'] for total in result['totals'].values())
+    bounded = all(result['bounded'].values())
+    print(f"\n{'✓' if matches else '❌'} incremental grid ({len(result['incremental'])} cells) matches rebuild")
+    print(f"{'✓' if covered else '❌'} clusters at zooms 0-{MAX_ZOOM} hold all {result['in_window']} outbreaks of the window")
+    print(f"{'✓' if bounded else '❌'} viewport clusters bounded by viewport cells")
+    if not (matches and covered and bounded):
+        sys.exit(1)
+    print("\n✅ Map grid is consistent")
@@ -0,0 +1,157 @@
+"""
+Map tile consistency test
+Renders outbreak tiles from a scratch SQLite database and checks that the
+tiles of every zoom level together hold every outbreak of the window, that
+cached tiles come back from memory and disk, that a write invalidates only
+the tiles its point falls in, and that old day variants are pruned from disk.
+
+Usage:
+    python test_map_tiles.py
+Also collected by pytest.
+"""
+
+import asyncio
+import os
+import random
+import shutil
+import sys
+import tempfile
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+
+from app.core.config import settings
+from app.core.database import Base
+import app.models  # noqa: F401 - registers every table on Base.metadata
+from app.models.outbreak import Hospital, Outbreak
+from app.services import map_tiles
+from app.services.outbreak_map_grid import index_outbreaks
+
+ZOOMS = (0, 2, 4)
+MUMBAI = (19.07, 72.87)
+DELHI = (28.61, 77.21)
+
+
+async def seed(db: AsyncSession) -> int:
+    rng = random.Random(5)
+    hospitals = [
+        Hospital(name=f"Hospital {i}", address="test",
+                 latitude=rng.uniform(8, 34), longitude=rng.uniform(69, 96))
+        for i in range(30)
+    ]
+    db.add_all(hospitals)
+    await db.flush()
+    now = datetime.now(timezone.utc)
+    outbreaks = [
+        Outbreak(hospital_id=rng.choice(hospitals).id, disease_type='Dengue',
+                 patient_count=rng.randrange(1, 50), severity=rng.choice(['mild', 'severe']),
+                 date_started=now, date_reported=now - timedelta(hours=rng.randrange(0, 24 * 10)))
+        for _ in range(200)
+    ]
+    db.add_all(outbreaks)
+    await db.flush()
+    await index_outbreaks(db, [o.id for o in outbreaks])
+    await db.commit()
+    return len(outbreaks)
+
+
+async def fetch(db: AsyncSession, z: int, x: int, y: int, since_day: str):
+    """The endpoint's cache-then-render path; returns (tile bytes, cache source)"""
+    variant = map_tiles.variant_of(since_day, None)
+    body, source = await map_tiles.cached_tile('outbreaks', z, x, y, variant)
+    if body is None:
+        epoch = map_tiles.current_epoch('outbreaks')
+        tile = await map_tiles.render_outbreak_tile(db, z, x, y, since_day, None)
+        body = await map_tiles.store_tile('outbreaks', z, x, y, variant, tile, epoch)
+    return body, source
+
+
+async def run() -> dict:
+    directory = tempfile.mkdtemp(prefix="symptomap-test-")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(directory, 'tiles.db')}")
+    original_dir = settings.MAP_TILE_CACHE_DIR
+    settings.MAP_TILE_CACHE_DIR = os.path.join(directory, "tiles")
+    await map_tiles.clear_tiles()
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with AsyncSession(engine, expire_on_commit=False) as db:
+            total = await seed(db)
+            since_day = (datetime.now(timezone.utc) - timedelta(days=30)).date().isoformat()
+
+            totals = {}
+            for z in ZOOMS:
+                count = 0
+                for x in range(1 << z):
+                    for y in range(1 << z):
+                        tile = await map_tiles.render_outbreak_tile(db, z, x, y, since_day, None)
+                        count += sum(f['properties']['point_count'] for f in tile['features'])
+                        assert all(0 <= f['x'] < map_tiles.TILE_EXTENT and 0 <= f['y'] < map_tiles.TILE_EXTENT
+                                   for f in tile['features'])
+                totals[z] = count
+
+            z = 6
+            mumbai = map_tiles.tile_at(*MUMBAI, z)
+            delhi = map_tiles.tile_at(*DELHI, z)
+            sources = [(await fetch(db, z, *mumbai, since_day))[1] for _ in range(2)]
+            await fetch(db, z, *delhi, since_day)
+            map_tiles._memory.clear()
+            sources.append((await fetch(db, z, *mumbai, since_day))[1])
+
+            await map_tiles.invalidate_point('outbreaks', *MUMBAI)
+            after_write = {
+                'mumbai': (await fetch(db, z, *mumbai, since_day))[1],
+                'delhi': (await fetch(db, z, *delhi, since_day))[1],
+            }
+
+            # One variant per day window: old days are pruned from disk
+            days = [(datetime.now(timezone.utc) - timedelta(days=d)).date().isoformat() for d in range(30, 40)]
+            for day in days:
+                await fetch(db, z, *delhi, day)
+            directory = map_tiles._tile_dir('outbreaks', z, *delhi)
+            on_disk = sorted(os.listdir(directory))
+            newest_kept = f"{map_tiles.variant_of(days[-1], None)}.json" in on_disk
+    finally:
+        await engine.dispose()
+        await map_tiles.clear_tiles()
+        settings.MAP_TILE_CACHE_DIR = original_dir
+        shutil.rmtree(directory, ignore_errors=True)
+    return {'total': total, 'totals': totals, 'sources': sources, 'after_write': after_write,
+            'disk_variants': len(on_disk), 'newest_kept': newest_kept}
+
+
+def test_tiles_cover_every_outbreak():
+    result = asyncio.run(run())
+    assert all(count == result['total'] for count in result['totals'].values()), result['totals']
+
+
+def test_tile_cache_and_scoped_invalidation():
+    result = asyncio.run(run())
+    assert result['sources'] == ['miss', 'memory', 'disk']
+    assert result['after_write'] == {'mumbai': 'miss', 'delhi': 'disk'}
+
+
+def test_disk_variants_are_bounded():
+    result = asyncio.run(run())
+    assert result['disk_variants'] == settings.MAP_TILE_DISK_VARIANTS
+    assert result['newest_kept']
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("MAP TILE CONSISTENCY")
+    print("=" * 60)
+    result = asyncio.run(run())
+    covered = all(count == result['total'] for count in result['totals'].values())
+    cached = result['sources'] == ['miss', 'memory', 'disk']
+    scoped = result['after_write'] == {'mumbai': 'miss', 'delhi': 'disk'}
+    bounded = result['disk_variants'] == settings.MAP_TILE_DISK_VARIANTS and result['newest_kept']
+    print(f"\n{'✓' if covered else '❌'} tiles at zooms {ZOOMS} hold all {result['total']} outbreaks")
+    print(f"{'✓' if cached else '❌'} repeat fetches served from {result['sources']}")
+    print(f"{'✓' if scoped else '❌'} write invalidates only its own tiles ({result['after_write']})")
+    print(f"{'✓' if bounded else '❌'} {result['disk_variants']} variants kept on disk per tile")
+    if not (covered and cached and scoped and bounded):
+        sys.exit(1)
+    print("\n✅ Map tiles are consistent")
@@ -0,0 +1,157 @@
+"""
+MockRedis behaviour test
+Checks the in-memory Redis fallback: TTLs (lazy expiry and the sweeper),
+LRU eviction at the entry and byte caps (sparing the data version keys),
+the list / hash / set commands, pipelines, and its stats.
+
+Usage:
+    python test_mock_redis.py
+Also collected by pytest.
+"""
+
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from redis.exceptions import ResponseError
+
+from app.core.redis import MockRedis
+
+
+async def check_ttl() -> dict:
+    r = MockRedis(max_entries=100, max_bytes=1 << 20, sweep_seconds=0.02)
+    await r.connect()
+    await r.set("short", "x", ex=0.05)
+    await r.set("long", "y", ex=60)
+    await r.set("forever", "z")
+    ttls = (await r.ttl("long"), await r.ttl("forever"), await r.ttl("missing"))
+    await r.set("lazy", "w", ex=0.05)
+    r._sweeper.cancel()  # expire "lazy" on access only
+    await asyncio.sleep(0.1)
+    lazy = await r.get("lazy")
+    r.sweep()
+    result = {
+        "ttls": ttls,
+        "short": await r.get("short"),
+        "lazy": lazy,
+        "long": await r.get("long"),
+        "forever": await r.get("forever"),
+        "expired": r.counters["expired"],
+        "reset_ttl": None,
+    }
+    await r.set("long", "y2")  # plain SET clears the TTL
+    result["reset_ttl"] = await r.ttl("long")
+    await r.disconnect()
+    return result
+
+
+async def check_eviction() -> dict:
+    by_count = MockRedis(max_entries=3, max_bytes=1 << 20)
+    for key in "abc":
+        await by_count.set(key, key)
+    await by_count.get("a")  # a becomes most recently used
+    await by_count.set("d", "d")
+
+    by_bytes = MockRedis(max_entries=1000, max_bytes=2000)
+    for i in range(10):
+        await by_bytes.set(f"chat:{i}", "m" * 500)
+    return {
+        "count_keys": sorted(by_count.store),
+        "bytes": by_bytes.bytes,
+        "byte_keys": list(by_bytes.store),
+        "evicted": by_count.counters["evicted"] + by_bytes.counters["evicted"],
+    }
+
+
+async def check_pinned() -> dict:
+    r = MockRedis(max_entries=4, max_bytes=1 << 20)
+    await r.set("data_version:epoch", "e:0")
+    await r.incr("data_version:outbreaks")
+    await r.set("data_modified:outbreaks", "0")
+    for i in range(10):
+        await r.set(f"cache:{i}", "x")
+    return {"keys": sorted(r.store), "evicted": r.counters["evicted"]}
+
+
+async def check_structures() -> dict:
+    r = MockRedis(max_entries=100, max_bytes=1 << 20)
+    await r.rpush("l", "b", "c")
+    await r.lpush("l", "a")
+    await r.ltrim("l", 0, 1)
+    list_lookups = r.counters["hits"] + r.counters["misses"]
+    await r.hset("h", mapping={"x": 1, "y": 2})
+    await r.hincrby("h", "x", 5)
+    await r.sadd("s", "a", "b", "a")
+    await r.srem("s", "a")
+    try:
+        await r.lrange("h", 0, -1)
+        wrongtype = False
+    except ResponseError:
+        wrongtype = True
+
+    async with r.pipeline() as pipe:
+        results = await pipe.incr("n").incr("n").expire("n", 60).get("n").execute()
+    return {
+        "list": await r.lrange("l", 0, -1),
+        "list_lookups": list_lookups,
+        "hash": await r.hgetall("h"),
+        "set": await r.smembers("s"),
+        "wrongtype": wrongtype,
+        "pipeline": results,
+        "stats": r.stats(),
+    }
+
+
+def test_ttl_semantics():
+    result = asyncio.run(check_ttl())
+    assert result["ttls"] == (60, -1, -2)
+    assert result["short"] is None and result["lazy"] is None
+    assert result["long"] == "y" and result["forever"] == "z"
+    assert result["expired"] == 2
+    assert result["reset_ttl"] == -1
+
+
+def test_lru_eviction_caps():
+    result = asyncio.run(check_eviction())
+    assert result["count_keys"] == ["a", "c", "d"]
+    assert result["bytes"] <= 2000
+    assert result["byte_keys"] == ["chat:7", "chat:8", "chat:9"]
+    assert result["evicted"] == 8
+
+
+def test_data_version_keys_are_never_evicted():
+    result = asyncio.run(check_pinned())
+    assert result["keys"] == ["cache:9", "data_modified:outbreaks", "data_version:epoch", "data_version:outbreaks"]
+    assert result["evicted"] == 9
+
+
+def test_lists_hashes_sets_pipeline():
+    result = asyncio.run(check_structures())
+    assert result["list"] == ["a", "b"]
+    assert result["hash"] == {"x": "6", "y": "2"}
+    assert result["set"] == {"b"}
+    assert result["wrongtype"]
+    assert result["pipeline"] == [1, 2, True, "2"]
+    assert result["stats"]["entries"] == 4 and result["stats"]["with_ttl"] == 1
+    # One lookup per list command (rpush, lpush, ltrim): ltrim does not count twice
+    assert result["list_lookups"] == 3
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("MOCK REDIS")
+    print("=" * 60)
+    failed = False
+    for test in (test_ttl_semantics, test_lru_eviction_caps, test_data_version_keys_are_never_evicted,
+                 test_lists_hashes_sets_pipeline):
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except AssertionError as e:
+            failed = True
+            print(f"❌ {test.__name__}: {e}")
+    if failed:
+        sys.exit(1)
+    print("\n✅ MockRedis behaves")
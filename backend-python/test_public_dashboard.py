@@ -0,0 +1,112 @@
+"""
+Public dashboard bundle test
+Seeds a scratch SQLite database and checks that the single-pass bundle
+behind /public/dashboard matches what /public/stats, /hotspots, /broadcasts
+and /grid-stats compute on their own, including outbreaks without a
+hospital, hospitals without a state and inactive broadcasts.
+
+Usage:
+    python test_public_dashboard.py
+Also collected by pytest.
+"""
+
+import asyncio
+import inspect
+import os
+import random
+import shutil
+import sys
+import tempfile
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+
+from app.core.database import Base
+import app.models  # noqa: F401 - registers every table on Base.metadata
+from app.models.broadcast import Broadcast
+from app.models.outbreak import Hospital, Outbreak
+from app.api.v1 import public
+from app.services.public_dashboard import collect_dashboard
+
+CITIES = ["Mumbai", "Delhi", "Pune", "Chennai", "Kolkata", "Jaipur", "Surat", None]
+
+
+async def seed(db: AsyncSession):
+    rng = random.Random(11)
+    hospitals = [
+        Hospital(name=f"Hospital {i}", address="test", city=CITIES[i % len(CITIES)],
+                 state=None if i % 9 == 0 else f"State {i % 4}")
+        for i in range(40)
+    ]
+    db.add_all(hospitals)
+    await db.flush()
+    now = datetime.now(timezone.utc)
+    db.add_all([
+        Outbreak(hospital_id=None if i % 25 == 0 else rng.choice(hospitals).id,
+                 disease_type='Dengue', patient_count=rng.randrange(1, 40),
+                 severity=rng.choice(['mild', 'moderate', 'severe', None]),
+                 date_started=now, date_reported=now)
+        for i in range(600)
+    ])
+    db.add_all([
+        Broadcast(title=f"Broadcast {i}", content="test", severity=rng.choice(['info', 'warning']),
+                  is_active=i % 3 != 0, created_at=now - timedelta(hours=i))
+        for i in range(12)
+    ])
+    await db.commit()
+
+
+async def run() -> dict:
+    directory = tempfile.mkdtemp(prefix="symptomap-test-")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(directory, 'dashboard.db')}")
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with AsyncSession(engine, expire_on_commit=False) as db:
+            await seed(db)
+
+        bundle = await collect_dashboard(engine)
+        # The undecorated handlers, so both read the same scratch database
+        async with AsyncSession(engine) as db:
+            separate = {
+                "stats": await inspect.unwrap(public.get_public_stats)(db=db),
+                "hotspots": await inspect.unwrap(public.get_public_hotspots)(db=db),
+                "broadcasts": await inspect.unwrap(public.get_public_broadcasts)(limit=5, db=db),
+                "grid_stats": await inspect.unwrap(public.get_grid_stats)(db=db),
+            }
+    finally:
+        await engine.dispose()
+        shutil.rmtree(directory, ignore_errors=True)
+    return {"bundle": bundle, "separate": separate}
+
+
+def test_bundle_matches_separate_endpoints():
+    result = asyncio.run(run())
+    bundle, separate = result["bundle"], result["separate"]
+    assert bundle["stats"] == separate["stats"]
+    assert bundle["broadcasts"] == separate["broadcasts"]
+    assert bundle["grid_stats"] == separate["grid_stats"]
+    # Ties in count may be ordered differently by the database
+    assert sorted(h["count"] for h in bundle["hotspots"]) == sorted(h["count"] for h in separate["hotspots"])
+    by_city = {h["city"]: h for h in separate["hotspots"]}
+    assert all(by_city.get(h["city"], h) == h for h in bundle["hotspots"])
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("PUBLIC DASHBOARD BUNDLE")
+    print("=" * 60)
+    result = asyncio.run(run())
+    failed = False
+    for name, expected in result["separate"].items():
+        ok = result["bundle"][name] == expected
+        failed |= not ok
+        print(f"{'✓' if ok else '❌'} {name}")
+        if not ok:
+            print(f"   bundle:   {result['bundle'][name]}")
+            print(f"   endpoint: {expected}")
+    if failed:
+        sys.exit(1)
+    print("\n✅ Bundle matches the separate endpoints")
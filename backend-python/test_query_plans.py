@@ -0,0 +1,215 @@
+"""
+Query plan regression suite
+Runs EXPLAIN QUERY PLAN on the hot-path queries against an empty SQLite
+schema and fails if any of them falls back to a full table scan. The
+schema is checked twice: as create_all() builds it from the models, and
+as the index migrations leave it, so the two can't drift.
+
+Usage:
+    python test_query_plans.py            # print the plans, exit 1 on a scan
+Also collected by pytest.
+"""
+
+import importlib.util
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from sqlalchemy import create_engine, inspect
+
+from app.core.database import Base
+import app.models  # noqa: F401 - registers every table on Base.metadata
+
+VERSIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'alembic', 'versions')
+
+# Index migrations in revision order; each lists INDEXES (and optionally REPLACED)
+MIGRATIONS = ['e5a9c3f7d1b2_hot_path_indexes.py', 'f2b8d4e6a0c3_outbreak_keyset_index.py']
+
+# name -> (sql, params); each mirrors the query issued by the named call site
+HOT_QUERIES = {
+    'outbreaks listing (outbreaks._get_outbreaks)': (
+        "SELECT outbreaks.id FROM outbreaks JOIN hospitals ON outbreaks.hospital_id = hospitals.id "
+        "WHERE outbreaks.date_reported >= ? ORDER BY outbreaks.date_reported DESC, outbreaks.id DESC LIMIT 100",
+        ('2026-01-01',)
+    ),
+    'outbreaks newest first (outbreaks._get_outbreaks)': (
+        "SELECT outbreaks.id FROM outbreaks JOIN hospitals ON outbreaks.hospital_id = hospitals.id "
+        "ORDER BY outbreaks.date_reported DESC, outbreaks.id DESC LIMIT 100", ()
+    ),
+    'outbreaks keyset page (outbreaks._get_outbreaks cursor)': (
+        "SELECT outbreaks.id FROM outbreaks JOIN hospitals ON outbreaks.hospital_id = hospitals.id "
+        "WHERE outbreaks.date_reported IS NOT NULL AND (outbreaks.date_reported, outbreaks.id) < (?, ?) "
+        "ORDER BY outbreaks.date_reported DESC, outbreaks.id DESC LIMIT 100",
+        ('2026-01-01 00:00:00', '7f3c2a4e-0000-4000-8000-000000000000')
+    ),
+    'week comparison (analytics.week-comparison)': (
+        "SELECT COALESCE(SUM(outbreak_count), 0), COALESCE(SUM(case_count), 0) FROM outbreak_daily_rollup "
+        "WHERE day >= ? AND day < ?",
+        ('2026-01-01', '2026-01-08')
+    ),
+    'trend (analytics.trend-data)': (
+        "SELECT day, SUM(outbreak_count), SUM(case_count) FROM outbreak_daily_rollup "
+        "WHERE day != '' GROUP BY day ORDER BY day DESC LIMIT 30",
+        ()
+    ),
+    'state totals (alert_generator)': (
+        "SELECT hospitals.state, sum(outbreaks.patient_count), count(outbreaks.id), max(outbreaks.severity) "
+        "FROM outbreaks JOIN hospitals ON outbreaks.hospital_id = hospitals.id "
+        "WHERE outbreaks.date_reported >= ? GROUP BY hospitals.state",
+        ('2026-01-01',)
+    ),
+    'alert dedupe (alert_generator)': (
+        "SELECT id FROM alerts WHERE alert_type = ? AND zone_name = ? AND sent_at >= ?",
+        ('HIGH_CASES', 'Maharashtra', '2026-01-01')
+    ),
+    'top regions (stats.dashboard)': (
+        "SELECT hospitals.state, count(outbreaks.id) AS outbreak_count "
+        "FROM hospitals JOIN outbreaks ON hospitals.id = outbreaks.hospital_id "
+        "GROUP BY hospitals.state ORDER BY outbreak_count DESC LIMIT 10",
+        ()
+    ),
+    'hotspots (public.hotspots)': (
+        "SELECT hospitals.city, count(outbreaks.id) AS count, max(outbreaks.severity) "
+        "FROM hospitals JOIN outbreaks ON hospitals.id = outbreaks.hospital_id "
+        "GROUP BY hospitals.city ORDER BY count DESC LIMIT 5",
+        ()
+    ),
+    'hospitals by state (hospitals.list)': ("SELECT id FROM hospitals WHERE state = ?", ('Delhi',)),
+    'hospitals by city (hospitals.list)': ("SELECT id FROM hospitals WHERE city = ?", ('Pune',)),
+    'hospital counts per state (hospitals.states)': (
+        "SELECT state, count(id) FROM hospitals GROUP BY state", ()
+    ),
+    'approved submissions (public_outbreaks.all, export)': (
+        "SELECT id, disease_type, patient_count FROM doctor_outbreaks "
+        "WHERE status = 'approved' ORDER BY created_at DESC",
+        ()
+    ),
+    'approved totals (stats_snapshot)': (
+        "SELECT COUNT(*), COUNT(*) FILTER (WHERE severity = 'severe'), SUM(patient_count), "
+        "COUNT(DISTINCT location_name), COUNT(DISTINCT state) FROM doctor_outbreaks WHERE status = 'approved'", ()
+    ),
+    'pending count (public_outbreaks.pending-count)': (
+        "SELECT COUNT(*) FROM doctor_outbreaks WHERE status = 'pending' OR status IS NULL", ()
+    ),
+}
+
+
+# Newest-first listings page through the index in order; a sort step here
+# would make every page read the whole filtered range
+ORDERED_QUERIES = [
+    'outbreaks newest first (outbreaks._get_outbreaks)',
+    'outbreaks keyset page (outbreaks._get_outbreaks cursor)',
+]
+
+
+def load_migrations() -> list:
+    modules = []
+    for filename in MIGRATIONS:
+        spec = importlib.util.spec_from_file_location(filename[:-3], os.path.join(VERSIONS_DIR, filename))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        modules.append(module)
+    return modules
+
+
+def model_schema():
+    """Fresh in-memory database built by create_all()"""
+    engine = create_engine('sqlite://')
+    Base.metadata.create_all(engine)
+    return engine
+
+
+def migrated_schema(downgrade: bool = False):
+    """Database without the migrated indexes, then upgraded (and optionally downgraded) by the migrations"""
+    migrations = load_migrations()
+    engine = model_schema()
+    with engine.begin() as conn:
+        for migration in migrations:
+            for name, _table, _columns in migration.INDEXES + getattr(migration, 'REPLACED', []):
+                conn.exec_driver_sql(f"DROP INDEX IF EXISTS {name}")
+        with Operations.context(MigrationContext.configure(conn)):
+            for migration in migrations:
+                migration.upgrade()
+            if downgrade:
+                for migration in reversed(migrations):
+                    migration.downgrade()
+    return engine
+
+
+def index_set(engine) -> dict:
+    """index name -> (table, columns)"""
+    inspector = inspect(engine)
+    return {
+        index['name']: (table, index['column_names'])
+        for table in inspector.get_table_names()
+        for index in inspector.get_indexes(table)
+    }
+
+
+def query_plans(engine) -> dict:
+    """name -> list of EXPLAIN QUERY PLAN detail lines"""
+    with engine.connect() as conn:
+        return {
+            name: [row[3] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}", params)]
+            for name, (sql, params) in HOT_QUERIES.items()
+        }
+
+
+def full_scans(plans: dict) -> dict:
+    """name -> plan lines that read a whole table rather than an index"""
+    scans = {}
+    for name, details in plans.items():
+        bad = [d for d in details if d.startswith('SCAN ') and 'USING' not in d]
+        if bad:
+            scans[name] = bad
+    return scans
+
+
+def test_models_avoid_full_scans():
+    scans = full_scans(query_plans(model_schema()))
+    assert not scans, f"full table scans: {scans}"
+
+
+def test_migration_avoids_full_scans():
+    scans = full_scans(query_plans(migrated_schema()))
+    assert not scans, f"full table scans: {scans}"
+
+
+def test_migration_matches_models():
+    assert index_set(migrated_schema()) == index_set(model_schema())
+
+
+def test_listings_read_in_index_order():
+    plans = query_plans(model_schema())
+    for name in ORDERED_QUERIES:
+        assert not [d for d in plans[name] if 'TEMP B-TREE' in d], f"{name} sorts: {plans[name]}"
+
+
+def test_downgrade_regresses_to_scans():
+    # Guards the check itself: without the indexes the hot queries must scan
+    assert full_scans(query_plans(migrated_schema(downgrade=True)))
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("QUERY PLAN REGRESSION SUITE")
+    print("=" * 60)
+
+    failed = False
+    for label, engine in (('models', model_schema()), ('migration', migrated_schema())):
+        plans = query_plans(engine)
+        scans = full_scans(plans)
+        print(f"\n[{label}]")
+        for name, details in plans.items():
+            print(f"{'❌' if name in scans else '✓'} {name}")
+            for detail in details:
+                print(f"    {detail}")
+        failed = failed or bool(scans)
+
+    if failed:
+        print("\n❌ Hot-path queries regressed to full table scans")
+        sys.exit(1)
+    print("\n✅ Every hot-path query uses an index")
@@ -0,0 +1,190 @@
+"""
+Response cache behaviour test
+Drives cache_response-decorated handlers directly and checks request-aware
+keys, single-flight coalescing of concurrent misses, stale-while-revalidate,
+the promotion of Redis hits into the in-process tier, tag invalidation and
+data-version keyed entries.
+
+Usage:
+    python test_response_cache.py
+Also collected by pytest.
+"""
+
+import asyncio
+import os
+import sys
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from starlette.requests import Request
+
+from app.core.cache import cache_response, response_cache, invalidate_tags, region_tag
+from app.core.data_version import bump_data_version, rotate_data_epoch
+
+
+def make_request(path: str, query: str = "") -> Request:
+    return Request({"type": "http", "method": "GET", "path": path,
+                    "query_string": query.encode(), "headers": []})
+
+
+async def run() -> dict:
+    calls = {"slow": 0, "swr": 0}
+    # Fresh paths per run: the cache (and MockRedis) outlive a run
+    prefix = f"/{uuid.uuid4().hex}"
+
+    @cache_response(ttl_seconds=60)
+    async def slow_endpoint(limit: int = 5):
+        calls["slow"] += 1
+        await asyncio.sleep(0.05)
+        return {"limit": limit, "call": calls["slow"]}
+
+    @cache_response(ttl_seconds=0, stale_seconds=60)
+    async def swr_endpoint():
+        calls["swr"] += 1
+        return {"call": calls["swr"]}
+
+    # 25 concurrent cold requests -> one computation
+    results = await asyncio.gather(*[
+        slow_endpoint(limit=5, cache_request=make_request(f"{prefix}/slow", "limit=5&_=%d" % i)) for i in range(25)
+    ])
+    coalesced = {"computations": calls["slow"], "identical": all(r == results[0] for r in results)}
+
+    # Different parameters -> different entry
+    other = await slow_endpoint(limit=9, cache_request=make_request(f"{prefix}/slow", "limit=9"))
+
+    # Stale entries are served while one background refresh replaces them
+    swr = [await swr_endpoint(cache_request=make_request(f"{prefix}/swr"))]
+    swr.append(await swr_endpoint(cache_request=make_request(f"{prefix}/swr")))
+    await asyncio.sleep(0.05)
+    swr.append(await swr_endpoint(cache_request=make_request(f"{prefix}/swr")))
+
+    # An entry only in Redis is promoted to memory
+    response_cache._memory.clear()
+    before = calls["slow"]
+    from_redis = await slow_endpoint(limit=5, cache_request=make_request(f"{prefix}/slow", "limit=5"))
+    stats = response_cache.stats()["routes"]["slow_endpoint"]
+
+    return {
+        "coalesced": coalesced,
+        "other_limit": other["limit"],
+        "swr_calls": [r["call"] for r in swr],
+        "redis_hit": from_redis == results[0] and calls["slow"] == before,
+        "stats": stats,
+    }
+
+
+async def run_tags() -> dict:
+    calls = {"stats": 0, "regional": 0, "racing": 0}
+    prefix = f"/{uuid.uuid4().hex}"
+    outbreaks, broadcasts = f"outbreaks-{prefix}", f"broadcasts-{prefix}"
+
+    @cache_response(ttl_seconds=3600, tags=[outbreaks])
+    async def stats_endpoint():
+        calls["stats"] += 1
+        return {"call": calls["stats"]}
+
+    @cache_response(ttl_seconds=3600, tags=[broadcasts, "region:{state}"])
+    async def regional_endpoint(state: str):
+        calls["regional"] += 1
+        return {"state": state, "call": calls["regional"]}
+
+    @cache_response(ttl_seconds=3600, tags=[outbreaks])
+    async def racing_endpoint():
+        calls["racing"] += 1
+        await asyncio.sleep(0.05)
+        return {"call": calls["racing"]}
+
+    async def fetch_all():
+        return (
+            (await stats_endpoint(cache_request=make_request(f"{prefix}/stats")))["call"],
+            (await regional_endpoint(state="Kerala", cache_request=make_request(f"{prefix}/r", "state=Kerala")))["call"],
+            (await regional_endpoint(state="Goa", cache_request=make_request(f"{prefix}/r", "state=Goa")))["call"],
+        )
+
+    first = await fetch_all()
+    await invalidate_tags(outbreaks)                   # stats only
+    after_outbreaks = await fetch_all()
+    await invalidate_tags(region_tag("Kerala"), None)  # one region only
+    after_region = await fetch_all()
+
+    # A write landing mid-computation keeps that result out of the cache
+    racing = asyncio.create_task(racing_endpoint(cache_request=make_request(f"{prefix}/race")))
+    await asyncio.sleep(0.01)
+    await invalidate_tags(outbreaks)
+    await racing
+    await racing_endpoint(cache_request=make_request(f"{prefix}/race"))
+
+    return {"first": first, "after_outbreaks": after_outbreaks, "after_region": after_region,
+            "racing_calls": calls["racing"]}
+
+
+async def run_versions() -> list:
+    """Bulk writers bump versions or rotate the epoch without purging tags"""
+    calls = {"stats": 0}
+    prefix = f"/{uuid.uuid4().hex}"
+    table = f"outbreaks-{prefix}"
+
+    @cache_response(ttl_seconds=3600, tables=[table])
+    async def versioned_endpoint():
+        calls["stats"] += 1
+        return {"call": calls["stats"]}
+
+    async def fetch():
+        return (await versioned_endpoint(cache_request=make_request(f"{prefix}/stats")))["call"]
+
+    seen = [await fetch(), await fetch()]
+    await bump_data_version(table)
+    seen.append(await fetch())
+    await rotate_data_epoch()
+    seen.append(await fetch())
+    seen.append(await fetch())
+    return seen
+
+
+def test_version_bump_or_epoch_rotation_misses_without_purge():
+    assert asyncio.run(run_versions()) == [1, 1, 2, 3, 3]
+
+
+def test_tag_invalidation_purges_only_tagged_entries():
+    result = asyncio.run(run_tags())
+    assert result["first"] == (1, 1, 2)
+    assert result["after_outbreaks"] == (2, 1, 2)
+    assert result["after_region"] == (2, 3, 2)
+    assert result["racing_calls"] == 2
+
+
+def test_concurrent_misses_are_coalesced():
+    result = asyncio.run(run())
+    assert result["coalesced"] == {"computations": 1, "identical": True}
+    assert result["other_limit"] == 9
+
+
+def test_stale_while_revalidate_and_redis_tier():
+    result = asyncio.run(run())
+    assert result["swr_calls"] == [1, 1, 2]
+    assert result["redis_hit"]
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("RESPONSE CACHE")
+    print("=" * 60)
+    result = asyncio.run(run())
+    checks = {
+        "25 concurrent misses -> 1 computation": result["coalesced"] == {"computations": 1, "identical": True},
+        "parameters select the entry": result["other_limit"] == 9,
+        "stale served, refreshed in background": result["swr_calls"] == [1, 1, 2],
+        "Redis hit promoted to memory": result["redis_hit"],
+    }
+    tagged = asyncio.run(run_tags())
+    checks["outbreak purge leaves other entries"] = tagged["after_outbreaks"] == (2, 1, 2)
+    checks["region purge hits one region"] = tagged["after_region"] == (2, 3, 2)
+    checks["purge during computation skips the store"] = tagged["racing_calls"] == 2
+    checks["version bump / epoch rotation miss without a purge"] = asyncio.run(run_versions()) == [1, 1, 2, 3, 3]
+    for name, ok in checks.items():
+        print(f"{'✓' if ok else '❌'} {name}")
+    print(f"\nstats: {result['stats']}")
+    if not all(checks.values()):
+        sys.exit(1)
+    print("\n✅ Response cache behaves")
@@ -0,0 +1,165 @@
+"""
+SEIR regression suite
+Pins the outputs of every SEIR call site (predictions.SEIRModel,
+EnhancedSEIRModel, simulate_regions/ensemble/metapopulation and
+model_validation) against tests/seir_regression_golden.json, so kernel
+optimizations can't silently change forecasts.
+
+Usage:
+    python test_seir_regression.py            # compare against the golden file
+    python test_seir_regression.py --update   # re-pin after an intended change
+Also collected by pytest.
+"""
+
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.api.v1.predictions import SEIRModel
+from app.api.v1.predictions_enhanced import (
+    EnhancedSEIRModel, INDIA_STATES, simulate_regions, simulate_ensemble, simulate_metapopulation
+)
+from app.api.v1.model_validation import (
+    run_seir_simulation, cross_validate_model, compare_models, simulate_peak_infected
+)
+from app.api.v1.training_data import get_training_store, get_parameter_spread
+
+GOLDEN_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tests', 'seir_regression_golden.json')
+
+# (population, initial_infected, beta, sigma, gamma, days)
+CASES = [
+    (1000000, 100, 0.5, 0.2, 0.1, 30),
+    (50000000, 150, 0.45, 0.2, 0.1, 90),
+    (10000000, 1000, 0.9, 0.25, 0.05, 60),
+    (500000, 5, 0.2, 0.15, 0.3, 45),
+]
+
+
+def columns(records, drop=('date',)):
+    """List of daily dicts -> dict of columns (compact and diff-friendly)"""
+    keys = [k for k in records[0] if k not in drop]
+    return {k: [r[k] for r in records] for k in keys}
+
+
+def collect() -> dict:
+    """Current outputs of every call site"""
+    out = {'seir_model': [], 'enhanced_euler': [], 'enhanced_rk4': [], 'validation_simulation': []}
+    for population, infected, beta, sigma, gamma, days in CASES:
+        out['seir_model'].append(columns(SEIRModel(population, infected, beta, sigma, gamma).simulate(days)))
+        model = EnhancedSEIRModel(population, infected, beta, sigma, gamma, intervention_factor=0.85)
+        out['enhanced_euler'].append(columns(model.simulate(days, method='euler')))
+        out['enhanced_rk4'].append(columns(model.simulate(days, method='rk4')))
+        out['validation_simulation'].append(
+            columns(run_seir_simulation(population, infected, beta, sigma, gamma, days))
+        )
+
+    states = list(INDIA_STATES.values())
+    for method in ('euler', 'rk4'):
+        regions = simulate_regions(
+            [s['population'] for s in states], [1000] * len(states),
+            [0.4 * s['risk_factor'] for s in states], 0.2, 0.1, 30, method=method
+        )
+        out[f'regions_{method}'] = {
+            'peak_day': regions['peak_day'].tolist(),
+            'peak_cases': regions['peak_cases'].tolist(),
+            'r0': regions['r0'].tolist()
+        }
+
+    for method in ('euler', 'rk4'):
+        spatial = simulate_metapopulation({'Maharashtra': 80, 'Delhi': 70}, 0.4, 0.25, 0.14, 60, method=method)
+        out[f'metapopulation_{method}'] = {
+            'peak_day': spatial['peak_day'].tolist(),
+            'peak_cases': spatial['peak_cases'].tolist(),
+            'day_30': spatial['trajectory'][30].astype(int).tolist()
+        }
+
+    model = EnhancedSEIRModel(50000000, 150, beta=0.45, sigma=0.2, gamma=0.1, intervention_factor=0.85)
+    out['ensemble'] = simulate_ensemble(model, 30, 200, get_parameter_spread('Dengue'))
+
+    # Both simulate_peak_infected paths: per-run and batched
+    for runs in (5, 40):
+        args = (
+            [10 + 37 * i for i in range(runs)],
+            [0.1 + 0.02 * i for i in range(runs)],
+            [0.2] * runs,
+            [0.05 + 0.01 * i for i in range(runs)],
+            [20 + 2 * i for i in range(runs)],
+        )
+        out[f'peak_infected_{runs}'] = simulate_peak_infected(*args)
+
+    out['cross_validation'] = {
+        f'{disease}/{k}': cross_validate_model(disease, k)
+        for disease in get_training_store().diseases for k in (3, 5)
+    }
+    out['compare_models'] = {
+        disease: compare_models(disease)['models'] for disease in ('Dengue', 'COVID-19', 'Unknown')
+    }
+    return out
+
+
+def load_golden() -> dict:
+    with open(GOLDEN_PATH) as f:
+        return json.load(f)
+
+
+def _check(name: str):
+    expected = load_golden()[name]
+    actual = json.loads(json.dumps(collect()[name]))
+    assert actual == expected, f"{name} drifted from the pinned outputs"
+
+
+def test_seir_model():
+    _check('seir_model')
+
+
+def test_enhanced_model():
+    _check('enhanced_euler')
+    _check('enhanced_rk4')
+
+
+def test_validation_simulation():
+    _check('validation_simulation')
+    _check('peak_infected_5')
+    _check('peak_infected_40')
+
+
+def test_regions_and_ensemble():
+    _check('regions_euler')
+    _check('regions_rk4')
+    _check('ensemble')
+
+
+def test_metapopulation():
+    _check('metapopulation_euler')
+    _check('metapopulation_rk4')
+
+
+def test_validation_metrics():
+    _check('cross_validation')
+    _check('compare_models')
+
+
+if __name__ == '__main__':
+    if '--update' in sys.argv:
+        with open(GOLDEN_PATH, 'w') as f:
+            json.dump(collect(), f, separators=(',', ':'), sort_keys=True)
+        print(f"✅ Pinned SEIR outputs to {GOLDEN_PATH}")
+        sys.exit(0)
+
+    print("=" * 60)
+    print("SEIR REGRESSION SUITE")
+    print("=" * 60)
+
+    golden = load_golden()
+    current = json.loads(json.dumps(collect()))
+    failed = [name for name in golden if current.get(name) != golden[name]]
+
+    for name in golden:
+        print(f"{'❌' if name in failed else '✓'} {name}")
+
+    if failed:
+        print(f"\n❌ {len(failed)} call site(s) drifted: {', '.join(failed)}")
+        sys.exit(1)
+    print("\n✅ All SEIR outputs match the pinned values")
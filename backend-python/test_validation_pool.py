@@ -0,0 +1,82 @@
+"""
+Validation pool test
+Runs cross-validation on the worker pool and checks that workers are not
+forked from the server, that their results match an in-process run, and
+that reloading the training data recycles the pool so workers compute on
+the new records rather than the ones they started with.
+
+Usage:
+    python test_validation_pool.py
+Also collected by pytest.
+"""
+
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.core.config import settings
+from app.api.v1 import model_validation
+from app.api.v1.training_data import HISTORICAL_OUTBREAKS, get_training_store, reload_training_data
+
+DISEASE = "Dengue"
+
+
+async def run() -> dict:
+    original_workers = settings.VALIDATION_WORKERS
+    settings.VALIDATION_WORKERS = 1
+    model_validation.shutdown_validation_pool()
+    model_validation._cv_cache.clear()
+    try:
+        pooled = await model_validation.cross_validate_model_async(DISEASE, 3)
+        pool = model_validation._get_validation_pool()
+        start_method = pool._mp_context.get_start_method()
+
+        # Drop every other Dengue record: a stale worker would still see all of them
+        dengue = [r for r in HISTORICAL_OUTBREAKS if r["disease"] == DISEASE]
+        reload_training_data([r for r in HISTORICAL_OUTBREAKS if r["disease"] != DISEASE] + dengue[::2])
+        reloaded = await model_validation.cross_validate_model_async(DISEASE, 3)
+        recycled = model_validation._get_validation_pool() is not pool
+        in_process = model_validation.cross_validate_model(DISEASE, 3)
+        points = len(get_training_store().records_for(DISEASE))
+    finally:
+        model_validation.shutdown_validation_pool()
+        settings.VALIDATION_WORKERS = original_workers
+        reload_training_data()
+        model_validation._cv_cache.clear()
+    return {
+        "start_method": start_method,
+        "before": pooled,
+        "after": reloaded,
+        "in_process": in_process,
+        "recycled": recycled,
+        "points": (len(dengue), points),
+    }
+
+
+def test_pool_does_not_fork_and_tracks_reloads():
+    result = asyncio.run(run())
+    assert result["start_method"] in ("forkserver", "spawn")
+    assert result["recycled"]
+    assert result["points"][1] < result["points"][0]
+    assert result["after"] == result["in_process"]
+    assert result["after"] != result["before"]
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("VALIDATION POOL")
+    print("=" * 60)
+    result = asyncio.run(run())
+    checks = [
+        (result["start_method"] in ("forkserver", "spawn"), f"workers started with {result['start_method']}"),
+        (result["recycled"], "pool recycled after reload_training_data"),
+        (result["after"] == result["in_process"] and result["after"] != result["before"],
+         "pooled result after reload matches an in-process run on the new data"),
+    ]
+    for ok, label in checks:
+        print(f"{'✓' if ok else '❌'} {label}")
+    if not all(ok for ok, _ in checks):
+        sys.exit(1)
+    print("\n✅ Validation pool follows the training data")